@@ -0,0 +1,280 @@
+#!/usr/bin/env python3
+"""
+Streaming analytics for Rock Paper Scissors Game
+Per-player gesture distribution, transition matrix, reaction time and
+confidence metrics maintained online from game events in bounded memory,
+plus count-min sketches for population-wide counters
+"""
+
+import argparse
+import json
+import os
+import threading
+import zlib
+from collections import OrderedDict
+
+import numpy as np
+
+from game_events import RoundCommitted, MatchWon, Reset
+
+GESTURES = ("rock", "paper", "scissors")
+GESTURE_INDEX = {gesture: i for i, gesture in enumerate(GESTURES)}
+
+
+class RunningStats:
+    """Welford's online mean/variance with min and max"""
+    __slots__ = ("count", "mean", "m2", "min", "max")
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = float("inf")
+        self.max = float("-inf")
+
+    def update(self, value):
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+    @property
+    def std(self):
+        return (self.m2 / (self.count - 1)) ** 0.5 if self.count > 1 else 0.0
+
+    def to_dict(self):
+        if not self.count:
+            return {"count": 0}
+        return {"count": self.count, "mean": self.mean, "std": self.std, "min": self.min, "max": self.max}
+
+
+class Histogram:
+    """Fixed-bin histogram; values past the last edge land in the last bin"""
+    __slots__ = ("edges", "counts")
+
+    def __init__(self, low, high, bins):
+        self.edges = np.linspace(low, high, bins + 1)
+        self.counts = np.zeros(bins, dtype=np.int64)
+
+    def update(self, value):
+        index = int(np.searchsorted(self.edges, value, side="right")) - 1
+        self.counts[min(max(index, 0), len(self.counts) - 1)] += 1
+
+    def quantile(self, q):
+        """Approximate quantile, interpolated within the bin that holds it"""
+        total = self.counts.sum()
+        if not total:
+            return None
+        cumulative = np.cumsum(self.counts)
+        index = int(np.searchsorted(cumulative, q * total))
+        before = cumulative[index - 1] if index else 0
+        fraction = (q * total - before) / self.counts[index]
+        return float(self.edges[index] + fraction * (self.edges[index + 1] - self.edges[index]))
+
+    def to_dict(self):
+        return {"edges": self.edges.tolist(), "counts": self.counts.tolist()}
+
+
+class CountMinSketch:
+    """Approximate per-key counters in width x depth fixed memory"""
+
+    # Large prime for the row hash family (a * h + b) % PRIME % width
+    PRIME = (1 << 61) - 1
+
+    def __init__(self, width=8192, depth=4, seed=0):
+        rng = np.random.default_rng(seed)
+        self.width = width
+        self.table = np.zeros((depth, width), dtype=np.int64)
+        self.hash_a = [int(a) for a in rng.integers(1, 1 << 31, depth)]
+        self.hash_b = [int(b) for b in rng.integers(0, 1 << 31, depth)]
+        self.rows = np.arange(depth)
+
+    def _columns(self, key):
+        # crc32 is stable across processes, unlike hash() on strings
+        h = zlib.crc32(str(key).encode())
+        return [(a * h + b) % self.PRIME % self.width for a, b in zip(self.hash_a, self.hash_b)]
+
+    def add(self, key, count=1):
+        self.table[self.rows, self._columns(key)] += count
+
+    def estimate(self, key):
+        """Never underestimates; overestimates by at most ~2N/width with high probability"""
+        return int(self.table[self.rows, self._columns(key)].min())
+
+    def merge(self, other):
+        """Fold in a sketch built with the same width, depth and seed"""
+        self.table += other.table
+
+
+class PlayerProfile:
+    """Everything tracked about one player, updated one round at a time"""
+
+    def __init__(self, player_id):
+        self.player_id = player_id
+        self.gesture_counts = np.zeros(len(GESTURES), dtype=np.int64)
+        self.transitions = np.zeros((len(GESTURES), len(GESTURES)), dtype=np.int64)
+        self.results = {"player": 0, "computer": 0, "tie": 0}
+        self.matches = {"player": 0, "computer": 0}
+        self.forfeits = 0
+        self.reaction = RunningStats()
+        self.reaction_histogram = Histogram(0.0, 10.0, 40)
+        self.confidence = RunningStats()
+        self.confidence_histogram = Histogram(0.0, 1.0, 10)
+        self.last_gesture = None
+        self.revision = 0
+
+    def record_round(self, gesture, winner, confidence, reaction_time):
+        self.results[winner] += 1
+        if gesture is None:
+            self.forfeits += 1
+        else:
+            index = GESTURE_INDEX[gesture]
+            self.gesture_counts[index] += 1
+            if self.last_gesture is not None:
+                self.transitions[self.last_gesture, index] += 1
+            self.last_gesture = index
+            self.confidence.update(confidence)
+            self.confidence_histogram.update(confidence)
+        if reaction_time is not None:
+            self.reaction.update(reaction_time)
+            self.reaction_histogram.update(reaction_time)
+        self.revision += 1
+
+    def distribution(self):
+        """Share of each gesture among committed rounds"""
+        total = self.gesture_counts.sum()
+        return {gesture: float(count / total) if total else 0.0
+                for gesture, count in zip(GESTURES, self.gesture_counts)}
+
+    def likely_next(self):
+        """Most frequent follow-up to the last gesture, or None without data"""
+        if self.last_gesture is None or not self.transitions[self.last_gesture].any():
+            return None
+        return GESTURES[int(self.transitions[self.last_gesture].argmax())]
+
+    def to_dict(self):
+        return {
+            "player": self.player_id,
+            "rounds": sum(self.results.values()),
+            "results": dict(self.results),
+            "matches": dict(self.matches),
+            "forfeits": self.forfeits,
+            "distribution": self.distribution(),
+            "transitions": self.transitions.tolist(),
+            "likely_next": self.likely_next(),
+            "reaction_time": {**self.reaction.to_dict(),
+                              "p50": self.reaction_histogram.quantile(0.5),
+                              "p90": self.reaction_histogram.quantile(0.9)},
+            "confidence": {**self.confidence.to_dict(),
+                           "histogram": self.confidence_histogram.counts.tolist()}
+        }
+
+
+class GameAnalytics:
+    """Event-bus subscriber keeping profiles for recent players and sketches for all of them"""
+
+    def __init__(self, max_profiles=1024, export_path=None):
+        self.max_profiles = max_profiles
+        self.export_path = export_path
+        self.profiles = OrderedDict()
+        self.rounds_sketch = CountMinSketch()
+        self.wins_sketch = CountMinSketch()
+        self.total_rounds = 0
+        self.evicted = 0
+        self.lock = threading.Lock()
+
+    def profile(self, player_id):
+        """The player's profile, least recently used ones are evicted past max_profiles"""
+        with self.lock:
+            profile = self.profiles.get(player_id)
+            if profile is None:
+                profile = self.profiles[player_id] = PlayerProfile(player_id)
+                if len(self.profiles) > self.max_profiles:
+                    self.profiles.popitem(last=False)
+                    self.evicted += 1
+            else:
+                self.profiles.move_to_end(player_id)
+            return profile
+
+    def record(self, player_id, event):
+        """Fold one game event for a player into the metrics"""
+        profile = self.profile(player_id)
+        with self.lock:
+            if isinstance(event, RoundCommitted):
+                profile.record_round(event.player_gesture, event.winner, event.confidence, event.reaction_time)
+                self.rounds_sketch.add(player_id)
+                if event.winner == "player":
+                    self.wins_sketch.add(player_id)
+                self.total_rounds += 1
+            elif isinstance(event, MatchWon):
+                profile.matches[event.winner] += 1
+                profile.revision += 1
+            elif isinstance(event, Reset):
+                profile.last_gesture = None
+        if self.export_path and isinstance(event, (RoundCommitted, MatchWon)):
+            self.export(self.export_path)
+
+    def feed(self, player_id="player"):
+        """A subscriber that attributes a game's events to player_id"""
+        return lambda event: self.record(player_id, event)
+
+    def __call__(self, event):
+        self.record("player", event)
+
+    def population(self, player_id):
+        """Approximate rounds and wins for any player ever seen, evicted or not"""
+        return self.rounds_sketch.estimate(player_id), self.wins_sketch.estimate(player_id)
+
+    def snapshot(self):
+        """Current metrics as a JSON-friendly dict"""
+        with self.lock:
+            return {
+                "total_rounds": self.total_rounds,
+                "tracked_players": len(self.profiles),
+                "evicted_players": self.evicted,
+                "players": [profile.to_dict() for profile in self.profiles.values()]
+            }
+
+    def export(self, path):
+        """Atomically replace path with the current snapshot"""
+        temp_path = f"{path}.tmp"
+        with open(temp_path, "w") as f:
+            json.dump(self.snapshot(), f, indent=2)
+        os.replace(temp_path, path)
+
+
+EVENT_TYPES = {cls.__name__: cls for cls in (RoundCommitted, MatchWon, Reset)}
+
+
+def load_history(path, analytics, player_id="player"):
+    """Feed a JSON-lines history written by HistoryWriter into analytics"""
+    with open(path) as f:
+        for line in f:
+            data = json.loads(line)
+            cls = EVENT_TYPES.get(data.pop("event"))
+            if cls is None:
+                continue
+            event = cls.__new__(cls)
+            for name, value in data.items():
+                setattr(event, name, value)
+            if cls is RoundCommitted and "reaction_time" not in data:
+                event.reaction_time = None
+            analytics.record(player_id, event)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Summarize Rock Paper Scissors history files")
+    parser.add_argument("histories", nargs="+", help="JSON-lines files written with enhanced_game.py --history")
+    parser.add_argument("--output", help="Write the snapshot as JSON instead of printing it")
+    args = parser.parse_args()
+
+    analytics = GameAnalytics()
+    for path in args.histories:
+        load_history(path, analytics, os.path.splitext(os.path.basename(path))[0])
+    if args.output:
+        analytics.export(args.output)
+        print(f"💾 Analytics for {analytics.total_rounds} rounds written to {args.output}")
+    else:
+        print(json.dumps(analytics.snapshot(), indent=2))
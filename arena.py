@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+"""
+Arena mode for Rock Paper Scissors Game
+Drives several stations (one camera or video each) from one process, with
+one game state machine per station and a shared inference worker pool
+"""
+
+import argparse
+import math
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+import cv2
+import numpy as np
+
+from camera_capture import open_camera
+from enhanced_game import EnhancedRockPaperScissorsGame
+from game_config import add_config_arguments, load_config, parse_overrides
+from game_events import RoundCommitted
+from metrics import GameMetrics, MetricsRegistry, add_metrics_arguments, create_exporters
+from display_sinks import create_display
+from panel_batch import BatchedPanelRenderer, game_panel_values
+
+# Frames of inference and latency samples kept per station for the reports
+STATS_WINDOW = 1000
+
+
+class Station:
+    """One camera/video source with its own game and pose backend"""
+
+    def __init__(self, index, source, config=None):
+        self.index = index
+        self.source = source
+        self.game = EnhancedRockPaperScissorsGame(use_mediapipe=False, config=config)
+        self.capture = open_camera(source, self.game.capture_settings)
+        # Tracking state is per video stream, so each station keeps its own backend
+        self.backend = self.game.create_pose_backend()
+        self.frame = None
+        self.capture_time = 0.0
+        self.metrics = None  # Optional GameMetrics labelled with the station
+        self.stamps = [0.0] * 4  # perf_counter at read start, read done, inferred, rendered
+        self.hand_landmarks = None
+
+        # Per-station statistics, over a rolling window so a kiosk running for days stays bounded
+        self.frames = 0
+        self.inference_times = deque(maxlen=STATS_WINDOW)
+        self.latencies = deque(maxlen=STATS_WINDOW)
+
+    def read(self):
+        """Grab the next frame; returns False when the source is exhausted"""
+        self.stamps[0] = time.perf_counter()
+        ret, frame = self.capture.read()
+        if not ret:
+            return False
+        self.frame = cv2.flip(frame, 1)
+        self.capture_time = time.time()
+        self.stamps[1] = time.perf_counter()
+        return True
+
+    def infer(self):
+        """Run hand pose inference for this station (called on a pool thread)"""
+        start = time.perf_counter()
+        self.hand_landmarks = self.backend.detect(self.frame)
+        self.stamps[2] = time.perf_counter()
+        self.inference_times.append(self.stamps[2] - start)
+
+    def update(self):
+        """Advance the station's game and draw its UI"""
+        self.game.update_game_state(self.hand_landmarks, self.capture_time)
+        self.game.draw_ui(self.frame, self.hand_landmarks)
+        self.latencies.append(time.time() - self.capture_time)
+        self.frames += 1
+        self.stamps[3] = time.perf_counter()
+
+    def record(self, shown):
+        """Feed this station's metrics once the mosaic is on screen"""
+        if self.metrics:
+            self.metrics.record_frame(*self.stamps, shown, self.hand_landmarks)
+
+    def close(self):
+        self.capture.release()
+        self.backend.close()
+        self.game.events.close()
+
+
+def tile_frames(frames, tile_width=480):
+    """Arrange station frames in a near-square grid"""
+    columns = math.ceil(math.sqrt(len(frames)))
+    rows = math.ceil(len(frames) / columns)
+    height, width = frames[0].shape[:2]
+    tile_height = int(tile_width * height / width)
+
+    mosaic = np.zeros((rows * tile_height, columns * tile_width, 3), dtype=np.uint8)
+    for i, frame in enumerate(frames):
+        row, column = divmod(i, columns)
+        y, x = row * tile_height, column * tile_width
+        mosaic[y:y + tile_height, x:x + tile_width] = cv2.resize(frame, (tile_width, tile_height),
+                                                                 interpolation=cv2.INTER_AREA)
+    return mosaic
+
+
+def print_station_stats(stations, elapsed):
+    """Print FPS and latency per station"""
+    print(f"\n📊 Arena stats after {elapsed:.1f}s (timings over the last {STATS_WINDOW} frames)")
+    for station in stations:
+        if not station.frames:
+            continue
+        inference = sorted(station.inference_times)
+        latency = sorted(station.latencies)
+        print(f"  Station {station.index} ({station.source}): {station.frames / elapsed:.1f} FPS, "
+              f"inference median {inference[len(inference) // 2] * 1000:.1f} ms, "
+              f"capture-to-draw median {latency[len(latency) // 2] * 1000:.1f} ms / "
+              f"p95 {latency[int(len(latency) * 0.95)] * 1000:.1f} ms, "
+              f"rounds {station.game.round_count}")
+
+
+def run_arena(sources, workers=None, display_specs=None, report_interval=10.0, config=None, registry=None):
+    """Run one game per source, batching inference through a shared pool"""
+    stations = []
+    display = None
+    pool = None
+    try:
+        for i, source in enumerate(sources):
+            station = Station(i, source, config)
+            if station.capture.isOpened():
+                stations.append(station)
+            else:
+                print(f"⚠️  Skipping arena source {source}: could not open it")
+                station.close()
+        if not stations:
+            print("Error: Could not open any arena source")
+            return
+        if registry:
+            for station in stations:
+                station.metrics = GameMetrics(registry, {"station": station.index})
+                station.metrics.watch_capture(station.capture)
+                station.game.events.subscribe(station.metrics, (RoundCommitted,))
+
+        display = create_display(display_specs, '🏟️ Rock Paper Scissors Arena')
+        scoreboard = None
+        pool = ThreadPoolExecutor(max_workers=workers or len(stations), thread_name_prefix="arena-inference")
+        print(f"🏟️ Arena started with {len(stations)} stations")
+
+        start_time = time.time()
+        last_report = start_time
+        running = True
+        while running:
+            # Capture one frame per station, then infer them as a batch on the pool
+            active = [station for station in stations if station.read()]
+            if not active:
+                break
+            for future in [pool.submit(station.infer) for station in active]:
+                future.result()
+
+            for station in active:
+                station.update()
+
+            # Mosaic of station views with a batched scoreboard strip underneath
+            mosaic = tile_frames([station.frame for station in stations if station.frame is not None])
+            if scoreboard is None:
+                scoreboard = BatchedPanelRenderer([f"STATION {station.index}" for station in stations],
+                                                  canvas_width=mosaic.shape[1])
+            panels = scoreboard.render(game_panel_values([station.game for station in stations]))
+            display.show(np.vstack([mosaic, panels]))
+            shown = time.perf_counter()
+            for station in active:
+                station.record(shown)
+
+            for event in display.poll_events():
+                if event.key == 'q':
+                    running = False
+                elif event.key == 'r':
+                    for station in stations:
+                        station.game.reset_game()
+
+            if time.time() - last_report > report_interval:
+                print_station_stats(stations, time.time() - start_time)
+                last_report = time.time()
+
+        print_station_stats(stations, time.time() - start_time)
+    finally:
+        # Close every camera, backend and sink even after an error or Ctrl-C
+        if pool:
+            pool.shutdown()
+        if display:
+            display.close()
+        for station in stations:
+            station.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run several Rock Paper Scissors stations from one machine")
+    parser.add_argument("sources", nargs="+", help="Camera indices or video files, one per station")
+    parser.add_argument("--workers", type=int, default=None, help="Inference pool size (default: one per station)")
+    parser.add_argument("--backend", help="Hand pose backend (see pose_backends.py)")
+    parser.add_argument("--display", action="append",
+                        help="Display sink: window, null, video:<path>, shm:<name>, mjpeg:<port> (repeatable)")
+    add_config_arguments(parser)
+    add_metrics_arguments(parser)
+    args = parser.parse_args()
+
+    try:
+        overrides = parse_overrides(args.set)
+        if args.backend:
+            overrides["backend"] = args.backend
+        config = load_config(args.profile, args.config, overrides)
+    except ValueError as e:
+        parser.error(str(e))
+    registry = None
+    exporters = []
+    if args.metrics or args.metrics_log:
+        registry = MetricsRegistry()
+        exporters = create_exporters(registry, args.metrics, args.metrics_log, args.metrics_interval)
+    sources = [int(source) if source.isdigit() else source for source in args.sources]
+    try:
+        run_arena(sources, args.workers, args.display, config=config, registry=registry)
+    except KeyboardInterrupt:
+        print("\n🏟️ Arena interrupted by user")
+    finally:
+        for exporter in exporters:
+            exporter.close()
@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+"""
+Spectator broadcast for Rock Paper Scissors Game
+Serves the composited game frames as an MJPEG stream over local HTTP so a
+second screen can follow the match in any browser
+"""
+
+import argparse
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import cv2
+
+from display_sinks import DisplaySink
+
+# (scale, JPEG quality) steps, from best looking to cheapest
+QUALITY_LEVELS = [(1.0, 80), (0.75, 75), (0.5, 70), (0.5, 50), (0.33, 50)]
+
+BOUNDARY = "rpsframe"
+
+VIEWER_PAGE = b"""<!DOCTYPE html>
+<html><head><title>Rock Paper Scissors</title></head>
+<body style="margin:0;background:#000"><img src="/stream.mjpg" style="width:100vw;height:100vh;object-fit:contain"></body>
+</html>
+"""
+
+
+class MjpegBroadcastSink(DisplaySink):
+    """Encodes frames to JPEG on its own thread and streams them to HTTP clients
+
+    Nothing is encoded while nobody is watching.  With viewers connected the
+    encoder steps down resolution and quality whenever its CPU share or the
+    game loop's frame interval goes over budget, and back up when there is room.
+    """
+
+    def __init__(self, host="127.0.0.1", port=8080, max_fps=15.0, max_duty=0.2):
+        self.max_fps = max_fps
+        self.max_duty = max_duty  # Fraction of wall time the encoder may use
+        self.level = 0
+        self.last_level_change = 0.0
+
+        self.condition = threading.Condition()
+        self.frame = None
+        self.frame_sequence = 0
+        self.jpeg = None
+        self.jpeg_sequence = 0
+        self.clients = 0
+        self.closed = False
+
+        # Frame loop timing, measured from show() calls
+        self.last_show = None
+        self.loop_interval = None
+        self.idle_interval = None  # Loop interval while nobody watches
+
+        self.encoded_frames = 0
+        self.skipped_frames = 0
+        self.encode_time = 0.0
+        self.viewers_served = 0
+
+        self.server = ThreadingHTTPServer((host, port), self._make_handler())
+        self.server.daemon_threads = True
+        self.server_thread = threading.Thread(target=self.server.serve_forever, name="mjpeg-http", daemon=True)
+        self.server_thread.start()
+        self.encoder_thread = threading.Thread(target=self._encode_loop, name="mjpeg-encoder", daemon=True)
+        self.encoder_thread.start()
+        print(f"📡 Broadcasting on http://{host}:{self.server.server_address[1]}/")
+
+    def show(self, frame):
+        now = time.perf_counter()
+        if self.last_show is not None:
+            interval = now - self.last_show
+            self.loop_interval = interval if self.loop_interval is None else 0.9 * self.loop_interval + 0.1 * interval
+            if not self.clients:
+                self.idle_interval = self.loop_interval
+        self.last_show = now
+
+        if not self.clients:
+            self.skipped_frames += 1
+            return
+        # Frames are not modified after show(), so keeping a reference is enough
+        with self.condition:
+            self.frame = frame
+            self.frame_sequence += 1
+            self.condition.notify_all()
+
+    def _encode_loop(self):
+        """Encode the newest frame at up to max_fps while clients are connected"""
+        encoded_sequence = 0
+        next_encode = 0.0
+        while True:
+            with self.condition:
+                while not self.closed and (self.frame_sequence == encoded_sequence or not self.clients):
+                    self.condition.wait()
+                if self.closed:
+                    return
+
+            # Pace to max_fps, then take whichever frame is newest by then
+            delay = next_encode - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            with self.condition:
+                frame, encoded_sequence = self.frame, self.frame_sequence
+            start = time.perf_counter()
+            scale, quality = QUALITY_LEVELS[self.level]
+            if scale < 1.0:
+                frame = cv2.resize(frame, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+            ok, jpeg = cv2.imencode(".jpg", frame, [cv2.IMWRITE_JPEG_QUALITY, quality])
+            elapsed = time.perf_counter() - start
+            next_encode = start + 1.0 / self.max_fps
+            if not ok:
+                continue
+
+            with self.condition:
+                self.jpeg = jpeg.tobytes()
+                self.jpeg_sequence += 1
+                self.condition.notify_all()
+            self.encoded_frames += 1
+            self.encode_time += elapsed
+            self._adapt(elapsed, start)
+
+    def _adapt(self, encode_seconds, now):
+        """Move one quality level at a time, at most every two seconds"""
+        if now - self.last_level_change < 2.0:
+            return
+        duty = encode_seconds * self.max_fps
+        loop_slowed = (self.idle_interval is not None and self.loop_interval is not None
+                       and self.loop_interval > 1.1 * self.idle_interval)
+        if (duty > self.max_duty or loop_slowed) and self.level < len(QUALITY_LEVELS) - 1:
+            self.level += 1
+        elif duty < self.max_duty / 2 and not loop_slowed and self.level > 0:
+            self.level -= 1
+        else:
+            return
+        self.last_level_change = now
+
+    def next_jpeg(self, last_sequence, timeout=1.0):
+        """Block until a JPEG newer than last_sequence exists; (None, last) on timeout"""
+        with self.condition:
+            self.condition.wait_for(lambda: self.closed or self.jpeg_sequence != last_sequence, timeout)
+            if self.closed or self.jpeg_sequence == last_sequence:
+                return None, last_sequence
+            return self.jpeg, self.jpeg_sequence
+
+    def _client_joined(self):
+        with self.condition:
+            self.clients += 1
+            self.viewers_served += 1
+            self.condition.notify_all()
+
+    def _client_left(self):
+        with self.condition:
+            self.clients -= 1
+
+    def _make_handler(self):
+        sink = self
+
+        class StreamHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path == "/":
+                    self.send_response(200)
+                    self.send_header("Content-Type", "text/html")
+                    self.send_header("Content-Length", str(len(VIEWER_PAGE)))
+                    self.end_headers()
+                    self.wfile.write(VIEWER_PAGE)
+                elif self.path == "/stream.mjpg":
+                    self.stream()
+                else:
+                    self.send_error(404)
+
+            def stream(self):
+                self.send_response(200)
+                self.send_header("Cache-Control", "no-cache")
+                self.send_header("Content-Type", f"multipart/x-mixed-replace; boundary={BOUNDARY}")
+                self.end_headers()
+                sink._client_joined()
+                sequence = -1
+                try:
+                    while not sink.closed:
+                        jpeg, sequence = sink.next_jpeg(sequence)
+                        if jpeg is None:
+                            continue
+                        self.wfile.write(f"--{BOUNDARY}\r\nContent-Type: image/jpeg\r\n"
+                                         f"Content-Length: {len(jpeg)}\r\n\r\n".encode())
+                        self.wfile.write(jpeg)
+                        self.wfile.write(b"\r\n")
+                except (BrokenPipeError, ConnectionResetError):
+                    pass
+                finally:
+                    sink._client_left()
+
+            def log_message(self, format, *args):
+                pass
+
+        return StreamHandler
+
+    def close(self):
+        with self.condition:
+            self.closed = True
+            self.condition.notify_all()
+        self.encoder_thread.join()
+        self.server.shutdown()
+        self.server.server_close()
+        average = self.encode_time / self.encoded_frames * 1000 if self.encoded_frames else 0.0
+        scale, quality = QUALITY_LEVELS[self.level]
+        print(f"📡 Broadcast {self.encoded_frames} frames to {self.viewers_served} viewers "
+              f"({average:.1f} ms/encode, final scale {scale:g} quality {quality}, "
+              f"{self.skipped_frames} frames skipped with no viewers)")
+
+
+def watch_stream(url, frames=100):
+    """Pull frames from a broadcast and report the received frame rate"""
+    capture = cv2.VideoCapture(url)
+    if not capture.isOpened():
+        print(f"Error: Could not open {url}")
+        return
+    start = time.time()
+    received = 0
+    shape = None
+    while received < frames:
+        ret, frame = capture.read()
+        if not ret:
+            break
+        received += 1
+        shape = frame.shape
+    elapsed = time.time() - start
+    capture.release()
+    print(f"📺 Received {received} frames of {shape} in {elapsed:.1f}s ({received / max(elapsed, 1e-9):.1f} FPS)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Check a Rock Paper Scissors MJPEG broadcast")
+    parser.add_argument("url", nargs="?", default="http://127.0.0.1:8080/stream.mjpg")
+    parser.add_argument("--frames", type=int, default=100)
+    args = parser.parse_args()
+    watch_stream(args.url, args.frames)
@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+"""
+Camera capture tuning for Rock Paper Scissors Game
+Negotiates pixel format, resolution, frame rate and driver buffer depth
+instead of taking the camera's defaults, drains stale frames so the game
+sees the newest one, and measures what each setting actually delivers
+"""
+
+import argparse
+import time
+
+import cv2
+import numpy as np
+
+# The UI is laid out for 640x480; MJPG keeps USB bandwidth (and so frame rate) up
+DEFAULT_CAPTURE = "640x480@30:MJPG"
+
+
+class CaptureSettings:
+    """Requested (or negotiated) camera format"""
+    __slots__ = ("width", "height", "fps", "fourcc", "buffer_size")
+
+    def __init__(self, width=640, height=480, fps=30.0, fourcc="MJPG", buffer_size=1):
+        self.width = width
+        self.height = height
+        self.fps = fps
+        self.fourcc = fourcc
+        self.buffer_size = buffer_size
+
+    def __repr__(self):
+        return f"{self.width}x{self.height}@{self.fps:g}:{self.fourcc or 'default'}"
+
+
+def parse_settings(spec):
+    """WxH[@FPS][:FOURCC], e.g. 640x480@30:MJPG; "native" keeps the driver defaults (None)"""
+    if not spec or spec == "native":
+        return None
+    size, _, fourcc = spec.partition(":")
+    size, _, fps = size.partition("@")
+    width, _, height = size.lower().partition("x")
+    return CaptureSettings(int(width), int(height), float(fps or 30.0), fourcc.upper() or None)
+
+
+def fourcc_name(value):
+    """Decode CAP_PROP_FOURCC into its four characters"""
+    value = int(value)
+    name = "".join(chr((value >> (8 * i)) & 0xFF) for i in range(4))
+    return name if name.isprintable() and name.strip() else "?"
+
+
+class TunedCapture:
+    """cv2.VideoCapture with negotiated settings and stale-frame draining
+
+    read() only skips frames that are older than one frame period: the ones
+    queued up since the previous read apart from the newest, and only while
+    the driver timestamp (when there is one) says the grabbed frame is stale.
+    Skipped frames are grabbed without paying for retrieve(). Video files are
+    read as is.
+    """
+
+    def __init__(self, source=0, settings=None, drain=True, max_drain=4):
+        self.source = source
+        self.is_camera = not isinstance(source, str)
+        self.capture = cv2.VideoCapture(source)
+        self.requested = settings
+        self.drain = drain and self.is_camera
+        self.max_drain = max_drain
+        self.dropped = 0
+        self.frame_time = 0.0  # time.monotonic() when the last frame was grabbed
+        if settings and self.is_camera and self.capture.isOpened():
+            self.apply(settings)
+        fps = self.capture.get(cv2.CAP_PROP_FPS) or 30.0
+        self.frame_period = 1.0 / fps
+        # A grab that has to wait at least this long got a frame fresh from the camera
+        self.fresh_threshold = 0.25 / fps
+        self.actual = self.negotiated()
+
+    def apply(self, settings):
+        """Request the format; V4L2 wants FOURCC before the frame size"""
+        cap = self.capture
+        if settings.fourcc:
+            cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*settings.fourcc))
+        cap.set(cv2.CAP_PROP_FRAME_WIDTH, settings.width)
+        cap.set(cv2.CAP_PROP_FRAME_HEIGHT, settings.height)
+        cap.set(cv2.CAP_PROP_FPS, settings.fps)
+        if settings.buffer_size:
+            cap.set(cv2.CAP_PROP_BUFFERSIZE, settings.buffer_size)
+
+    def negotiated(self):
+        """What the driver actually agreed to"""
+        cap = self.capture
+        return CaptureSettings(int(cap.get(cv2.CAP_PROP_FRAME_WIDTH)), int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT)),
+                               cap.get(cv2.CAP_PROP_FPS), fourcc_name(cap.get(cv2.CAP_PROP_FOURCC)),
+                               int(cap.get(cv2.CAP_PROP_BUFFERSIZE)))
+
+    def isOpened(self):
+        return self.capture.isOpened()
+
+    def get(self, prop):
+        return self.capture.get(prop)
+
+    def read(self):
+        """(ok, frame) for the newest available frame"""
+        cap = self.capture
+        start = time.perf_counter()
+        if not cap.grab():
+            return False, None
+        now = time.monotonic()
+        drained = 0
+        if self.drain and self.frame_time and time.perf_counter() - start < self.fresh_threshold:
+            # Frames delivered since the last read; all but the newest are over a frame period old
+            backlog = min(self.max_drain, int((now - self.frame_time) / self.frame_period) - 1)
+            while drained < backlog and self.frame_age(now) > self.frame_period:
+                start = time.perf_counter()
+                if not cap.grab():
+                    break
+                drained += 1
+                now = time.monotonic()
+                if time.perf_counter() - start >= self.fresh_threshold:
+                    break
+        self.dropped += drained
+        self.frame_time = now
+        return cap.retrieve()
+
+    def frame_age(self, now):
+        """Age of the grabbed frame by the driver clock, or infinity when the driver has none"""
+        stamp = self._stamp(now)
+        return float("inf") if stamp is None else now - stamp
+
+    def driver_timestamp(self):
+        """Monotonic capture time reported by the driver (V4L2), or None"""
+        return self._stamp(self.frame_time)
+
+    def _stamp(self, now):
+        if not self.is_camera:
+            return None
+        stamp = self.capture.get(cv2.CAP_PROP_POS_MSEC) / 1000.0
+        # Only trust it when it is on the same clock as time.monotonic()
+        return stamp if 0.0 < now - stamp < 2.0 else None
+
+    def release(self):
+        self.capture.release()
+
+
+def open_camera(source=0, settings=DEFAULT_CAPTURE):
+    """Open a camera (or video file) with settings given as a spec or CaptureSettings"""
+    if isinstance(settings, str):
+        settings = parse_settings(settings)
+    capture = TunedCapture(source, settings)
+    if capture.isOpened() and settings and capture.is_camera:
+        print(f"📷 Camera {source}: requested {settings}, got {capture.actual} (buffer {capture.actual.buffer_size})")
+    return capture
+
+
+def calibrate(source, specs, seconds=5.0, inference=True):
+    """Measure delivered FPS and frame age at inference for each capture setting"""
+    hands = None
+    if inference:
+        import mediapipe as mp
+        hands = mp.solutions.hands.Hands(static_image_mode=False, max_num_hands=1,
+                                         min_detection_confidence=0.8, min_tracking_confidence=0.6)
+    results = []
+    for spec in specs:
+        capture = TunedCapture(source, parse_settings(spec))
+        if not capture.isOpened():
+            print(f"❌ {spec}: could not open {source}")
+            continue
+        # Let auto exposure settle before measuring
+        warmup_end = time.monotonic() + (1.0 if capture.is_camera else 0.0)
+        while time.monotonic() < warmup_end and capture.read()[0]:
+            pass
+        capture.dropped = 0
+
+        frames = 0
+        ages = []  # driver timestamp -> inference done
+        pipeline = []  # read() returned -> inference done
+        start = time.monotonic()
+        while time.monotonic() - start < seconds:
+            ok, frame = capture.read()
+            if not ok:
+                break
+            read_done = time.monotonic()
+            frames += 1
+            if hands:
+                hands.process(cv2.cvtColor(cv2.flip(frame, 1), cv2.COLOR_BGR2RGB))
+            done = time.monotonic()
+            pipeline.append(done - read_done)
+            stamp = capture.driver_timestamp()
+            if stamp is not None:
+                ages.append(done - stamp)
+        elapsed = time.monotonic() - start
+        capture.release()
+
+        result = {
+            "spec": spec, "actual": repr(capture.actual), "fps": frames / elapsed if elapsed else 0.0,
+            "dropped": capture.dropped, "pipeline_ms": float(np.mean(pipeline)) * 1000 if pipeline else 0.0,
+            "latency_ms": float(np.mean(ages)) * 1000 if ages else None,
+            "latency_p90_ms": float(np.percentile(ages, 90)) * 1000 if ages else None
+        }
+        results.append(result)
+        latency = (f"capture-to-inference {result['latency_ms']:.1f} ms (p90 {result['latency_p90_ms']:.1f})"
+                   if ages else "no driver timestamps")
+        print(f"  {spec:<22} got {result['actual']:<22} {result['fps']:5.1f} FPS, "
+              f"{result['dropped']} stale dropped, read-to-inference {result['pipeline_ms']:.1f} ms, {latency}")
+    if hands:
+        hands.close()
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Measure camera capture settings for Rock Paper Scissors Game")
+    parser.add_argument("command", choices=["calibrate"])
+    parser.add_argument("settings", nargs="*",
+                        help="Capture specs WxH[@FPS][:FOURCC] or native (default: a few common ones)")
+    parser.add_argument("--source", default="0", help="Camera index or video file")
+    parser.add_argument("--seconds", type=float, default=5.0, help="Measurement time per setting")
+    parser.add_argument("--no-inference", action="store_true", help="Measure capture only")
+    args = parser.parse_args()
+
+    source = int(args.source) if args.source.isdigit() else args.source
+    specs = args.settings or ["native", "640x480@30:YUYV", DEFAULT_CAPTURE, "1280x720@30:MJPG"]
+    print(f"📷 Calibrating {source}, {args.seconds:g}s per setting:")
+    calibrate(source, specs, args.seconds, not args.no_inference)
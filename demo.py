@@ -57,8 +57,8 @@ class DemoGame:
         
         print(f"Score - You: {self.player_score}, Computer: {self.computer_score}")
     
-    def run_demo(self):
-        """Run the demo game"""
+    def run_demo(self, read_input=input, sleep=time.sleep):
+        """Run the demo game (input and sleep can be scripted for headless runs)"""
         print("🎮 ROCK PAPER SCISSORS DEMO 🎮")
         print("=" * 40)
         print("This demo simulates the game logic without webcam access.")
@@ -72,7 +72,7 @@ class DemoGame:
             print("4. Quit")
             
             try:
-                choice = input("\nChoose your move (1-4): ").strip()
+                choice = read_input("\nChoose your move (1-4): ").strip()
                 
                 if choice == "4":
                     break
@@ -84,13 +84,16 @@ class DemoGame:
                     print("\nPreparing for next round...")
                     for i in range(3, 0, -1):
                         print(f"Next round in {i}...")
-                        time.sleep(1)
+                        sleep(1)
                 else:
                     print("Invalid choice. Please enter 1, 2, 3, or 4.")
                     
             except KeyboardInterrupt:
                 print("\n\nGame interrupted!")
                 break
+            except EOFError:
+                # Piped or closed stdin: nothing more to play
+                break
             except Exception as e:
                 print(f"Error: {e}")
         
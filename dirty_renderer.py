@@ -0,0 +1,155 @@
+"""
+Dirty-region renderer for Rock Paper Scissors Game
+Caches UI panels on an overlay layer and only re-renders widgets whose
+state changed since the previous frame
+"""
+
+import cv2
+import numpy as np
+
+
+def clip_rect(rect, width, height):
+    """Clip an (x0, y0, x1, y1) rectangle to the frame"""
+    x0, y0, x1, y1 = rect
+    return (max(0, x0), max(0, y0), min(width, x1), min(height, y1))
+
+
+def rects_intersect(a, b):
+    """Check whether two (x0, y0, x1, y1) rectangles overlap"""
+    return a[0] < b[2] and b[0] < a[2] and a[1] < b[3] and b[1] < a[3]
+
+
+class DirtyRegionRenderer:
+    """Keeps a cached composite of UI widgets and redraws only dirty ones"""
+
+    def __init__(self):
+        self.shape = None
+        self.widgets = {}  # name -> (rect, key, drawn bounding box)
+        self.redraw_count = 0
+        self.edge_rows = self.edge_cols = None
+
+    def reset(self, shape):
+        """Drop the cache, e.g. when the frame size changes"""
+        self.shape = shape
+        # Widgets are drawn on black and white backgrounds: pixels that match on
+        # both are opaque, pixels that differ by less than 255 are anti-aliased edges
+        self.canvas_black = np.zeros(shape, dtype=np.uint8)
+        self.canvas_white = np.full(shape, 255, dtype=np.uint8)
+        self.mask = np.zeros(shape[:2], dtype=np.uint8)
+        self.widgets = {}
+        self.edge_rows = self.edge_cols = None
+
+    def render(self, frame, widgets):
+        """Composite widgets onto the frame
+
+        Each widget is (name, rect, key, draw) where draw(roi, x0, y0) paints the
+        widget onto roi using coordinates offset by (x0, y0). The widget is only
+        re-rendered when its key or rect changes, or an overlapping widget changes.
+        """
+        height, width = frame.shape[:2]
+        if frame.shape != self.shape:
+            self.reset(frame.shape)
+
+        widgets = [(name, clip_rect(rect, width, height), key, draw) for name, rect, key, draw in widgets]
+        current_names = {name for name, _, _, _ in widgets}
+
+        # Find changed widgets and the regions they touch
+        dirty_rects = []
+        redraw = set()
+        for name, rect, key, _ in widgets:
+            cached = self.widgets.get(name)
+            if cached is None or cached[0] != rect or cached[1] != key:
+                redraw.add(name)
+                dirty_rects.append(rect)
+                if cached is not None:
+                    dirty_rects.append(cached[0])
+        for name in list(self.widgets):
+            if name not in current_names:
+                dirty_rects.append(self.widgets.pop(name)[0])
+
+        if dirty_rects:
+            # Anything overlapping a dirty region must be redrawn too
+            changed = True
+            while changed:
+                changed = False
+                for name, rect, _, _ in widgets:
+                    if name in redraw or not any(rects_intersect(rect, d) for d in dirty_rects):
+                        continue
+                    redraw.add(name)
+                    dirty_rects.append(rect)
+                    changed = True
+
+            for x0, y0, x1, y1 in dirty_rects:
+                self.canvas_black[y0:y1, x0:x1] = 0
+                self.canvas_white[y0:y1, x0:x1] = 255
+
+            drawn = {}
+            for name, rect, _, draw in widgets:
+                if name in redraw:
+                    x0, y0, x1, y1 = rect
+                    black = self.canvas_black[y0:y1, x0:x1]
+                    white = self.canvas_white[y0:y1, x0:x1]
+                    before = black.copy(), white.copy()
+                    draw(black, x0, y0)
+                    draw(white, x0, y0)
+                    drawn[name] = self.drawn_bbox(rect, np.any((black != before[0]) | (white != before[1]), axis=2))
+
+            for x0, y0, x1, y1 in dirty_rects:
+                self.mask[y0:y1, x0:x1] = np.all(
+                    self.canvas_black[y0:y1, x0:x1] == self.canvas_white[y0:y1, x0:x1], axis=2)
+
+            for name, rect, key, _ in widgets:
+                if name in redraw:
+                    self.widgets[name] = (rect, key, drawn[name])
+            self.update_edges(widgets)
+            self.redraw_count += 1
+
+        # Stamp only the painted pixels of each widget onto the live frame
+        for name, _, _, _ in widgets:
+            bbox = self.widgets[name][2]
+            if bbox is None:
+                continue
+            x0, y0, x1, y1 = bbox
+            cv2.copyTo(self.canvas_black[y0:y1, x0:x1], self.mask[y0:y1, x0:x1], frame[y0:y1, x0:x1])
+
+        # Blend the sparse anti-aliased edge pixels
+        if self.edge_rows is not None and self.edge_rows.size:
+            if frame.flags.c_contiguous:
+                # One flat gather and scatter instead of indexing by row and column
+                pixels = frame.reshape(-1, 3)
+                pixels[self.edge_index] = self.blend_edges(pixels.take(self.edge_index, axis=0))
+            else:
+                frame[self.edge_rows, self.edge_cols] = self.blend_edges(frame[self.edge_rows, self.edge_cols])
+
+    def blend_edges(self, background):
+        """background * (1 - alpha) + premultiplied color, in place on the gathered pixels"""
+        cv2.multiply(background, self.edge_keep, background, scale=1 / 255)
+        return cv2.add(background, self.edge_color, background)
+
+    def update_edges(self, widgets):
+        """Collect partially covered pixels with their premultiplied color and coverage"""
+        edge_mask = np.zeros(self.mask.shape, dtype=bool)
+        for name, rect, _, _ in widgets:
+            x0, y0, x1, y1 = rect
+            spread = self.canvas_white[y0:y1, x0:x1].astype(np.int16) - self.canvas_black[y0:y1, x0:x1]
+            edge_mask[y0:y1, x0:x1] |= np.any((spread > 0) & (spread < 255), axis=2)
+        self.edge_rows, self.edge_cols = np.nonzero(edge_mask)
+        self.edge_index = self.edge_rows * self.mask.shape[1] + self.edge_cols
+        black = self.canvas_black[self.edge_rows, self.edge_cols]
+        white = self.canvas_white[self.edge_rows, self.edge_cols]
+        # On black the pixel is alpha * color; the white difference reveals 1 - alpha (times 255)
+        self.edge_color = black
+        self.edge_keep = cv2.subtract(white, black)
+
+    def drawn_bbox(self, rect, painted):
+        """Tight bounding box of the pixels a widget painted (a boolean map over its rectangle)
+
+        Only the widget's own pixels count, so a panel overlapping another is
+        not stamped over the other's area a second time.
+        """
+        x0, y0 = rect[:2]
+        rows = np.flatnonzero(painted.any(axis=1))
+        if rows.size == 0:
+            return None
+        cols = np.flatnonzero(painted.any(axis=0))
+        return (x0 + cols[0], y0 + rows[0], x0 + cols[-1] + 1, y0 + rows[-1] + 1)
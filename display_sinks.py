@@ -0,0 +1,242 @@
+"""
+Display sinks for Rock Paper Scissors Game
+Decouple the frame loop from cv2.imshow so games can run in a window,
+headless, while recording to video, or feeding an external viewer
+"""
+
+import queue
+import threading
+import time
+from multiprocessing import shared_memory
+
+import cv2
+import numpy as np
+
+
+class KeyEvent:
+    """A key press routed from a display sink to the game loop"""
+    __slots__ = ("key", "timestamp")
+
+    def __init__(self, key, timestamp=None):
+        self.key = key
+        self.timestamp = time.time() if timestamp is None else timestamp
+
+    def __repr__(self):
+        return f"KeyEvent({self.key!r})"
+
+
+class DisplaySink:
+    """Base class: receives composited frames and yields input events"""
+
+    def show(self, frame):
+        """Present a finished frame (must not be modified afterwards)"""
+        raise NotImplementedError
+
+    def poll_events(self):
+        """Return the input events received since the last poll"""
+        return []
+
+    def close(self):
+        """Release any window, file or shared memory"""
+
+
+class HighGuiSink(DisplaySink):
+    """OpenCV HighGUI window, the classic cv2.imshow + cv2.waitKey pair"""
+
+    def __init__(self, window_name, wait_ms=1):
+        self.window_name = window_name
+        self.wait_ms = wait_ms
+
+    def show(self, frame):
+        cv2.imshow(self.window_name, frame)
+
+    def poll_events(self):
+        # waitKey also pumps the GUI event loop, so it runs once per frame
+        key = cv2.waitKey(self.wait_ms) & 0xFF
+        if key == 0xFF:
+            return []
+        return [KeyEvent(chr(key))]
+
+    def close(self):
+        cv2.destroyWindow(self.window_name)
+
+
+class NullSink(DisplaySink):
+    """Discards frames; keys can be injected for scripted or headless runs"""
+
+    def __init__(self):
+        self.frame_count = 0
+        self.pending = []
+
+    def push_key(self, key):
+        """Queue a key press for the next poll"""
+        self.pending.append(KeyEvent(key))
+
+    def show(self, frame):
+        self.frame_count += 1
+
+    def poll_events(self):
+        events, self.pending = self.pending, []
+        return events
+
+
+class VideoEncoderSink(DisplaySink):
+    """Encodes frames to MP4/MJPEG on a writer thread without stalling the loop"""
+
+    def __init__(self, path, fps=30.0, codec=None, queue_size=64):
+        self.path = path
+        self.fps = fps
+        self.codec = codec or ("MJPG" if path.lower().endswith(".avi") else "mp4v")
+        self.frames = queue.Queue(maxsize=queue_size)
+        self.dropped_frames = 0
+        self.written_frames = 0
+        self.writer_thread = threading.Thread(target=self._write_loop, name="video-encoder", daemon=True)
+        self.writer_thread.start()
+
+    def show(self, frame):
+        try:
+            self.frames.put_nowait(frame)
+        except queue.Full:
+            # Never block the frame loop on a slow disk or encoder
+            self.dropped_frames += 1
+
+    def _write_loop(self):
+        """Open the writer on the first frame and drain the queue until closed"""
+        writer = None
+        while True:
+            frame = self.frames.get()
+            if frame is None:
+                break
+            if writer is None:
+                height, width = frame.shape[:2]
+                writer = cv2.VideoWriter(self.path, cv2.VideoWriter_fourcc(*self.codec), self.fps, (width, height))
+            writer.write(frame)
+            self.written_frames += 1
+        if writer is not None:
+            writer.release()
+
+    def close(self):
+        self.frames.put(None)
+        self.writer_thread.join()
+        print(f"🎞️  Recorded {self.written_frames} frames to {self.path} ({self.dropped_frames} dropped)")
+
+
+# Shared-memory frame layout: int64 header [sequence, height, width, channels] then pixels
+SHM_HEADER_FIELDS = 4
+SHM_HEADER_BYTES = SHM_HEADER_FIELDS * 8
+
+
+class SharedMemorySink(DisplaySink):
+    """Publishes the latest frame into shared memory for an external viewer
+
+    The sequence number is odd while a frame is being written, so readers can
+    retry instead of showing a torn frame.
+    """
+
+    def __init__(self, name, max_height=1080, max_width=1920, channels=3):
+        self.name = name
+        self.shm = shared_memory.SharedMemory(
+            name=name, create=True, size=SHM_HEADER_BYTES + max_height * max_width * channels)
+        self.header = np.ndarray((SHM_HEADER_FIELDS,), dtype=np.int64, buffer=self.shm.buf)
+        self.header[:] = (0, 0, 0, channels)
+        self.capacity = max_height * max_width * channels
+
+    def show(self, frame):
+        height, width = frame.shape[:2]
+        channels = frame.shape[2] if frame.ndim == 3 else 1
+        if height * width * channels > self.capacity:
+            return
+        pixels = np.ndarray((height, width, channels), dtype=np.uint8,
+                            buffer=self.shm.buf, offset=SHM_HEADER_BYTES)
+        self.header[0] += 1
+        self.header[1:] = (height, width, channels)
+        pixels[...] = frame.reshape(height, width, channels)
+        self.header[0] += 1
+
+    def close(self):
+        del self.header
+        self.shm.close()
+        self.shm.unlink()
+
+
+def read_shared_frame(shm, last_sequence=-1):
+    """Copy the newest frame out of a SharedMemorySink segment, or None if unchanged"""
+    header = np.ndarray((SHM_HEADER_FIELDS,), dtype=np.int64, buffer=shm.buf)
+    sequence = int(header[0])
+    if sequence == last_sequence or sequence % 2 or header[1] == 0:
+        return sequence, None
+    height, width, channels = (int(v) for v in header[1:])
+    frame = np.ndarray((height, width, channels), dtype=np.uint8,
+                       buffer=shm.buf, offset=SHM_HEADER_BYTES).copy()
+    if int(header[0]) != sequence:
+        # Writer raced us; try again on the next poll
+        return last_sequence, None
+    return sequence, frame
+
+
+class MultiSink(DisplaySink):
+    """Fans frames out to several sinks and merges their events"""
+
+    def __init__(self, sinks):
+        self.sinks = list(sinks)
+
+    def show(self, frame):
+        for sink in self.sinks:
+            sink.show(frame)
+
+    def poll_events(self):
+        events = []
+        for sink in self.sinks:
+            events.extend(sink.poll_events())
+        return events
+
+    def close(self):
+        for sink in self.sinks:
+            sink.close()
+
+
+def create_sink(spec, window_name):
+    """Build a sink from a spec: window, null, video:<path>, shm:<name>, mjpeg:[host:]<port>"""
+    kind, _, argument = spec.partition(":")
+    if kind == "window":
+        return HighGuiSink(window_name)
+    if kind == "null":
+        return NullSink()
+    if kind == "video":
+        return VideoEncoderSink(argument or "match.mp4")
+    if kind == "shm":
+        return SharedMemorySink(argument or "rps_frames")
+    if kind == "mjpeg":
+        from broadcast import MjpegBroadcastSink
+        # Local only unless a host is given, e.g. mjpeg:0.0.0.0:8080 to serve the LAN
+        host, _, port = argument.rpartition(":")
+        return MjpegBroadcastSink(host or "127.0.0.1", int(port or 8080))
+    raise ValueError(f"Unknown display sink: {spec}")
+
+
+def create_display(specs, window_name):
+    """Build one sink, or a MultiSink when several specs are given"""
+    specs = specs or ["window"]
+    sinks = [create_sink(spec, window_name) for spec in specs]
+    return sinks[0] if len(sinks) == 1 else MultiSink(sinks)
+
+
+def view_shared_frames(name="rps_frames"):
+    """Minimal external viewer for a SharedMemorySink"""
+    shm = shared_memory.SharedMemory(name=name)
+    sequence = -1
+    try:
+        while True:
+            sequence, frame = read_shared_frame(shm, sequence)
+            if frame is not None:
+                cv2.imshow(f"Shared frames: {name}", frame)
+            if cv2.waitKey(5) & 0xFF == ord('q'):
+                break
+    finally:
+        shm.close()
+        cv2.destroyAllWindows()
+
+
+if __name__ == "__main__":
+    import sys
+    view_shared_frames(sys.argv[1] if len(sys.argv) > 1 else "rps_frames")
@@ -0,0 +1,322 @@
+#!/usr/bin/env python3
+"""
+Animated effects engine for Rock Paper Scissors Game
+Animations are functions of elapsed time sampled once into lookup tables,
+and everything they move is rasterized up front into sprites (one per
+keyframe when the shape changes), so a frame of animation costs a table
+lookup and a sprite blend however elaborate the drawing
+"""
+
+import argparse
+import time
+from collections import OrderedDict
+
+import cv2
+import numpy as np
+
+from text_cache import TextStamp, blit_stamp
+
+FONT = cv2.FONT_HERSHEY_SIMPLEX
+
+
+def ease_out_back(t, overshoot=1.70158):
+    """Overshoots the end value a little before settling, for a pop"""
+    t = t - 1.0
+    return 1.0 + t * t * ((overshoot + 1.0) * t + overshoot)
+
+
+def pulse(t):
+    """0 -> 1 -> 0 smoothly over one period"""
+    return 0.5 - 0.5 * np.cos(2.0 * np.pi * t)
+
+
+def bounce(t):
+    """A hop: up and back down with a soft landing"""
+    return np.sin(np.pi * t) ** 2
+
+
+class Curve:
+    """Value over time from an easing function, sampled once into a lookup table
+
+    Looping curves wrap their phase; one-shot curves hold the end value
+    once duration has passed.
+    """
+
+    def __init__(self, easing, duration, start=0.0, end=1.0, loop=False, samples=240):
+        self.duration = duration
+        self.loop = loop
+        self.samples = samples
+        self.table = (start + (end - start) * easing(np.linspace(0.0, 1.0, samples))).tolist()
+
+    def index(self, elapsed):
+        """Table index for a time since the animation started"""
+        position = int(elapsed / self.duration * (self.samples - 1))
+        if self.loop:
+            return position % self.samples
+        return min(max(position, 0), self.samples - 1)
+
+    def at(self, elapsed):
+        return self.table[self.index(elapsed)]
+
+
+def render_sprite(size, draw):
+    """Rasterize draw(canvas) once into a premultiplied sprite centered on the canvas
+
+    The drawing is done on black and on white: black gives the color times
+    its coverage, the difference between the two the background weight, so
+    anti-aliased edges and any drawing primitive blend correctly.
+    """
+    width, height = size
+    black = np.zeros((height, width, 3), dtype=np.uint8)
+    white = np.full((height, width, 3), 255, dtype=np.uint8)
+    draw(black)
+    draw(white)
+    keep = cv2.subtract(white, black)
+    painted = (keep < 255).any(axis=2)
+    rows = np.flatnonzero(painted.any(axis=1))
+    if rows.size == 0:
+        return None
+    cols = np.flatnonzero(painted.any(axis=0))
+    y0, y1, x0, x1 = rows[0], rows[-1] + 1, cols[0], cols[-1] + 1
+    keep = keep[y0:y1, x0:x1]
+    # A sprite that covers its whole box is copied rather than blended
+    return TextStamp(np.ascontiguousarray(black[y0:y1, x0:x1]), np.ascontiguousarray(keep) if keep.any() else None,
+                     x0 - width // 2, y0 - height // 2)
+
+
+def scale_sprite(sprite, scale):
+    """The sprite resampled about its anchor, e.g. for scale keyframes of a pre-rendered banner"""
+    height, width = sprite.color.shape[:2]
+    size = (max(1, round(width * scale)), max(1, round(height * scale)))
+    interpolation = cv2.INTER_AREA if scale < 1.0 else cv2.INTER_LINEAR
+    keep = None if sprite.keep is None else cv2.resize(sprite.keep, size, interpolation=interpolation)
+    color = cv2.resize(sprite.color, size, interpolation=interpolation)
+    return TextStamp(color, keep, round(sprite.offset_x * scale), round(sprite.offset_y * scale))
+
+
+class MaskedSprite:
+    """A mostly opaque sprite: a masked copy plus a sparse blend of its few see-through pixels"""
+    __slots__ = ("color", "mask", "edge_rows", "edge_cols", "edge_color", "edge_keep", "offset_x", "offset_y")
+
+    def __init__(self, sprite, partial):
+        self.color = sprite.color
+        self.mask = np.ascontiguousarray(~partial).view(np.uint8)
+        self.edge_rows, self.edge_cols = np.nonzero(partial)
+        self.edge_color = sprite.color[self.edge_rows, self.edge_cols].astype(np.float32)
+        self.edge_keep = sprite.keep[self.edge_rows, self.edge_cols].astype(np.float32) / 255.0
+        self.offset_x = sprite.offset_x
+        self.offset_y = sprite.offset_y
+
+
+def compact(sprite, max_partial=0.05, min_pixels=4096):
+    """Switch sprites with only a few see-through pixels (e.g. a banner's rounded corners) to MaskedSprite
+
+    Below min_pixels the whole-box blend is cheaper than the sparse edge pass.
+    """
+    if sprite is None or sprite.keep is None or sprite.keep.shape[0] * sprite.keep.shape[1] < min_pixels:
+        return sprite
+    partial = sprite.keep.any(axis=2)
+    if partial.mean() > max_partial:
+        return sprite
+    return MaskedSprite(sprite, partial)
+
+
+def blit(frame, sprite, x, y):
+    """Draw any sprite of this module with its anchor at (x, y)"""
+    if type(sprite) is not MaskedSprite:
+        blit_stamp(frame, sprite, x, y)
+        return
+    height, width = frame.shape[:2]
+    sprite_height, sprite_width = sprite.color.shape[:2]
+    x = int(x) + sprite.offset_x
+    y = int(y) + sprite.offset_y
+    x0, y0 = max(x, 0), max(y, 0)
+    x1, y1 = min(x + sprite_width, width), min(y + sprite_height, height)
+    if x0 >= x1 or y0 >= y1:
+        return
+    sx, sy = x0 - x, y0 - y
+    window = (slice(sy, sy + y1 - y0), slice(sx, sx + x1 - x0))
+    roi = frame[y0:y1, x0:x1]
+    cv2.copyTo(sprite.color[window], sprite.mask[window], roi)
+
+    rows, cols, color, keep = sprite.edge_rows, sprite.edge_cols, sprite.edge_color, sprite.edge_keep
+    if (x1 - x0, y1 - y0) != (sprite_width, sprite_height):
+        inside = (rows >= sy) & (rows < sy + y1 - y0) & (cols >= sx) & (cols < sx + x1 - x0)
+        rows, cols, color, keep = rows[inside], cols[inside], color[inside], keep[inside]
+    rows, cols = rows + y, cols + x
+    frame[rows, cols] = (color + frame[rows, cols] * keep + 0.5).astype(np.uint8)
+
+
+def text_sprite(text, scale, color, thickness):
+    """Anti-aliased text rasterized into a sprite centered on the text"""
+    (width, height), baseline = cv2.getTextSize(text, FONT, scale, thickness)
+    canvas = (width + 4 * thickness + 8, height + baseline + 4 * thickness + 8)
+    origin = (canvas[0] // 2 - width // 2, canvas[1] // 2 + height // 2)
+    return render_sprite(canvas, lambda c: cv2.putText(c, text, origin, FONT, scale, color, thickness, cv2.LINE_AA))
+
+
+def text_center(text, org, scale, thickness):
+    """Where a text drawn at org (its baseline origin, as for cv2.putText) has its center"""
+    (width, height), _ = cv2.getTextSize(text, FONT, scale, thickness)
+    return (org[0] + width // 2, org[1] - height // 2)
+
+
+class Effect:
+    """Base class: draw(frame, elapsed) blends the effect at a time since it started"""
+
+    def draw(self, frame, elapsed):
+        raise NotImplementedError
+
+
+class KeyframeEffect(Effect):
+    """A sprite per keyframe value, picked by a curve through a precomputed index table"""
+
+    def __init__(self, curve, render, keyframes, anchor):
+        lo, hi = min(curve.table), max(curve.table)
+        values = np.linspace(lo, hi, keyframes) if hi > lo else [lo]
+        self.frames = [compact(render(value)) for value in values]
+        span = (hi - lo) or 1.0
+        # Curve sample -> keyframe, so drawing never touches the curve's values
+        self.keyframe = [round((value - lo) / span * (len(self.frames) - 1)) for value in curve.table]
+        self.curve = curve
+        self.anchor = anchor
+
+    def draw(self, frame, elapsed):
+        sprite = self.frames[self.keyframe[self.curve.index(elapsed)]]
+        if sprite is not None:
+            blit(frame, sprite, *self.anchor)
+
+
+class PulsingText(KeyframeEffect):
+    """Text breathing around its size, re-rasterized at each keyframe scale (not resampled)"""
+
+    def __init__(self, text, org, scale, color, thickness, period=1.2, amount=0.06, keyframes=9):
+        curve = Curve(pulse, period, scale * (1 - amount), scale * (1 + amount), loop=True)
+        # Anchored at the text's center so it grows in place
+        super().__init__(curve, lambda value: text_sprite(text, value, color, thickness), keyframes,
+                         text_center(text, org, scale, thickness))
+
+
+class PopIn(KeyframeEffect):
+    """A pre-rendered sprite scaling up with an overshoot, then holding its final frame"""
+
+    def __init__(self, sprite, anchor, duration=0.4, start_scale=0.3, keyframes=12):
+        curve = Curve(ease_out_back, duration, start_scale, 1.0)
+        # The overshoot keyframes come from resampling; the resting frame is the original
+        super().__init__(curve, lambda value: sprite if value == 1.0 else scale_sprite(sprite, value),
+                         keyframes, anchor)
+        self.frames[self.keyframe[-1]] = compact(sprite)
+
+
+class Still(Effect):
+    """A static pre-rendered layer, e.g. UI chrome that never changes"""
+
+    def __init__(self, sprite, anchor):
+        self.sprite = compact(sprite)
+        self.anchor = anchor
+
+    def draw(self, frame, elapsed):
+        if self.sprite is not None:
+            blit(frame, self.sprite, *self.anchor)
+
+
+class IconBounce(Effect):
+    """One pre-rendered icon hopping on a looped height table, optionally phase shifted"""
+
+    def __init__(self, sprite, anchor, height=10, period=1.2, delay=0.0):
+        self.sprite = compact(sprite)
+        self.anchor = anchor
+        self.delay = delay
+        self.curve = Curve(bounce, period, 0.0, float(height), loop=True)
+        self.offsets = [round(value) for value in self.curve.table]
+
+    def draw(self, frame, elapsed):
+        if self.sprite is not None:
+            x, y = self.anchor
+            blit(frame, self.sprite, x, y - self.offsets[self.curve.index(elapsed + self.delay)])
+
+
+class EffectsEngine:
+    """Composites effects at their own start times and keeps built effects for reuse
+
+    A layer is (key, build, start): key identifies the effect (its text,
+    colors and position), build() creates it on first use and start is the
+    game time it began. Building rasterizes all keyframes, so each distinct
+    effect pays that once; drawing is lookups and blends.
+    """
+
+    def __init__(self, max_effects=64):
+        self.max_effects = max_effects
+        self.effects = OrderedDict()
+        self.builds = 0
+        self.draws = 0
+
+    def effect(self, key, build):
+        effect = self.effects.get(key)
+        if effect is None:
+            effect = self.effects[key] = build()
+            self.builds += 1
+            while len(self.effects) > self.max_effects:
+                self.effects.popitem(last=False)
+        else:
+            self.effects.move_to_end(key)
+        return effect
+
+    def draw(self, frame, now, layers):
+        """Draw each (key, build, start) layer at now - start, in order"""
+        for key, build, start in layers:
+            self.effect(key, build).draw(frame, now - start)
+            self.draws += 1
+
+
+def benchmark(frames=2000, size=(640, 480)):
+    """Per-frame cost of drawing animated UI directly versus through the engine"""
+    width, height = size
+    center = (width // 2, height // 2)
+    background = np.full((height, width, 3), 40, dtype=np.uint8)
+    text, org, gold = "Show your gesture!", (center[0] - 125, center[1] + 10), (0, 215, 255)
+
+    def draw_direct(frame, t):
+        # Today's approach, per frame: recompute the geometry and draw everything again
+        scale = 1.2 * (0.94 + 0.12 * pulse((t / 1.2) % 1.0))
+        (w, h), _ = cv2.getTextSize(text, FONT, scale, 3)
+        cv2.putText(frame, text, (center[0] - w // 2, center[1] + h // 2), FONT, scale, gold, 3, cv2.LINE_AA)
+        for i in range(3):
+            hop = int(10 * bounce(((t + 0.2 * i) / 1.2) % 1.0))
+            x, y = center[0] - 155 + i * 110, center[1] + 90 - hop
+            cv2.circle(frame, (x, y), 20, gold, -1, cv2.LINE_AA)
+            cv2.circle(frame, (x, y), 20, (255, 255, 255), 2, cv2.LINE_AA)
+
+    def icon(canvas):
+        c = (canvas.shape[1] // 2, canvas.shape[0] // 2)
+        cv2.circle(canvas, c, 20, gold, -1, cv2.LINE_AA)
+        cv2.circle(canvas, c, 20, (255, 255, 255), 2, cv2.LINE_AA)
+
+    engine = EffectsEngine()
+    icon_sprite = render_sprite((48, 48), icon)
+    layers = [("prompt", lambda: PulsingText(text, org, 1.2, gold, 3), 0.0)]
+    layers += [(("icon", i), lambda i=i: IconBounce(icon_sprite, (center[0] - 155 + i * 110, center[1] + 90),
+                                                     delay=0.2 * i), 0.0)
+               for i in range(3)]
+
+    results = {}
+    for name, draw in (("direct", draw_direct), ("engine", lambda frame, t: engine.draw(frame, t, layers))):
+        frame = background.copy()
+        draw(frame, 0.0)  # Builds the engine's sprites outside the timing
+        start = time.perf_counter()
+        for i in range(frames):
+            np.copyto(frame, background)
+            draw(frame, i / 30.0)
+        results[name] = (time.perf_counter() - start) / frames
+    print(f"🎞️  Prompt pulse + three bouncing icons, {frames} frames at {width}x{height}:")
+    for name, seconds in results.items():
+        print(f"  {name:<7} {seconds * 1e6:7.1f} µs per frame")
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Measure the effects engine for Rock Paper Scissors Game")
+    parser.add_argument("command", choices=["benchmark"])
+    parser.add_argument("--frames", type=int, default=2000)
+    args = parser.parse_args()
+    benchmark(args.frames)
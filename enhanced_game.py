@@ -1,21 +1,36 @@
+import argparse
 import cv2
-import mediapipe as mp
-import numpy as np
 import random
 import time
 import math
 
+from camera_capture import open_camera
+from dirty_renderer import DirtyRegionRenderer
+from hand_frame import FINGER_TIPS, FINGER_PIPS, SkeletonRenderer
+from effects import EffectsEngine, IconBounce, PopIn, PulsingText, render_sprite, text_center, text_sprite
+from text_cache import put_text
+from display_sinks import create_display
+from match_rules import MatchRules, BestOfN, parse_rules
+from analytics import GameAnalytics
+from pose_backends import create_backend
+from metrics import GameMetrics, add_metrics_arguments, create_exporters
+from game_config import (GameConfig, FIELDS, GRAPH, CAMERA, ConfigWatcher, add_config_arguments,
+                         load_config, parse_overrides)
+from game_events import (EventBus, GestureDetected, RoundCommitted, MatchWon, Reset,
+                         ConsoleLogger, HistoryWriter, UdpBroadcaster)
+
 class EnhancedRockPaperScissorsGame:
-    def __init__(self):
-        # Initialize MediaPipe
-        self.mp_hands = mp.solutions.hands
-        self.hands = self.mp_hands.Hands(
-            static_image_mode=False,
-            max_num_hands=1,
-            min_detection_confidence=0.8,
-            min_tracking_confidence=0.6
-        )
-        self.mp_drawing = mp.solutions.drawing_utils
+    def __init__(self, use_mediapipe=True, seed=None, config=None):
+        # Detection tuning and other performance knobs, one attribute per game_config.py field
+        # (see sweep_runner.py for offline tuning)
+        self.config = config or GameConfig()
+        self.config.apply(self)
+        self.predictor = None  # Optional GesturePredictor for early commits
+        
+        # Hand pose backend, MediaPipe by default (skipped for headless replay of recorded landmarks)
+        self.pose_backend = None
+        if use_mediapipe:
+            self.pose_backend = self.create_pose_backend()
         
         # Game variables
         self.player_score = 0
@@ -27,16 +42,22 @@ class EnhancedRockPaperScissorsGame:
         self.round_winner = None
         self.countdown_timer = 0
         self.last_gesture_time = 0
-        self.gesture_cooldown = 2.0  # seconds
         self.gesture_confidence = 0
-        self.best_of_5_mode = False
-        self.games_to_win = 3
+        self.waiting_since = None
         
-
+        # Match rules: 'b' toggles between free play and the target rules
+        self.match_rules = MatchRules()
+        self.target_rules = BestOfN(5)
+        self.window_name = '🎮 Enhanced Rock Paper Scissors Game 🎮'
         
         # Gesture definitions
         self.gestures = ["rock", "paper", "scissors"]
         
+        # Seeded RNG and injectable clock so sessions can be replayed exactly
+        self.seed = seed if seed is not None else random.randrange(2**32)
+        self.rng = random.Random(self.seed)
+        self.clock = time.time
+        
         # Enhanced color scheme with modern colors
         self.colors = {
             "white": (255, 255, 255),
@@ -60,12 +81,11 @@ class EnhancedRockPaperScissorsGame:
         
         # Gesture history for better detection
         self.gesture_history = []
-        self.history_size = 5
         
-        # Animation variables
-        self.animation_timer = 0
-        self.pulse_scale = 1.0
-        self.pulse_direction = 1
+        # Time-based animations (see effects.py), timed by the state machine's clock
+        self.effects = EffectsEngine()
+        self.frame_time = 0.0
+        self.winner_pop = 0.5  # seconds the winner banner animates before it joins the cached panels
         
         # UI state variables
         self.show_help = False
@@ -75,41 +95,67 @@ class EnhancedRockPaperScissorsGame:
         self.ui_alpha = 0.0
         self.fade_direction = 1
         
+        # Round events for logging, history and other asynchronous subscribers
+        self.events = EventBus()
+        self.detected_gesture = None
+        
+        # Streaming player analytics, fed from the event bus while the game runs
+        self.analytics = GameAnalytics()
+        self.show_analytics = False
+        
+        # Cached panel rendering and per-state render timings
+        self.dirty_renderer = DirtyRegionRenderer()
+        self.render_times = {}  # game state -> [frames, total seconds]
+        self.skeleton_renderer = self.create_skeleton_renderer()
+        
+    def create_pose_backend(self):
+        return create_backend(self.backend, self.min_detection_confidence, self.min_tracking_confidence,
+                              self.max_num_hands)
+    
+    def create_skeleton_renderer(self):
+        """Landmark rings at high render quality, bones only at low"""
+        return SkeletonRenderer(self.colors["cyan"], self.colors["gold"],
+                                circle_radius=3 if self.render_quality == "high" else 0,
+                                point_thickness=2, line_thickness=1)
+    
+    def apply_config(self, config):
+        """Switch to a new configuration; returns the scopes (live/graph/camera) that changed"""
+        changed = config.diff(self.config)
+        self.config = config
+        config.apply(self, changed)
+        scopes = {FIELDS[name].scope for name in changed}
+        
+        # Only a detection setting rebuilds the pose graph
+        if GRAPH in scopes and self.pose_backend:
+            self.pose_backend.close()
+            self.pose_backend = self.create_pose_backend()
+        if "render_quality" in changed:
+            self.skeleton_renderer = self.create_skeleton_renderer()
+        del self.gesture_history[:-self.history_size]
+        if changed:
+            print(f"🔁 Applied {', '.join(changed)}{' (rebuilt pose backend)' if GRAPH in scopes else ''}")
+        return scopes
+    
     def calculate_distance(self, point1, point2):
-        """Calculate Euclidean distance between two points"""
-        return math.sqrt((point1.x - point2.x)**2 + (point1.y - point2.y)**2)
+        """Calculate Euclidean distance between two landmark rows"""
+        return math.hypot(point1[0] - point2[0], point1[1] - point2[1])
     
     def get_gesture(self, hand_landmarks):
         """Enhanced gesture detection with confidence scoring"""
         if not hand_landmarks:
             return None, 0
             
-        # Get key landmarks
-        wrist = hand_landmarks.landmark[0]
-        thumb_tip = hand_landmarks.landmark[4]
-        index_tip = hand_landmarks.landmark[8]
-        middle_tip = hand_landmarks.landmark[12]
-        ring_tip = hand_landmarks.landmark[16]
-        pinky_tip = hand_landmarks.landmark[20]
-        
-        # Get finger pip (middle joint) landmarks
-        thumb_pip = hand_landmarks.landmark[3]
-        index_pip = hand_landmarks.landmark[6]
-        middle_pip = hand_landmarks.landmark[10]
-        ring_pip = hand_landmarks.landmark[14]
-        pinky_pip = hand_landmarks.landmark[18]
-        
-        # Calculate finger extension (tip y < pip y means extended)
+        points = hand_landmarks.points
+        
+        # Calculate finger extension (tip y < pip y means extended) for all four fingers at once
         # Add some tolerance for better detection
-        tolerance = 0.02
+        tolerance = self.extension_tolerance
         
-        index_extended = index_tip.y < (index_pip.y - tolerance)
-        middle_extended = middle_tip.y < (middle_pip.y - tolerance)
-        ring_extended = ring_tip.y < (ring_pip.y - tolerance)
-        pinky_extended = pinky_tip.y < (pinky_pip.y - tolerance)
+        index_extended, middle_extended, ring_extended, pinky_extended = \
+            (points[FINGER_PIPS, 1] - points[FINGER_TIPS, 1] > tolerance).tolist()
         
-        # Thumb detection (more complex due to different orientation)
-        thumb_extended = self.calculate_distance(thumb_tip, wrist) > self.calculate_distance(thumb_pip, wrist)
+        # Thumb detection (more complex due to different orientation): tip vs pip distance from the wrist
+        thumb_extended = self.calculate_distance(points[4], points[0]) > self.calculate_distance(points[3], points[0])
         
         # Gesture classification with confidence
         confidence = 0.0
@@ -199,81 +245,132 @@ class EnhancedRockPaperScissorsGame:
             self.computer_score += 1
     
     def check_game_winner(self):
-        """Check if someone has won the best of 5"""
-        if self.best_of_5_mode:
-            if self.player_score >= self.games_to_win:
-                return "player"
-            elif self.computer_score >= self.games_to_win:
-                return "computer"
-        return None
+        """Check if someone has won the match under the current rules"""
+        return self.match_rules.winner(self.player_score, self.computer_score)
     
-    def draw_gesture_icon(self, frame, x, y, gesture, size=60):
-        """Draw a visual icon for each gesture"""
-        if gesture == "rock":
-            # Draw fist icon (circle)
-            cv2.circle(frame, (x + size//2, y + size//2), size//2, self.colors["gold"], -1)
-            cv2.circle(frame, (x + size//2, y + size//2), size//2, self.colors["white"], 2)
-        elif gesture == "paper":
-            # Draw paper icon (rectangle)
-            cv2.rectangle(frame, (x, y), (x + size, y + size), self.colors["cyan"], -1)
-            cv2.rectangle(frame, (x, y), (x + size, y + size), self.colors["white"], 2)
-        elif gesture == "scissors":
-            # Draw scissors icon (two lines forming V)
-            cv2.line(frame, (x + 10, y + size - 10), (x + size//2, y + 10), self.colors["pink"], 4)
-            cv2.line(frame, (x + size - 10, y + size - 10), (x + size//2, y + 10), self.colors["pink"], 4)
-            cv2.circle(frame, (x + size//2, y + 10), 5, self.colors["white"], -1)
+    def settled_winner(self):
+        """The match winner once the banner has popped in and is drawn with the panels, else None"""
+        if self.frame_time - self.last_gesture_time < self.winner_pop:
+            return None
+        return self.check_game_winner()
     
     def draw_ui(self, frame, hand_landmarks):
         """Clean, organized UI with proper spacing and no overlapping elements"""
         height, width = frame.shape[:2]
         
-        # Update animation timer
-        self.animation_timer += 0.05
-        if self.animation_timer > 2 * np.pi:
-            self.animation_timer = 0
-        
-        # Update pulse animation
-        self.pulse_scale += 0.02 * self.pulse_direction
-        if self.pulse_scale > 1.1 or self.pulse_scale < 0.9:
-            self.pulse_direction *= -1
-        
-        # Draw hand landmarks with subtle styling
+        # Draw hand landmarks (one HandFrame or a list of them) with subtle styling
         if hand_landmarks:
-            landmark_spec = self.mp_drawing.DrawingSpec(
-                color=self.colors["cyan"], 
-                thickness=2, 
-                circle_radius=3
-            )
-            connection_spec = self.mp_drawing.DrawingSpec(
-                color=self.colors["gold"], 
-                thickness=1
-            )
-            
-            self.mp_drawing.draw_landmarks(
-                frame, 
-                hand_landmarks, 
-                self.mp_hands.HAND_CONNECTIONS,
-                landmark_spec,
-                connection_spec
-            )
-        
-        # Draw clean score panel on the right side (no overlap with center)
-        self.draw_clean_score_panel(frame, width, height)
+            self.skeleton_renderer.draw(frame, hand_landmarks)
         
-        # Draw game state in the center with proper spacing
-        self.draw_center_game_state(frame, width, height)
+        # Draw score panel (right) and game state (center), timed per state
+        render_start = time.perf_counter()
+        if self.dirty_renderer:
+            self.dirty_renderer.render(frame, self.get_panel_widgets(width, height))
+        else:
+            self.draw_clean_score_panel(frame, width, height)
+            self.draw_center_game_state(frame, width, height)
+            if self.show_analytics:
+                self.draw_analytics_panel(frame, self.analytics.profile("player"))
+            self.draw_clean_instructions(frame, width, height)
         
-        # Draw clean instructions at the bottom
-        self.draw_clean_instructions(frame, width, height)
+        # Animated prompt, icons, result and winner banner pop-in over the panels
+        self.effects.draw(frame, self.frame_time, self.get_effect_layers(width, height))
+        self.record_render_time(time.perf_counter() - render_start)
         
         # Draw help overlay if requested
         if self.show_help:
             self.draw_help_overlay(frame)
         
-        # Draw progress bar for best of 5 mode (top right)
-        if self.best_of_5_mode:
+        # Draw match progress bar (top right)
+        if self.match_rules.target:
             self.draw_progress_bar(frame, width, height)
     
+    def get_panel_widgets(self, width, height):
+        """Describe the score and center panels as widgets for the dirty-region renderer"""
+        center_x = width // 2
+        center_y = height // 2
+        
+        score_key = (self.player_score, self.computer_score, self.round_count,
+                     round(self.gesture_confidence, 2))
+        game_winner = self.check_game_winner()
+        state_key = (self.game_state, self.player_gesture, self.computer_gesture,
+                     self.round_winner, int(self.countdown_timer), game_winner)
+        # The center band covers the state boxes plus the gesture examples below them
+        center_band = (0, center_y - 70, width, center_y + 145)
+        
+        widgets = [
+            ("score", (width - 210, 0, width, 330), score_key,
+             lambda roi, x0, y0: self.draw_clean_score_panel(roi, width - x0, height - y0)),
+            ("state", center_band, state_key,
+             lambda roi, x0, y0: self.draw_state_panel(roi, center_x - x0, center_y - y0))
+        ]
+        
+        # The winner banner is an effect while it pops in, then it is as static as the panels
+        settled_winner = self.settled_winner()
+        if settled_winner:
+            widgets.append(("winner", center_band, settled_winner,
+                            lambda roi, x0, y0: self.draw_game_winner(roi, center_x - x0, center_y - y0, settled_winner)))
+        
+        if self.show_analytics:
+            profile = self.analytics.profile("player")
+            widgets.append(("analytics", (0, 0, 230, 165), profile.revision,
+                            lambda roi, x0, y0: self.draw_analytics_panel(roi, profile)))
+        
+        # The instruction bar never changes
+        widgets.append(("instructions", (0, height - 60, width, height), None,
+                        lambda roi, x0, y0: self.draw_clean_instructions(roi, width - x0, height - y0)))
+        return widgets
+    
+    def get_effect_layers(self, width, height):
+        """Effects for this frame as (key, build, start) layers, keyed by everything their sprites show"""
+        center_x = width // 2
+        center_y = height // 2
+        layers = []
+        game_winner = self.check_game_winner()
+        
+        if self.game_state == "waiting" and not game_winner:
+            # Pulsing prompt over the waiting box, with the example icons hopping in turn
+            box_x = center_x - 175
+            box_y = center_y - 50
+            start = self.waiting_since or 0.0
+            layers.append((("prompt", box_x, box_y), lambda: PulsingText(
+                "Show your gesture!", (box_x + 50, box_y + 60), 1.2, self.colors["white"], 3), start))
+            for i, gesture in enumerate(self.gestures):
+                anchor = (box_x + i * 110 + 20, box_y + 140)
+                layers.append((("icon", gesture, anchor), lambda gesture=gesture, anchor=anchor, i=i: IconBounce(
+                    self.gesture_sprite(gesture, 40), anchor, height=8, delay=0.15 * i), start))
+        elif self.game_state == "result":
+            # The round result pops in over its box
+            text, color = self.result_style()[::2]
+            org = (center_x - 120, center_y + 10)
+            layers.append((("result", text, org), lambda: PopIn(
+                text_sprite(text, 1.4, color, 3), text_center(text, org, 1.4, 3)), self.last_gesture_time))
+        
+        # The match winner banner pops in on top of everything, then stays with the panels until 'r'
+        if game_winner and not self.settled_winner():
+            layers.append((("winner", game_winner, center_x, center_y), lambda: PopIn(
+                render_sprite((470, 140), lambda canvas: self.draw_game_winner(canvas, 235, 70, game_winner)),
+                (center_x, center_y), duration=self.winner_pop), self.last_gesture_time))
+        return layers
+    
+    def gesture_sprite(self, gesture, size):
+        """A gesture icon rasterized once, centered on the icon"""
+        return render_sprite((size + 8, size + 8), lambda canvas: self.draw_gesture_icon(canvas, 4, 4, gesture, size))
+    
+    def record_render_time(self, seconds):
+        """Accumulate panel render time for the current game state"""
+        stats = self.render_times.setdefault(self.game_state, [0, 0.0])
+        stats[0] += 1
+        stats[1] += seconds
+    
+    def print_render_stats(self):
+        """Print the average panel render time per game state"""
+        if not self.render_times:
+            return
+        print("⏱️  Panel render time per state:")
+        for state, (frames, total) in self.render_times.items():
+            print(f"  {state:<10} {total / frames * 1000:.3f} ms avg over {frames} frames")
+    
     def draw_clean_score_panel(self, frame, width, height):
         """Draw a clean, organized score panel on the right side"""
         panel_width = 180
@@ -288,30 +385,30 @@ class EnhancedRockPaperScissorsGame:
         
         # Player score
         score_y = panel_y + 30
-        cv2.putText(frame, "PLAYER", (panel_x + 10, score_y), 
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.6, self.colors["lime"], 2)
-        cv2.putText(frame, str(self.player_score), (panel_x + 10, score_y + 40), 
-                   cv2.FONT_HERSHEY_SIMPLEX, 1.5, self.colors["lime"], 3)
+        put_text(frame, "PLAYER", (panel_x + 10, score_y), 
+               cv2.FONT_HERSHEY_SIMPLEX, 0.6, self.colors["lime"], 2)
+        put_text(frame, str(self.player_score), (panel_x + 10, score_y + 40), 
+               cv2.FONT_HERSHEY_SIMPLEX, 1.5, self.colors["lime"], 3)
         
         # Computer score
         score_y += 70
-        cv2.putText(frame, "COMPUTER", (panel_x + 10, score_y), 
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.6, self.colors["red"], 2)
-        cv2.putText(frame, str(self.computer_score), (panel_x + 10, score_y + 40), 
-                   cv2.FONT_HERSHEY_SIMPLEX, 1.5, self.colors["red"], 3)
+        put_text(frame, "COMPUTER", (panel_x + 10, score_y), 
+               cv2.FONT_HERSHEY_SIMPLEX, 0.6, self.colors["red"], 2)
+        put_text(frame, str(self.computer_score), (panel_x + 10, score_y + 40), 
+               cv2.FONT_HERSHEY_SIMPLEX, 1.5, self.colors["red"], 3)
         
         # Round counter
         score_y += 70
-        cv2.putText(frame, "ROUND", (panel_x + 10, score_y), 
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.6, self.colors["white"], 2)
-        cv2.putText(frame, str(self.round_count), (panel_x + 10, score_y + 40), 
-                   cv2.FONT_HERSHEY_SIMPLEX, 1.5, self.colors["white"], 3)
+        put_text(frame, "ROUND", (panel_x + 10, score_y), 
+               cv2.FONT_HERSHEY_SIMPLEX, 0.6, self.colors["white"], 2)
+        put_text(frame, str(self.round_count), (panel_x + 10, score_y + 40), 
+               cv2.FONT_HERSHEY_SIMPLEX, 1.5, self.colors["white"], 3)
         
         # Confidence indicator (only when available)
         if self.gesture_confidence > 0:
             score_y += 70
-            cv2.putText(frame, "CONFIDENCE", (panel_x + 10, score_y), 
-                       cv2.FONT_HERSHEY_SIMPLEX, 0.5, self.colors["yellow"], 2)
+            put_text(frame, "CONFIDENCE", (panel_x + 10, score_y), 
+                   cv2.FONT_HERSHEY_SIMPLEX, 0.5, self.colors["yellow"], 2)
             
             # Confidence bar
             bar_width = 150
@@ -332,14 +429,53 @@ class EnhancedRockPaperScissorsGame:
                          confidence_color, -1)
             
             # Percentage text
-            cv2.putText(frame, f"{self.gesture_confidence:.0%}", (bar_x + 60, bar_y + 25), 
-                       cv2.FONT_HERSHEY_SIMPLEX, 0.4, self.colors["white"], 1)
+            put_text(frame, f"{self.gesture_confidence:.0%}", (bar_x + 60, bar_y + 25), 
+                   cv2.FONT_HERSHEY_SIMPLEX, 0.4, self.colors["white"], 1)
     
-    def draw_center_game_state(self, frame, width, height):
-        """Draw the main game state in the center with proper spacing"""
-        center_x = width // 2
-        center_y = height // 2
+    def draw_analytics_panel(self, frame, profile):
+        """Draw live player statistics in the top left corner"""
+        panel_x = 20
+        panel_y = 20
+        panel_width = 200
+        panel_height = 135
+        
+        cv2.rectangle(frame, (panel_x, panel_y), (panel_x + panel_width, panel_y + panel_height), 
+                     self.colors["navy"], -1)
+        cv2.rectangle(frame, (panel_x, panel_y), (panel_x + panel_width, panel_y + panel_height), 
+                     self.colors["white"], 2)
+        put_text(frame, "STATS", (panel_x + 10, panel_y + 22), 
+               cv2.FONT_HERSHEY_SIMPLEX, 0.6, self.colors["gold"], 2)
         
+        # Gesture distribution bars
+        bar_y = panel_y + 35
+        for gesture, share in profile.distribution().items():
+            put_text(frame, gesture.upper(), (panel_x + 10, bar_y + 10), 
+                   cv2.FONT_HERSHEY_SIMPLEX, 0.4, self.colors["white"], 1)
+            cv2.rectangle(frame, (panel_x + 90, bar_y), (panel_x + 90 + int(70 * share), bar_y + 10), 
+                         self.colors["cyan"], -1)
+            put_text(frame, f"{share:.0%}", (panel_x + 165, bar_y + 10), 
+                   cv2.FONT_HERSHEY_SIMPLEX, 0.35, self.colors["white"], 1)
+            bar_y += 18
+        
+        # Reaction time and confidence
+        reaction = f"{profile.reaction.mean:.1f}s" if profile.reaction.count else "-"
+        confidence = f"{profile.confidence.mean:.0%}" if profile.confidence.count else "-"
+        put_text(frame, f"Reaction {reaction}  Conf {confidence}", (panel_x + 10, bar_y + 14), 
+               cv2.FONT_HERSHEY_SIMPLEX, 0.4, self.colors["yellow"], 1)
+        
+        likely_next = profile.likely_next()
+        put_text(frame, f"Likely next: {likely_next.upper() if likely_next else '-'}", (panel_x + 10, bar_y + 34), 
+               cv2.FONT_HERSHEY_SIMPLEX, 0.4, self.colors["lime"], 1)
+    
+    def draw_center_game_state(self, frame, width, height):
+        """Draw the main game state in the center with proper spacing (the winner banner pops in as an effect)"""
+        self.draw_state_panel(frame, width // 2, height // 2)
+        settled_winner = self.settled_winner()
+        if settled_winner:
+            self.draw_game_winner(frame, width // 2, height // 2, settled_winner)
+    
+    def draw_state_panel(self, frame, center_x, center_y):
+        """Dispatch to the drawing routine for the current game state"""
         if self.game_state == "waiting":
             self.draw_waiting_state(frame, center_x, center_y)
         elif self.game_state == "playing":
@@ -348,11 +484,6 @@ class EnhancedRockPaperScissorsGame:
             self.draw_result_state(frame, center_x, center_y)
         elif self.game_state == "countdown":
             self.draw_countdown_state(frame, center_x, center_y)
-        
-        # Check for game winner
-        game_winner = self.check_game_winner()
-        if game_winner:
-            self.draw_game_winner(frame, center_x, center_y, game_winner)
     
     def draw_waiting_state(self, frame, center_x, center_y):
         """Draw clean waiting state"""
@@ -368,19 +499,18 @@ class EnhancedRockPaperScissorsGame:
         cv2.rectangle(frame, (box_x, box_y), (box_x + box_width, box_y + box_height), 
                      self.colors["cyan"], 3)
         
-        # Instruction text
-        cv2.putText(frame, "Show your gesture!", (box_x + 50, box_y + 60), 
-                   cv2.FONT_HERSHEY_SIMPLEX, 1.2, self.colors["white"], 3)
-        
-        # Gesture examples below (smaller and organized)
+        # Gesture names below (the prompt and the icons above them are animated effects,
+        # but the icons stand still once a winner banner covers the box)
         examples_y = box_y + box_height + 20
+        game_winner = self.check_game_winner()
         for i, gesture in enumerate(self.gestures):
             icon_x = box_x + i * 110
-            self.draw_gesture_icon(frame, icon_x, examples_y, gesture, 40)
+            if game_winner:
+                self.draw_gesture_icon(frame, icon_x, examples_y, gesture, 40)
             
             # Gesture name
-            cv2.putText(frame, gesture.upper(), (icon_x + 10, examples_y + 60), 
-                       cv2.FONT_HERSHEY_SIMPLEX, 0.4, self.colors["white"], 1)
+            put_text(frame, gesture.upper(), (icon_x + 10, examples_y + 60), 
+                   cv2.FONT_HERSHEY_SIMPLEX, 0.4, self.colors["white"], 1)
     
     def draw_playing_state(self, frame, center_x, center_y):
         """Draw clean playing state"""
@@ -403,53 +533,45 @@ class EnhancedRockPaperScissorsGame:
         player_x = box_x + 30
         player_y = box_y + 30
         self.draw_gesture_icon(frame, player_x, player_y, self.player_gesture, 60)
-        cv2.putText(frame, "YOU", (player_x + 15, player_y + 80), 
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.6, self.colors["lime"], 2)
+        put_text(frame, "YOU", (player_x + 15, player_y + 80), 
+               cv2.FONT_HERSHEY_SIMPLEX, 0.6, self.colors["lime"], 2)
         
         # VS text
         vs_x = center_x - 20
         vs_y = center_y + 10
-        cv2.putText(frame, "VS", (vs_x, vs_y), 
-                   cv2.FONT_HERSHEY_SIMPLEX, 1.2, self.colors["gold"], 3)
+        put_text(frame, "VS", (vs_x, vs_y), 
+               cv2.FONT_HERSHEY_SIMPLEX, 1.2, self.colors["gold"], 3)
         
         # Computer move (right)
         computer_x = box_x + box_width - 90
         computer_y = box_y + 30
         self.draw_gesture_icon(frame, computer_x, computer_y, self.computer_gesture, 60)
-        cv2.putText(frame, "CPU", (computer_x + 15, computer_y + 80), 
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.6, self.colors["red"], 2)
+        put_text(frame, "CPU", (computer_x + 15, computer_y + 80), 
+               cv2.FONT_HERSHEY_SIMPLEX, 0.6, self.colors["red"], 2)
+    
+    def result_style(self):
+        """(text, background color, text color) for the round result"""
+        if self.round_winner == "player":
+            return "YOU WIN!", self.colors["navy"], self.colors["lime"]
+        elif self.round_winner == "computer":
+            return "COMPUTER WINS!", self.colors["maroon"], self.colors["red"]
+        else:
+            return "IT'S A TIE!", self.colors["teal"], self.colors["gold"]
     
     def draw_result_state(self, frame, center_x, center_y):
-        """Draw clean result state"""
+        """Draw clean result state (the result text pops in as an effect)"""
         # Result box
         box_width = 300
         box_height = 100
         box_x = center_x - box_width // 2
         box_y = center_y - box_height // 2
         
-        # Determine result styling
-        if self.round_winner == "player":
-            result_text = "YOU WIN!"
-            bg_color = self.colors["navy"]
-            text_color = self.colors["lime"]
-        elif self.round_winner == "computer":
-            result_text = "COMPUTER WINS!"
-            bg_color = self.colors["maroon"]
-            text_color = self.colors["red"]
-        else:
-            result_text = "IT'S A TIE!"
-            bg_color = self.colors["teal"]
-            text_color = self.colors["gold"]
-        
         # Clean background
+        _, bg_color, text_color = self.result_style()
         cv2.rectangle(frame, (box_x, box_y), (box_x + box_width, box_y + box_height), 
                      bg_color, -1)
         cv2.rectangle(frame, (box_x, box_y), (box_x + box_width, box_y + box_height), 
                      text_color, 3)
-        
-        # Result text
-        cv2.putText(frame, result_text, (box_x + 30, box_y + 60), 
-                   cv2.FONT_HERSHEY_SIMPLEX, 1.4, text_color, 3)
     
     def draw_countdown_state(self, frame, center_x, center_y):
         """Draw clean countdown state"""
@@ -467,8 +589,8 @@ class EnhancedRockPaperScissorsGame:
         
         # Countdown text
         countdown_text = f"Next round in: {int(self.countdown_timer)}"
-        cv2.putText(frame, countdown_text, (box_x + 30, box_y + 50), 
-                   cv2.FONT_HERSHEY_SIMPLEX, 1.0, self.colors["white"], 2)
+        put_text(frame, countdown_text, (box_x + 30, box_y + 50), 
+               cv2.FONT_HERSHEY_SIMPLEX, 1.0, self.colors["white"], 2)
     
     def draw_game_winner(self, frame, center_x, center_y, winner):
         """Draw clean game winner announcement"""
@@ -488,12 +610,12 @@ class EnhancedRockPaperScissorsGame:
         winner_text = f"{winner.upper()} WINS THE GAME!"
         winner_color = self.colors["lime"] if winner == "player" else self.colors["red"]
         
-        cv2.putText(frame, winner_text, (box_x + 30, box_y + 60), 
-                   cv2.FONT_HERSHEY_SIMPLEX, 1.2, winner_color, 3)
+        put_text(frame, winner_text, (box_x + 30, box_y + 60), 
+               cv2.FONT_HERSHEY_SIMPLEX, 1.2, winner_color, 3)
         
         # Play again instruction
-        cv2.putText(frame, "Press 'r' to play again!", (box_x + 80, box_y + 90), 
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.6, self.colors["black"], 2)
+        put_text(frame, "Press 'r' to play again!", (box_x + 80, box_y + 90), 
+               cv2.FONT_HERSHEY_SIMPLEX, 0.6, self.colors["black"], 2)
     
     def draw_clean_instructions(self, frame, width, height):
         """Draw clean instructions at the bottom"""
@@ -506,7 +628,7 @@ class EnhancedRockPaperScissorsGame:
         cv2.rectangle(frame, (0, bar_y), (width, height), self.colors["white"], 2)
         
         # Instructions text (centered and complete)
-        instructions_text = "Press 'q' to quit, 'r' to reset, 'b' for best of 5, 'h' for help"
+        instructions_text = "Press 'q' to quit, 'r' to reset, 'b' for match mode, 'a' for stats, 'h' for help"
         
         # Calculate text size to ensure it fits
         font_scale = 0.6
@@ -524,11 +646,11 @@ class EnhancedRockPaperScissorsGame:
         text_x = (width - text_width) // 2
         text_y = bar_y + (bar_height + text_height) // 2
         
-        cv2.putText(frame, instructions_text, (text_x, text_y), 
-                   cv2.FONT_HERSHEY_SIMPLEX, font_scale, self.colors["white"], thickness)
+        put_text(frame, instructions_text, (text_x, text_y), 
+               cv2.FONT_HERSHEY_SIMPLEX, font_scale, self.colors["white"], thickness)
     
     def draw_progress_bar(self, frame, width, height):
-        """Draw clean progress bar for best of 5 mode"""
+        """Draw clean progress bar for the current match rules"""
         bar_width = 200
         bar_height = 12
         bar_x = width - bar_width - 20
@@ -541,9 +663,8 @@ class EnhancedRockPaperScissorsGame:
                      self.colors["white"], 1)
         
         # Progress calculation
-        total_games = self.games_to_win
-        current_progress = max(self.player_score, self.computer_score)
-        progress_ratio = current_progress / total_games
+        current_progress, total_games = self.match_rules.progress(self.player_score, self.computer_score)
+        progress_ratio = min(current_progress / total_games, 1.0)
         
         # Filled progress
         fill_width = int(bar_width * progress_ratio)
@@ -553,9 +674,9 @@ class EnhancedRockPaperScissorsGame:
                      progress_color, -1)
         
         # Progress text
-        progress_text = f"Best of 5: {current_progress}/{total_games}"
-        cv2.putText(frame, progress_text, (bar_x, bar_y + 25), 
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.4, self.colors["white"], 1)
+        progress_text = f"{self.match_rules.name}: {current_progress}/{total_games}"
+        put_text(frame, progress_text, (bar_x, bar_y + 25), 
+               cv2.FONT_HERSHEY_SIMPLEX, 0.4, self.colors["white"], 1)
     
     def draw_help_overlay(self, frame):
         """Draw a help overlay with game instructions"""
@@ -579,8 +700,8 @@ class EnhancedRockPaperScissorsGame:
                      self.colors["gold"], 3)
         
         # Title
-        cv2.putText(frame, "GAME HELP", (help_x + 200, help_y + 40), 
-                   cv2.FONT_HERSHEY_SIMPLEX, 1.2, self.colors["gold"], 3)
+        put_text(frame, "GAME HELP", (help_x + 200, help_y + 40), 
+               cv2.FONT_HERSHEY_SIMPLEX, 1.2, self.colors["gold"], 3)
         
         # Help content
         help_lines = [
@@ -592,7 +713,8 @@ class EnhancedRockPaperScissorsGame:
             "CONTROLS:",
             "• 'q' - Quit the game",
             "• 'r' - Reset scores",
-            "• 'b' - Toggle best of 5 mode",
+            "• 'b' - Toggle match mode",
+            "• 'a' - Show/hide player stats",
             "• 'h' - Show/hide this help",
             "",
             "TIPS:",
@@ -614,141 +736,264 @@ class EnhancedRockPaperScissorsGame:
                 color = self.colors["white"]
                 font_scale = 0.6
             
-            cv2.putText(frame, line, (help_x + 20, y_offset), 
-                       cv2.FONT_HERSHEY_SIMPLEX, font_scale, color, 2)
+            put_text(frame, line, (help_x + 20, y_offset), 
+                   cv2.FONT_HERSHEY_SIMPLEX, font_scale, color, 2)
             y_offset += 30
         
         # Close instruction
-        cv2.putText(frame, "Press 'h' again to close", (help_x + 180, help_y + 450), 
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.6, self.colors["cyan"], 2)
+        put_text(frame, "Press 'h' again to close", (help_x + 180, help_y + 450), 
+               cv2.FONT_HERSHEY_SIMPLEX, 0.6, self.colors["cyan"], 2)
     
-    def draw_progress_bar(self, frame):
-        """Draw a progress bar showing game progress"""
-        height, width = frame.shape[:2]
-        
-        # Progress bar for best of 5 mode
-        if self.best_of_5_mode:
-            bar_width = 300
-            bar_height = 15
-            bar_x = width - bar_width - 20
-            bar_y = 20
-            
-            # Background bar
-            cv2.rectangle(frame, (bar_x, bar_y), (bar_x + bar_width, bar_y + bar_height), 
-                         self.colors["black"], -1)
-            cv2.rectangle(frame, (bar_x, bar_y), (bar_x + bar_width, bar_y + bar_height), 
-                         self.colors["white"], 2)
-            
-            # Progress calculation
-            total_games = self.games_to_win
-            current_progress = max(self.player_score, self.computer_score)
-            progress_ratio = current_progress / total_games
-            
-            # Filled progress
-            fill_width = int(bar_width * progress_ratio)
-            progress_color = self.colors["lime"] if self.player_score > self.computer_score else self.colors["red"]
+    def update_game_state(self, hand_landmarks, current_time):
+        """Advance the round state machine by one frame"""
+        self.frame_time = current_time
+        if self.game_state == "waiting":
+            if self.waiting_since is None:
+                self.waiting_since = current_time
             
-            cv2.rectangle(frame, (bar_x, bar_y), (bar_x + fill_width, bar_y + bar_height), 
-                         progress_color, -1)
+            if hand_landmarks:
+                gesture, confidence = self.get_gesture(hand_landmarks)
+                
+                if gesture != self.detected_gesture:
+                    self.detected_gesture = gesture
+                    self.events.publish(GestureDetected(gesture, confidence, current_time))
+                
+                # A finished match waits for 'r' before playing on
+                if self.check_game_winner():
+                    return
+                
+                # Early commit: a confident prediction of where the hand is heading
+                if self.predictor:
+                    predicted, predicted_confidence = self.predictor.update(hand_landmarks, current_time)
+                    if predicted and predicted_confidence > confidence:
+                        gesture, confidence = predicted, predicted_confidence
+                
+                if gesture and confidence > self.commit_confidence and (current_time - self.last_gesture_time) > self.gesture_cooldown:
+                    self.commit_round(gesture, confidence, current_time)
+                    return
             
-            # Progress text
-            progress_text = f"Best of 5: {current_progress}/{total_games}"
-            cv2.putText(frame, progress_text, (bar_x, bar_y + 30), 
-                       cv2.FONT_HERSHEY_SIMPLEX, 0.6, self.colors["white"], 2)
+            # Timed rounds: no gesture in time forfeits the round to the computer
+            time_limit = self.match_rules.round_time_limit
+            if time_limit and not self.check_game_winner() and current_time - self.waiting_since > time_limit:
+                self.commit_round(None, 0, current_time)
+                    
+        elif self.game_state == "result":
+            # Show result for 2 seconds
+            if current_time - self.last_gesture_time > 2.0:
+                self.game_state = "countdown"
+                self.countdown_timer = 3.0
+                
+        elif self.game_state == "countdown":
+            self.countdown_timer -= 0.05  # Adjust for frame rate
+            if self.countdown_timer <= 0:
+                self.game_state = "waiting"
+                self.waiting_since = current_time
+                self.player_gesture = None
+                self.computer_gesture = None
+                self.gesture_confidence = 0
     
+    def commit_round(self, gesture, confidence, current_time):
+        """Play the computer's move against the player's gesture (None forfeits)"""
+        self.player_gesture = gesture
+        self.computer_gesture = self.rng.choice(self.gestures)
+        if gesture:
+            self.round_winner = self.determine_winner(self.player_gesture, self.computer_gesture)
+        else:
+            self.round_winner = "computer"
+        self.update_scores(self.round_winner)
+        self.round_count += 1
+        self.game_state = "result"
+        self.last_gesture_time = current_time
+        self.gesture_confidence = confidence
+        
+        # Update gesture history
+        self.update_gesture_history(gesture)
+        self.detected_gesture = None
+        
+        reaction_time = current_time - self.waiting_since if self.waiting_since is not None else None
+        self.events.publish(RoundCommitted(
+            self.round_count, gesture, self.computer_gesture, self.round_winner,
+            confidence, self.player_score, self.computer_score, reaction_time, current_time))
+        match_winner = self.check_game_winner()
+        if match_winner:
+            self.events.publish(MatchWon(match_winner, self.player_score, self.computer_score, current_time))
+    
+    def handle_key(self, key, current_time):
+        """React to a key press; returns False when the game should quit"""
+        if key == 'q':
+            return False
+        elif key == 'r':
+            self.reset_game()
+        elif key == 'b':
+            self.toggle_match_mode()
+        elif key == 'a':
+            self.show_analytics = not self.show_analytics
+        elif key == 'h':
+            self.show_help = not self.show_help
+            if self.show_help:
+                self.help_timer = current_time
+        return True
     
+    def configure_idle(self, idle, owned):
+        """Create, retune or drop the config-driven idle controller (one passed in is only retuned)"""
+        if idle is None and owned and self.idle_after:
+            from idle_mode import IdleController
+            idle = IdleController(self.idle_after, self.idle_fps)
+        elif idle is not None and owned and not self.idle_after:
+            idle.report()
+            idle = None
+        elif idle is not None and self.idle_after:
+            idle.idle_after = self.idle_after
+            idle.idle_interval = 1.0 / self.idle_fps
+        return idle
     
-    def run_game(self):
+    def run_game(self, display=None, recorder=None, monitor=None, inputs=None, idle=None, capture=None,
+                 watcher=None, metrics=None):
         """Enhanced main game loop"""
-        cap = cv2.VideoCapture(0)
-        
-        if not cap.isOpened():
-            print("Error: Could not open webcam")
-            return
-        
-        print("🎮 Enhanced Rock Paper Scissors Game Started! 🎮")
-        print("✨ Show your hand gesture to play! ✨")
-        print("🎯 Controls:")
-        print("  'q' - Quit game")
-        print("  'r' - Reset scores")
-        print("  'b' - Toggle best of 5 mode")
-        print("  'h' - Show/hide help")
-        
-        while True:
-            ret, frame = cap.read()
-            if not ret:
-                print("Error: Could not read frame")
-                break
+        cap = capture or open_camera(self.camera_index, self.capture_settings)
+        subscriptions = []
+        started = False
+        
+        try:
+            if not cap.isOpened():
+                print("Error: Could not open webcam")
+                return
             
-            # Flip frame horizontally for mirror effect
-            frame = cv2.flip(frame, 1)
+            print("🎮 Enhanced Rock Paper Scissors Game Started! 🎮")
+            print("✨ Show your hand gesture to play! ✨")
+            print("🎯 Controls:")
+            print("  'q' - Quit game")
+            print("  'r' - Reset scores")
+            print(f"  'b' - Toggle {self.target_rules.name} mode")
+            print("  'a' - Show/hide player stats")
+            print("  'h' - Show/hide help")
             
-            # Convert to RGB for MediaPipe
-            rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-            results = self.hands.process(rgb_frame)
+            display = display or create_display(None, self.window_name)
+            subscriptions.append(self.events.subscribe(ConsoleLogger(), (RoundCommitted, MatchWon)))
+            subscriptions.append(self.events.subscribe(self.analytics, (RoundCommitted, MatchWon, Reset)))
+            if monitor:
+                monitor.start()
+            if metrics:
+                metrics.watch_capture(cap)
+                subscriptions.append(self.events.subscribe(metrics, (RoundCommitted,)))
+            own_idle = idle is None
+            idle = self.configure_idle(idle, own_idle)
+            started = True
+            last_hand = None
+            next_inference = 0.0
+            running = True
+            while running:
+                frame_start = time.perf_counter()
+                ret, frame = cap.read()
+                if not ret:
+                    print("Error: Could not read frame")
+                    break
+                
+                # Flip frame horizontally for mirror effect
+                frame = cv2.flip(frame, 1)
+                captured = time.perf_counter()
+                
+                # Nobody in front of the kiosk: skip inference and the UI until there is motion
+                awake = idle is None or idle.update(frame)
+                
+                # Hand landmarks as a HandFrame array; everything downstream reads the array
+                # Between inferences capped by inference_rate the last hand stands in
+                hand_landmarks = None
+                inference = False
+                if awake:
+                    now = time.monotonic()
+                    if now >= next_inference:
+                        inference = True
+                        last_hand = self.pose_backend.detect(frame)
+                        if self.inference_rate:
+                            next_inference = max(next_inference + 1.0 / self.inference_rate, now)
+                    hand_landmarks = last_hand
+                else:
+                    last_hand = None
+                inferred = time.perf_counter()
+                
+                current_time = self.clock()
+                
+                # Game state machine (a hand showing a command pose is not played)
+                played_landmarks = hand_landmarks
+                if inputs and inputs.gestures and inputs.gestures.observe(hand_landmarks, current_time):
+                    played_landmarks = None
+                self.update_game_state(played_landmarks, current_time)
+                
+                # Draw UI
+                if awake:
+                    self.draw_ui(frame, hand_landmarks)
+                else:
+                    idle.draw_attract(frame, self.colors)
+                rendered = time.perf_counter()
+                
+                # Display frame
+                display.show(frame)
+                if metrics:
+                    metrics.record_frame(frame_start, captured, inferred, rendered, time.perf_counter(),
+                                         hand_landmarks, inference, not awake)
+                
+                # Handle key presses from the display and the input threads
+                events = display.poll_events()
+                if inputs:
+                    events.extend(inputs.poll_events())
+                keys = [event.key for event in events]
+                for key in keys:
+                    running = running and self.handle_key(key, current_time)
+                
+                if recorder:
+                    score = hand_landmarks.score if hand_landmarks else 0.0
+                    recorder.capture(self, current_time, played_landmarks, score, keys)
+                if monitor:
+                    monitor.sample()
+                if idle:
+                    if hand_landmarks or keys:
+                        idle.activity()
+                    idle.throttle()
+                
+                # Hot reload: live settings apply in place; the camera is only reopened if we opened it
+                new_config = watcher.poll(time.monotonic()) if watcher else None
+                if new_config:
+                    scopes = self.apply_config(new_config)
+                    if CAMERA in scopes and capture is None:
+                        cap.release()
+                        cap = open_camera(self.camera_index, self.capture_settings)
+                        if metrics:
+                            metrics.watch_capture(cap)
+                    idle = self.configure_idle(idle, own_idle)
+                    next_inference = 0.0
+        finally:
+            # Release the camera, the display and the terminal even after an early return or an error
+            cap.release()
+            if display:
+                display.close()
+            if inputs:
+                inputs.close()
             
-            current_time = time.time()
+            # This run's subscribers go first, so calling run_game again does not add a second set
+            for subscription in subscriptions:
+                self.events.unsubscribe(subscription)
+            if self.pose_backend:
+                self.pose_backend.report()
+            self.close()
+            self.events.close()
             
-            # Game state machine
-            if self.game_state == "waiting":
-                if results.multi_hand_landmarks:
-                    hand_landmarks = results.multi_hand_landmarks[0]
-                    gesture, confidence = self.get_gesture(hand_landmarks)
-                    
-                    if gesture and confidence > 0.7 and (current_time - self.last_gesture_time) > self.gesture_cooldown:
-                        self.player_gesture = gesture
-                        self.computer_gesture = random.choice(self.gestures)
-                        self.round_winner = self.determine_winner(self.player_gesture, self.computer_gesture)
-                        self.update_scores(self.round_winner)
-                        self.round_count += 1
-                        self.game_state = "result"
-                        self.last_gesture_time = current_time
-                        self.gesture_confidence = confidence
-                        
-                        # Update gesture history
-                        self.update_gesture_history(gesture)
-                        
-                        print(f"🎲 Round {self.round_count}: You played {gesture}, Computer played {self.computer_gesture}")
-                        print(f"🏆 Result: {self.round_winner}")
-                        
-            elif self.game_state == "result":
-                # Show result for 2 seconds
-                if current_time - self.last_gesture_time > 2.0:
-                    self.game_state = "countdown"
-                    self.countdown_timer = 3.0
-                    
-            elif self.game_state == "countdown":
-                self.countdown_timer -= 0.05  # Adjust for frame rate
-                if self.countdown_timer <= 0:
-                    self.game_state = "waiting"
-                    self.player_gesture = None
-                    self.computer_gesture = None
-                    self.gesture_confidence = 0
-            
-            # Draw UI
-            hand_landmarks = results.multi_hand_landmarks[0] if results.multi_hand_landmarks else None
-            self.draw_ui(frame, hand_landmarks)
-            
-            # Display frame
-            cv2.imshow('🎮 Enhanced Rock Paper Scissors Game 🎮', frame)
-            
-            # Handle key presses
-            key = cv2.waitKey(1) & 0xFF
-            if key == ord('q'):
-                break
-            elif key == ord('r'):
-                self.reset_game()
-            elif key == ord('b'):
-                self.toggle_best_of_5()
-            elif key == ord('h'):
-                self.show_help = not self.show_help
-                if self.show_help:
-                    self.help_timer = current_time
-        
-        # Cleanup
-        cap.release()
-        cv2.destroyAllWindows()
-        self.hands.close()
+            # Reports and the session recording only exist once the loop got going
+            if started:
+                self.print_render_stats()
+                if recorder:
+                    recorder.save()
+                if monitor:
+                    monitor.report()
+                    monitor.stop()
+                if idle:
+                    idle.report()
+    
+    def close(self):
+        """Release the pose backend if one was created"""
+        if self.pose_backend:
+            self.pose_backend.close()
+            self.pose_backend = None
     
     def reset_game(self):
         """Reset the game scores and state"""
@@ -761,25 +1006,106 @@ class EnhancedRockPaperScissorsGame:
         self.round_winner = None
         self.gesture_confidence = 0
         self.gesture_history.clear()
-        
-
+        self.detected_gesture = None
+        self.waiting_since = None
+        self.events.publish(Reset())
         
         print("🔄 Game reset!")
     
-    def toggle_best_of_5(self):
-        """Toggle between regular mode and best of 5 mode"""
-        self.best_of_5_mode = not self.best_of_5_mode
-        mode_text = "Best of 5" if self.best_of_5_mode else "Regular"
-        print(f"🎯 Switched to {mode_text} mode!")
+    def set_match_rules(self, rules):
+        """Switch to new match rules and start a fresh match"""
+        self.match_rules = rules
+        print(f"🎯 Switched to {rules.name} mode!")
         self.reset_game()
+    
+    def toggle_match_mode(self):
+        """Toggle between regular mode and the configured match rules"""
+        if self.match_rules is self.target_rules:
+            self.set_match_rules(MatchRules())
+        else:
+            self.set_match_rules(self.target_rules)
 
 if __name__ == "__main__":
-    game = EnhancedRockPaperScissorsGame()
+    parser = argparse.ArgumentParser(description="Enhanced Rock Paper Scissors Game")
+    parser.add_argument("--display", action="append",
+                        help="Display sink: window, null, video:<path>, shm:<name>, mjpeg:<port> (repeatable)")
+    parser.add_argument("--input", action="append",
+                        help="Extra input: keyboard, socket:[host:]<port>, gestures (thumbs up resets) (repeatable)")
+    parser.add_argument("--history", help="Append round events to a JSON-lines file")
+    parser.add_argument("--broadcast", metavar="HOST:PORT", help="Broadcast round events over UDP")
+    parser.add_argument("--record-session", metavar="PATH", help="Record a replayable session (.npz)")
+    parser.add_argument("--memory-profile", action="store_true",
+                        help="Sample RSS and tracemalloc and report top allocation sites every 5 minutes")
+    parser.add_argument("--early-commit", nargs="?", const="", metavar="CALIBRATION",
+                        help="Commit on predicted gestures (optional gesture_predictor.py calibration JSON)")
+    parser.add_argument("--seed", type=int, default=None, help="Seed for the computer's moves")
+    parser.add_argument("--idle", nargs="?", type=float, const=20.0, metavar="SECONDS",
+                        help="Idle at low frame rate with an attract screen after SECONDS without motion")
+    parser.add_argument("--backend",
+                        help="Hand pose backend: legacy[:lite], tasks[-live]:<model.task>, onnx:<model.onnx>, stub")
+    parser.add_argument("--capture",
+                        help="Camera format WxH[@FPS][:FOURCC], or native for driver defaults")
+    parser.add_argument("--analytics", metavar="PATH", help="Keep a live JSON snapshot of player statistics")
+    parser.add_argument("--match", help="Match rules toggled by 'b': best-of:N, first-to:K, timed:S[,best-of:N]")
+    add_config_arguments(parser)
+    add_metrics_arguments(parser)
+    args = parser.parse_args()
+    
+    # The dedicated flags are shorthands for --set
+    try:
+        overrides = parse_overrides(args.set)
+        for name, value in (("backend", args.backend), ("capture_settings", args.capture), ("idle_after", args.idle)):
+            if value is not None:
+                overrides[name] = value
+        config = load_config(args.profile, args.config, overrides)
+    except ValueError as e:
+        parser.error(str(e))
+    if args.profile or args.config or overrides:
+        print(config.describe())
+    watcher = ConfigWatcher(config, args.profile, args.config, overrides) if args.config else None
+    
+    game = EnhancedRockPaperScissorsGame(seed=args.seed, config=config)
+    if args.match:
+        game.target_rules = parse_rules(args.match)
+        game.match_rules = game.target_rules
+    if args.early_commit is not None:
+        from gesture_predictor import GesturePredictor
+        game.predictor = GesturePredictor.load(args.early_commit) if args.early_commit else GesturePredictor()
+    if args.analytics:
+        game.analytics.export_path = args.analytics
+    recorder = None
+    if args.record_session:
+        from session_replay import SessionRecorder
+        recorder = SessionRecorder(args.record_session, game)
+    inputs = None
+    if args.input:
+        from input_events import create_inputs
+        inputs = create_inputs(args.input)
+    monitor = None
+    if args.memory_profile:
+        from memory_guard import MemoryMonitor
+        monitor = MemoryMonitor(periodic_reports=True)
+    metrics = None
+    exporters = []
+    if args.metrics or args.metrics_log:
+        metrics = GameMetrics()
+        exporters = create_exporters(metrics.registry, args.metrics, args.metrics_log, args.metrics_interval)
+    if args.history:
+        game.events.subscribe(HistoryWriter(args.history))
+    if args.broadcast:
+        host, _, port = args.broadcast.rpartition(":")
+        game.events.subscribe(UdpBroadcaster(host or "255.255.255.255", int(port)))
     try:
-        game.run_game()
+        game.run_game(create_display(args.display, game.window_name), recorder, monitor, inputs, watcher=watcher,
+                      metrics=metrics)
     except KeyboardInterrupt:
         print("\n🎮 Game interrupted by user")
     except Exception as e:
         print(f"❌ Error: {e}")
     finally:
+        # The keyboard thread restores the terminal on close, also when run_game never started
+        if inputs:
+            inputs.close()
+        for exporter in exporters:
+            exporter.close()
         print("🎮 Game ended!")
@@ -0,0 +1,461 @@
+#!/usr/bin/env python3
+"""
+Shared-memory frame bus for Rock Paper Scissors Game
+Runs capture, MediaPipe inference and game rendering in separate processes
+connected by multiprocessing.shared_memory ring buffers
+"""
+
+import argparse
+import multiprocessing
+import os
+import queue
+import signal
+import time
+from multiprocessing import shared_memory
+
+import cv2
+import numpy as np
+
+from camera_capture import DEFAULT_CAPTURE
+from game_config import GameConfig, add_config_arguments, load_config, parse_overrides
+from landmark_io import NUM_LANDMARKS
+from metrics import GameMetrics, add_metrics_arguments, create_exporters
+
+RING_SLOTS = 8
+
+# Frame ring header (int64): head sequence, height, width, capture finished flag,
+# then per-worker drop counters
+FRAME_HEADER_FIELDS = 4
+MAX_WORKERS = 32
+
+
+class FrameRing:
+    """Fixed ring of BGR frames in shared memory, addressed by sequence number
+
+    Slot i holds the frame whose sequence number is stored in slot_sequence[i];
+    the writer marks a slot -1 while copying so readers can detect torn frames.
+    """
+
+    def __init__(self, name, height, width, slots=RING_SLOTS, create=False):
+        self.height = height
+        self.width = width
+        self.slots = slots
+        header_bytes = (FRAME_HEADER_FIELDS + MAX_WORKERS) * 8
+        index_bytes = slots * 16
+        frame_bytes = slots * height * width * 3
+        if create:
+            self.shm = shared_memory.SharedMemory(name=name, create=True,
+                                                  size=header_bytes + index_bytes + frame_bytes)
+        else:
+            self.shm = shared_memory.SharedMemory(name=name)
+        self.owner = create
+
+        buf = self.shm.buf
+        self.header = np.ndarray((FRAME_HEADER_FIELDS + MAX_WORKERS,), dtype=np.int64, buffer=buf)
+        self.slot_sequence = np.ndarray((slots,), dtype=np.int64, buffer=buf, offset=header_bytes)
+        self.slot_time = np.ndarray((slots,), dtype=np.float64, buffer=buf, offset=header_bytes + slots * 8)
+        self.frames = np.ndarray((slots, height, width, 3), dtype=np.uint8, buffer=buf,
+                                 offset=header_bytes + index_bytes)
+        if create:
+            self.header[:] = 0
+            self.header[1:3] = (height, width)
+            self.slot_sequence[:] = -1
+
+    @property
+    def head(self):
+        """Sequence number of the newest complete frame (0 before the first)"""
+        return int(self.header[0])
+
+    def write(self, frame, timestamp):
+        """Publish a frame and return its sequence number"""
+        sequence = self.head + 1
+        slot = sequence % self.slots
+        self.slot_sequence[slot] = -1
+        self.frames[slot] = frame
+        self.slot_time[slot] = timestamp
+        self.slot_sequence[slot] = sequence
+        self.header[0] = sequence
+        return sequence
+
+    def view(self, sequence):
+        """Zero-copy view of a frame, or None if it was already overwritten"""
+        slot = sequence % self.slots
+        if self.slot_sequence[slot] != sequence:
+            return None
+        return self.frames[slot]
+
+    def still_valid(self, sequence):
+        """Check that a viewed frame was not overwritten while in use"""
+        return self.slot_sequence[sequence % self.slots] == sequence
+
+    @property
+    def finished(self):
+        """True once the capture source has run out of frames"""
+        return bool(self.header[3])
+
+    def add_drops(self, worker_index, count):
+        """Per-worker drop counters avoid cross-process read-modify-write races"""
+        self.header[FRAME_HEADER_FIELDS + worker_index] += count
+
+    def total_drops(self):
+        return int(self.header[FRAME_HEADER_FIELDS:].sum())
+
+    def close(self):
+        del self.header, self.slot_sequence, self.slot_time, self.frames
+        self.shm.close()
+        if self.owner:
+            self.shm.unlink()
+
+
+class LandmarkRing:
+    """Ring of per-frame inference results: sequence, capture time, score, landmarks
+
+    Each worker also stores the last sequence it is done with (published or
+    dropped) in its own header field, so no field is written by two processes.
+    """
+
+    def __init__(self, name, slots=RING_SLOTS * 4, create=False):
+        self.slots = slots
+        header_bytes = MAX_WORKERS * 8
+        record_bytes = slots * 8 * 3
+        landmark_bytes = slots * NUM_LANDMARKS * 3 * 4
+        if create:
+            self.shm = shared_memory.SharedMemory(name=name, create=True,
+                                                  size=header_bytes + record_bytes + landmark_bytes)
+        else:
+            self.shm = shared_memory.SharedMemory(name=name)
+        self.owner = create
+
+        buf = self.shm.buf
+        self.progress = np.ndarray((MAX_WORKERS,), dtype=np.int64, buffer=buf)
+        self.slot_sequence = np.ndarray((slots,), dtype=np.int64, buffer=buf, offset=header_bytes)
+        self.slot_time = np.ndarray((slots,), dtype=np.float64, buffer=buf, offset=header_bytes + slots * 8)
+        self.slot_score = np.ndarray((slots,), dtype=np.float64, buffer=buf, offset=header_bytes + slots * 16)
+        self.landmarks = np.ndarray((slots, NUM_LANDMARKS, 3), dtype=np.float32, buffer=buf,
+                                    offset=header_bytes + record_bytes)
+        if create:
+            self.progress[:] = 0
+            self.slot_sequence[:] = -1
+
+    @property
+    def head(self):
+        """Newest sequence any worker is done with (0 before the first)"""
+        return int(self.progress.max())
+
+    def publish(self, worker_index, sequence, capture_time, points, score):
+        """Store one result; points is a (21, 3) array or None when no hand was found"""
+        slot = sequence % self.slots
+        self.slot_sequence[slot] = -1
+        if points is None:
+            self.landmarks[slot, 0, 0] = np.nan
+        else:
+            self.landmarks[slot] = points
+        self.slot_time[slot] = capture_time
+        self.slot_score[slot] = score
+        self.slot_sequence[slot] = sequence
+        self.progress[worker_index] = sequence
+
+    def skip(self, worker_index, sequence):
+        """Mark a worker done up to a sequence it will not publish (the frame was dropped)"""
+        self.progress[worker_index] = sequence
+
+    def pending(self, sequence, num_workers):
+        """True while the worker owning a sequence without a result may still publish it"""
+        return self.progress[(sequence - 1) % num_workers] < sequence
+
+    def overwritten(self, sequence):
+        """True once a later result took the sequence's slot"""
+        return self.slot_sequence[sequence % self.slots] > sequence
+
+    def read(self, sequence):
+        """Copy out (capture_time, score, points or None), or None if not available"""
+        slot = sequence % self.slots
+        if self.slot_sequence[slot] != sequence:
+            return None
+        capture_time = float(self.slot_time[slot])
+        score = float(self.slot_score[slot])
+        points = self.landmarks[slot].copy()
+        if self.slot_sequence[slot] != sequence:
+            return None
+        return capture_time, score, None if np.isnan(points[0, 0]) else points
+
+    def close(self):
+        del self.progress, self.slot_sequence, self.slot_time, self.slot_score, self.landmarks
+        self.shm.close()
+        if self.owner:
+            self.shm.unlink()
+
+
+def capture_process(source, ring_name, ready_queue, stop_event, capture_settings=DEFAULT_CAPTURE):
+    """Read frames from the camera (or a video file) into the frame ring"""
+    from camera_capture import open_camera
+
+    # Ctrl-C reaches the whole process group; the parent stops us through stop_event
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+    cap = open_camera(source, capture_settings)
+    try:
+        ret, frame = cap.read() if cap.isOpened() else (False, None)
+        if not ret:
+            ready_queue.put(None)
+            return
+
+        height, width = frame.shape[:2]
+        ring = FrameRing(ring_name, height, width, create=True)
+        ready_queue.put((height, width))
+
+        # Video files are paced to their own frame rate, cameras to the driver
+        frame_interval = 0.0
+        if isinstance(source, str):
+            frame_interval = 1.0 / (cap.get(cv2.CAP_PROP_FPS) or 30.0)
+
+        next_time = time.perf_counter()
+        while not stop_event.is_set() and ret:
+            ring.write(cv2.flip(frame, 1), time.time())
+            if frame_interval:
+                next_time += frame_interval
+                time.sleep(max(0.0, next_time - time.perf_counter()))
+            ret, frame = cap.read()
+    finally:
+        cap.release()
+
+    ring.header[3] = 1
+    stop_event.wait()
+    ring.close()
+
+
+def inference_process(worker_index, num_workers, ring_name, result_name, height, width, stop_event,
+                      config=None):
+    """Run the pose backend on every num_workers-th frame and publish landmark arrays"""
+    from pose_backends import create_backend
+
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+    config = config or GameConfig()
+    pose_backend = create_backend(config.backend, config.min_detection_confidence, config.min_tracking_confidence,
+                                  config.max_num_hands)
+    ring = FrameRing(ring_name, height, width)
+    results_ring = LandmarkRing(result_name)
+
+    # Frames are split round-robin: worker i owns sequences i+1, i+1+n, ...
+    sequence = worker_index + 1
+    while not stop_event.is_set():
+        head = ring.head
+        if head < sequence:
+            time.sleep(0.001)
+            continue
+
+        # Skip to the newest frame this worker owns if it fell behind
+        newest = head - (head - worker_index - 1) % num_workers
+        if newest > sequence:
+            ring.add_drops(worker_index, (newest - sequence) // num_workers)
+            results_ring.skip(worker_index, newest - num_workers)
+            sequence = newest
+
+        frame = ring.view(sequence)
+        published = False
+        if frame is not None:
+            capture_time = float(ring.slot_time[sequence % ring.slots])
+            hand = pose_backend.detect(frame, capture_time)
+            if ring.still_valid(sequence):
+                if hand:
+                    results_ring.publish(worker_index, sequence, capture_time, hand.points, hand.score)
+                else:
+                    results_ring.publish(worker_index, sequence, capture_time, None, 0.0)
+                published = True
+        if not published:
+            ring.add_drops(worker_index, 1)
+            results_ring.skip(worker_index, sequence)
+        sequence += num_workers
+
+    pose_backend.close()
+    ring.close()
+    results_ring.close()
+
+
+def wait_for_capture(capture, ready_queue, poll_interval=0.5):
+    """The frame shape the capture process reports, or None if it fails or exits without one"""
+    while True:
+        try:
+            return ready_queue.get(timeout=poll_interval)
+        except queue.Empty:
+            if not capture.is_alive():
+                # It may have reported just before exiting
+                try:
+                    return ready_queue.get(timeout=poll_interval)
+                except queue.Empty:
+                    return None
+
+
+def run_multiprocess_game(source=0, num_workers=None, display_specs=None, config=None, metrics=None):
+    """Play the enhanced game with capture and inference in worker processes"""
+    from enhanced_game import EnhancedRockPaperScissorsGame
+    from display_sinks import create_display
+    from game_events import ConsoleLogger, RoundCommitted, MatchWon
+    from hand_frame import HandFrame
+
+    config = config or GameConfig()
+    num_workers = min(num_workers or max(1, (os.cpu_count() or 2) - 2), MAX_WORKERS)
+    ring_name = f"rps_frames_{os.getpid()}"
+    result_name = f"rps_landmarks_{os.getpid()}"
+
+    stop_event = multiprocessing.Event()
+    ready_queue = multiprocessing.Queue()
+    results_ring = LandmarkRing(result_name, create=True)
+    capture = multiprocessing.Process(target=capture_process,
+                                      args=(source, ring_name, ready_queue, stop_event, config.capture_settings))
+    ring = None
+    workers = []
+    game = None
+    display = None
+    try:
+        capture.start()
+        shape = wait_for_capture(capture, ready_queue)
+        if shape is None:
+            if capture.exitcode:
+                print(f"Error: Capture process failed (exit code {capture.exitcode})")
+            else:
+                print("Error: Could not open webcam")
+            return
+        height, width = shape
+        ring = FrameRing(ring_name, height, width)
+
+        workers = [
+            multiprocessing.Process(target=inference_process,
+                                    args=(i, num_workers, ring_name, result_name, height, width, stop_event, config))
+            for i in range(num_workers)
+        ]
+        for worker in workers:
+            worker.start()
+
+        game = EnhancedRockPaperScissorsGame(use_mediapipe=False, config=config)
+        game.events.subscribe(ConsoleLogger(), (RoundCommitted, MatchWon))
+        if metrics:
+            metrics.dropped.fn = ring.total_drops
+            game.events.subscribe(metrics, (RoundCommitted,))
+        display = create_display(display_specs, game.window_name)
+        print(f"🧵 Multi-process game: 1 capture + {num_workers} inference workers")
+
+        next_sequence = 1
+        consumed = 0
+        missing = 0
+        latencies = []
+        hand_landmarks = None
+        start_time = time.time()
+        last_result_time = start_time
+        running = True
+
+        while running:
+            # Consume results in sequence order. Workers finish out of order, so a gap waits
+            # for its worker: it either publishes the result or drops the frame (counted
+            # in the ring's drops). Only a result overwritten before it was read is missing.
+            head = results_ring.head
+            result = None
+            while next_sequence <= head:
+                sequence = next_sequence
+                record = results_ring.read(sequence)
+                if record is None:
+                    if results_ring.overwritten(sequence) or head - sequence >= results_ring.slots:
+                        missing += 1
+                    elif results_ring.pending(sequence, num_workers):
+                        break
+                    next_sequence += 1
+                    continue
+                next_sequence += 1
+                result = (sequence, record)
+                capture_time, score, points = record
+                hand_landmarks = HandFrame(points, score=score) if points is not None else None
+                game.update_game_state(hand_landmarks, capture_time)
+                consumed += 1
+                if metrics:
+                    metrics.record_inference(hand_landmarks)
+            if result is None:
+                # Stop once a finished source has had time to drain through the workers
+                if ring.finished and time.time() - last_result_time > 1.0:
+                    break
+                time.sleep(0.001)
+                continue
+            last_result_time = time.time()
+
+            sequence, (capture_time, _, _) = result
+            frame = ring.view(sequence)
+            if frame is None:
+                continue
+            frame = frame.copy()
+            received = time.time()
+            game.draw_ui(frame, hand_landmarks)
+            rendered = time.time()
+            display.show(frame)
+            latencies.append(time.time() - capture_time)
+            if metrics:
+                # Capture and inference run in other processes: the capture stage is empty and the
+                # inference stage covers capture time to result, including the ring hand-offs
+                metrics.record_frame(capture_time, capture_time, received, rendered, time.time(), inference=False)
+
+            for event in display.poll_events():
+                running = running and game.handle_key(event.key, time.time())
+
+        elapsed = time.time() - start_time
+        captured = ring.head
+        dropped = ring.total_drops()
+    finally:
+        # Stop the workers and remove both shared-memory segments even after an error or Ctrl-C
+        stop_event.set()
+        for worker in workers:
+            worker.join()
+        capture.join()
+        if ring:
+            if metrics:
+                # The ring is about to go away; keep the final count for the last export
+                metrics.dropped.fn = None
+                metrics.dropped.count = ring.total_drops()
+            ring.close()
+            if capture.exitcode:
+                # The capture process owns the frame ring and died before removing it
+                ring.shm.unlink()
+        results_ring.close()
+        if display:
+            display.close()
+        if game:
+            game.close()
+            game.events.close()
+
+    print(f"📊 Captured {captured} frames, inferred {consumed} ({consumed / elapsed:.1f}/s)")
+    print(f"📉 Dropped {dropped} frames in workers, {missing} results lost before display")
+    if latencies:
+        latencies.sort()
+        print(f"⏱️  Capture-to-display latency: median {latencies[len(latencies) // 2] * 1000:.1f} ms, "
+              f"p95 {latencies[int(len(latencies) * 0.95)] * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Multi-process Rock Paper Scissors Game")
+    parser.add_argument("--source", default="0", help="Camera index or video file")
+    parser.add_argument("--workers", type=int, default=None, help="Inference worker processes")
+    parser.add_argument("--backend", help="Hand pose backend (see pose_backends.py)")
+    parser.add_argument("--display", action="append",
+                        help="Display sink: window, null, video:<path>, shm:<name>, mjpeg:<port> (repeatable)")
+    add_config_arguments(parser)
+    add_metrics_arguments(parser)
+    args = parser.parse_args()
+
+    try:
+        overrides = parse_overrides(args.set)
+        if args.backend:
+            overrides["backend"] = args.backend
+        config = load_config(args.profile, args.config, overrides)
+    except ValueError as e:
+        parser.error(str(e))
+    metrics = None
+    exporters = []
+    if args.metrics or args.metrics_log:
+        metrics = GameMetrics()
+        exporters = create_exporters(metrics.registry, args.metrics, args.metrics_log, args.metrics_interval)
+    source = int(args.source) if args.source.isdigit() else args.source
+    try:
+        run_multiprocess_game(source, args.workers, args.display, config, metrics)
+    except KeyboardInterrupt:
+        print("\n🎮 Game interrupted by user")
+    finally:
+        for exporter in exporters:
+            exporter.close()
@@ -0,0 +1,243 @@
+#!/usr/bin/env python3
+"""
+Runtime configuration for Rock Paper Scissors Game
+Every performance knob in one typed table, layered from defaults, a named
+profile, a JSON file, RPS_* environment variables and the command line,
+with hot reload of the file while the game runs
+"""
+
+import argparse
+import json
+import os
+
+from camera_capture import DEFAULT_CAPTURE
+
+# What applying a change to a field takes
+LIVE = "live"  # Read every frame, applied immediately
+GRAPH = "graph"  # The pose backend has to be rebuilt
+CAMERA = "camera"  # The camera has to be reopened
+
+
+class Field:
+    """One configuration knob: type, default, what a change costs, and help"""
+    __slots__ = ("name", "type", "default", "scope", "help", "choices")
+
+    def __init__(self, name, type, default, scope, help, choices=None):
+        self.name = name
+        self.type = type
+        self.default = default
+        self.scope = scope
+        self.help = help
+        self.choices = choices
+
+    def parse(self, value):
+        """Coerce a value from JSON, the environment or the command line"""
+        if isinstance(value, str) and self.type is not str:
+            value = value.strip()
+        try:
+            value = self.type(value)
+        except (TypeError, ValueError):
+            raise ValueError(f"{self.name} must be {self.type.__name__}, got {value!r}")
+        if self.choices and value not in self.choices:
+            raise ValueError(f"{self.name} must be one of {', '.join(self.choices)}, got {value!r}")
+        return value
+
+
+FIELDS = {field.name: field for field in [
+    Field("camera_index", int, 0, CAMERA, "Camera to open"),
+    Field("capture_settings", str, DEFAULT_CAPTURE, CAMERA, "Camera format WxH[@FPS][:FOURCC] or native"),
+    Field("backend", str, "legacy", GRAPH, "Hand pose backend spec (see pose_backends.py)"),
+    Field("max_num_hands", int, 1, GRAPH, "Hands the pose backend looks for"),
+    Field("min_detection_confidence", float, 0.8, GRAPH, "Palm detection threshold"),
+    Field("min_tracking_confidence", float, 0.6, GRAPH, "Landmark tracking threshold"),
+    Field("extension_tolerance", float, 0.02, LIVE, "How far a fingertip must clear its joint to count as extended"),
+    Field("commit_confidence", float, 0.7, LIVE, "Gesture confidence needed to play a round"),
+    Field("gesture_cooldown", float, 2.0, LIVE, "Seconds between rounds"),
+    Field("history_size", int, 5, LIVE, "Gestures kept for smoothing"),
+    Field("inference_rate", float, 0.0, LIVE, "Most pose inferences per second (0 runs every frame)"),
+    Field("render_quality", str, "high", LIVE, "high draws landmark rings, low only the bones", ("high", "low")),
+    Field("idle_after", float, 0.0, LIVE, "Seconds without motion before idling (0 never idles)"),
+    Field("idle_fps", float, 5.0, LIVE, "Frame rate while idle")
+]}
+
+PROFILES = {
+    "low-power-kiosk": {
+        "capture_settings": "640x480@15:MJPG",
+        "backend": "legacy:lite",
+        "inference_rate": 10.0,
+        "render_quality": "low",
+        "idle_after": 20.0,
+        "idle_fps": 2.0
+    },
+    "max-accuracy": {
+        "capture_settings": "1280x720@30:MJPG",
+        "backend": "legacy",
+        "min_detection_confidence": 0.7,
+        "min_tracking_confidence": 0.7,
+        "history_size": 8,
+        "commit_confidence": 0.8
+    },
+    # Fixed, uncapped settings so runs on different machines compare
+    "benchmark": {
+        "capture_settings": "640x480@30:MJPG",
+        "backend": "legacy",
+        "inference_rate": 0.0,
+        "render_quality": "high",
+        "idle_after": 0.0
+    }
+}
+
+ENV_PREFIX = "RPS_"
+
+
+class GameConfig:
+    """Resolved values of every field, plus where they came from"""
+
+    def __init__(self, values=None):
+        self.values = {name: field.default for name, field in FIELDS.items()}
+        self.sources = dict.fromkeys(FIELDS, "default")
+        self.profile = None
+        for name, value in (values or {}).items():
+            self.set(name, value)
+
+    def set(self, name, value, source="code"):
+        field = FIELDS.get(name)
+        if field is None:
+            raise ValueError(f"Unknown setting: {name}")
+        self.values[name] = field.parse(value)
+        self.sources[name] = source
+
+    def update(self, values, source):
+        for name, value in values.items():
+            self.set(name, value, source)
+
+    def __getattr__(self, name):
+        try:
+            return self.__dict__["values"][name]
+        except KeyError:
+            raise AttributeError(name)
+
+    def diff(self, other):
+        """Names of fields whose values differ from another config"""
+        return [name for name in FIELDS if self.values[name] != other.values[name]]
+
+    def apply(self, game, names=None):
+        """Copy fields onto the game's attributes of the same name"""
+        for name in names or FIELDS:
+            setattr(game, name, self.values[name])
+
+    def describe(self):
+        lines = [f"⚙️  Configuration{f' (profile {self.profile})' if self.profile else ''}:"]
+        for name in FIELDS:
+            lines.append(f"  {name:<26} {self.values[name]!s:<20} {self.sources[name]}")
+        return "\n".join(lines)
+
+
+def load_config(profile=None, path=None, overrides=None, environ=None):
+    """Layer defaults < profile < JSON file < RPS_* environment < overrides
+
+    The file may name a profile itself ({"profile": "benchmark", ...});
+    a profile given explicitly wins.
+    """
+    environ = os.environ if environ is None else environ
+    file_values = {}
+    if path:
+        with open(path) as f:
+            file_values = json.load(f)
+    profile = profile or environ.get(ENV_PREFIX + "PROFILE") or file_values.pop("profile", None)
+    file_values.pop("profile", None)
+
+    config = GameConfig()
+    if profile:
+        if profile not in PROFILES:
+            raise ValueError(f"Unknown profile: {profile} (choose from {', '.join(PROFILES)})")
+        config.update(PROFILES[profile], f"profile {profile}")
+        config.profile = profile
+    config.update(file_values, path)
+    for name in FIELDS:
+        value = environ.get(ENV_PREFIX + name.upper())
+        if value is not None:
+            config.set(name, value, "environment")
+    config.update(overrides or {}, "command line")
+    return config
+
+
+def parse_overrides(pairs):
+    """NAME=VALUE strings from --set into a dict"""
+    overrides = {}
+    for pair in pairs or []:
+        name, sep, value = pair.partition("=")
+        if not sep:
+            raise ValueError(f"Expected NAME=VALUE, got {pair!r}")
+        overrides[name.strip()] = value
+    return overrides
+
+
+class ConfigWatcher:
+    """Reloads the configuration when its file changes on disk
+
+    poll() is cheap enough for the frame loop: it only stats the file every
+    check_interval seconds and returns a new config (or None) when the
+    resolved values changed.
+    """
+
+    def __init__(self, config, profile=None, path=None, overrides=None, check_interval=1.0):
+        self.config = config
+        self.profile = profile
+        self.path = path
+        self.overrides = overrides
+        self.check_interval = check_interval
+        self.next_check = 0.0
+        self.mtime = self.stat()
+
+    def stat(self):
+        try:
+            return os.stat(self.path).st_mtime if self.path else None
+        except OSError:
+            return None
+
+    def poll(self, now):
+        if not self.path or now < self.next_check:
+            return None
+        self.next_check = now + self.check_interval
+        mtime = self.stat()
+        if mtime is None or mtime == self.mtime:
+            return None
+        self.mtime = mtime
+        try:
+            config = load_config(self.profile, self.path, self.overrides)
+        except (OSError, ValueError) as e:
+            # A half-written or mistyped file keeps the running configuration
+            print(f"⚠️  Not reloading {self.path}: {e}")
+            return None
+        if not config.diff(self.config):
+            return None
+        self.config = config
+        return config
+
+
+def add_config_arguments(parser):
+    """--profile, --config and --set for any game entry point"""
+    parser.add_argument("--profile", choices=sorted(PROFILES), help="Named performance profile")
+    parser.add_argument("--config", metavar="PATH", help="JSON settings file, reloaded when it changes")
+    parser.add_argument("--set", action="append", metavar="NAME=VALUE", help="Override one setting (repeatable)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Show the resolved Rock Paper Scissors Game configuration")
+    add_config_arguments(parser)
+    parser.add_argument("--list", action="store_true", help="List every setting and profile")
+    args = parser.parse_args()
+
+    if args.list:
+        print("⚙️  Settings (environment: RPS_<NAME>):")
+        for field in FIELDS.values():
+            print(f"  {field.name:<26} {field.type.__name__:<6} {field.default!s:<18} [{field.scope}] {field.help}")
+        print("📋 Profiles:")
+        for name, values in PROFILES.items():
+            print(f"  {name:<16} " + ", ".join(f"{key}={value}" for key, value in values.items()))
+    else:
+        try:
+            print(load_config(args.profile, args.config, parse_overrides(args.set)).describe())
+        except ValueError as e:
+            parser.error(str(e))
@@ -0,0 +1,186 @@
+"""
+Event bus for Rock Paper Scissors Game
+The round state machine publishes typed events; subscribers (logging,
+history, stats, network broadcast) run on their own background threads so
+slow consumers never add latency to the frame loop
+"""
+
+import json
+import queue
+import socket
+import threading
+import time
+
+
+class GameEvent:
+    """Base class for events published by the game state machine"""
+    __slots__ = ("timestamp",)
+
+    def __init__(self, timestamp=None):
+        self.timestamp = time.time() if timestamp is None else timestamp
+
+    def fields(self):
+        """All slot values, including inherited ones"""
+        names = []
+        for cls in reversed(type(self).__mro__):
+            names.extend(getattr(cls, "__slots__", ()))
+        return {name: getattr(self, name) for name in names}
+
+    def to_dict(self):
+        """JSON-friendly representation"""
+        return {"event": type(self).__name__, **self.fields()}
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.fields()})"
+
+
+class GestureDetected(GameEvent):
+    """The detected gesture changed while waiting for a move"""
+    __slots__ = ("gesture", "confidence")
+
+    def __init__(self, gesture, confidence, timestamp=None):
+        super().__init__(timestamp)
+        self.gesture = gesture
+        self.confidence = confidence
+
+
+class RoundCommitted(GameEvent):
+    """A round was played and scored (player_gesture is None for a timed-out round)"""
+    __slots__ = ("round_number", "player_gesture", "computer_gesture", "winner",
+                 "confidence", "player_score", "computer_score", "reaction_time")
+
+    def __init__(self, round_number, player_gesture, computer_gesture, winner,
+                 confidence, player_score, computer_score, reaction_time=None, timestamp=None):
+        super().__init__(timestamp)
+        self.round_number = round_number
+        self.player_gesture = player_gesture
+        self.computer_gesture = computer_gesture
+        self.winner = winner
+        self.confidence = confidence
+        self.player_score = player_score
+        self.computer_score = computer_score
+        self.reaction_time = reaction_time  # Seconds from "waiting" to the commit
+
+
+class MatchWon(GameEvent):
+    """Someone reached the winning score of a match"""
+    __slots__ = ("winner", "player_score", "computer_score")
+
+    def __init__(self, winner, player_score, computer_score, timestamp=None):
+        super().__init__(timestamp)
+        self.winner = winner
+        self.player_score = player_score
+        self.computer_score = computer_score
+
+
+class Reset(GameEvent):
+    """Scores and state were reset"""
+    __slots__ = ()
+
+
+class Subscription:
+    """A handler with its own bounded queue and worker thread"""
+
+    def __init__(self, handler, event_types, queue_size):
+        self.handler = handler
+        self.event_types = tuple(event_types) if event_types else (GameEvent,)
+        self.events = queue.Queue(maxsize=queue_size)
+        self.dropped = 0
+        self.thread = threading.Thread(target=self._run, name=f"events-{type(handler).__name__}", daemon=True)
+        self.thread.start()
+
+    def offer(self, event):
+        """Enqueue without blocking; a full queue drops the event"""
+        try:
+            self.events.put_nowait(event)
+        except queue.Full:
+            self.dropped += 1
+
+    def _run(self):
+        while True:
+            event = self.events.get()
+            if event is None:
+                break
+            try:
+                self.handler(event)
+            except Exception as e:
+                print(f"⚠️  Event subscriber {type(self.handler).__name__} failed: {e}")
+
+    def close(self):
+        self.events.put(None)
+        self.thread.join()
+        close = getattr(self.handler, "close", None)
+        if close:
+            close()
+
+
+class EventBus:
+    """Fan-out of game events to asynchronous subscribers"""
+
+    def __init__(self):
+        self.subscriptions = []
+
+    def subscribe(self, handler, event_types=None, queue_size=1024):
+        """Call handler(event) on a background thread for matching events"""
+        subscription = Subscription(handler, event_types, queue_size)
+        self.subscriptions.append(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription):
+        """Drain and stop one subscriber"""
+        if subscription in self.subscriptions:
+            self.subscriptions.remove(subscription)
+            subscription.close()
+
+    def publish(self, event):
+        """Hand an event to every interested subscriber; never blocks"""
+        for subscription in self.subscriptions:
+            if isinstance(event, subscription.event_types):
+                subscription.offer(event)
+
+    def close(self):
+        """Drain and stop all subscribers"""
+        for subscription in self.subscriptions:
+            subscription.close()
+        self.subscriptions = []
+
+
+class ConsoleLogger:
+    """Prints rounds and match results like the original game loop did"""
+
+    def __call__(self, event):
+        if isinstance(event, RoundCommitted):
+            print(f"🎲 Round {event.round_number}: You played {event.player_gesture}, "
+                  f"Computer played {event.computer_gesture}")
+            print(f"🏆 Result: {event.winner}")
+        elif isinstance(event, MatchWon):
+            print(f"🥇 {event.winner.upper()} wins the match {event.player_score}-{event.computer_score}!")
+
+
+class HistoryWriter:
+    """Appends events to a JSON-lines history file"""
+
+    def __init__(self, path):
+        self.file = open(path, "a")
+
+    def __call__(self, event):
+        self.file.write(json.dumps(event.to_dict()) + "\n")
+        self.file.flush()
+
+    def close(self):
+        self.file.close()
+
+
+class UdpBroadcaster:
+    """Sends each event as a JSON datagram, e.g. to a scoreboard on the LAN"""
+
+    def __init__(self, host="255.255.255.255", port=50505):
+        self.address = (host, port)
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
+
+    def __call__(self, event):
+        self.sock.sendto(json.dumps(event.to_dict()).encode(), self.address)
+
+    def close(self):
+        self.sock.close()
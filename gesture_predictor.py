@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""
+Gesture-commit predictor for Rock Paper Scissors Game
+Extrapolates finger curl from consecutive landmark frames to name the
+gesture a hand is moving into a few frames before it gets there
+"""
+
+import argparse
+import json
+
+import numpy as np
+
+from hand_frame import FINGER_TIPS, FINGER_PIPS
+from landmark_io import GESTURE_FINGERS, load_recording, synthetic_throw
+
+
+def curl_features(points):
+    """Extension of index..pinky (PIP y minus tip y; positive is extended)"""
+    return points[FINGER_PIPS, 1] - points[FINGER_TIPS, 1]
+
+
+def classify_extension(extension, tolerance):
+    """Same finger rules as get_gesture, applied to an extension vector"""
+    index, middle, ring, pinky = extension > tolerance
+    if not (index or middle or ring or pinky):
+        return "rock"
+    if index and middle and not ring and not pinky:
+        return "scissors"
+    if index and middle and ring and pinky:
+        return "paper"
+    return None
+
+
+class GesturePredictor:
+    """Predicts the settled gesture from curl position plus velocity
+
+    Confidence is sigmoid(slope * margin + intercept), where margin is how far
+    the least decided finger is predicted past the extension threshold.
+    calibrate() fits slope and intercept on labelled recordings.
+    """
+
+    def __init__(self, horizon_frames=3, tolerance=0.02, slope=60.0, intercept=-1.5, smoothing=0.5):
+        self.horizon_frames = horizon_frames
+        self.tolerance = tolerance
+        self.slope = slope
+        self.intercept = intercept
+        self.smoothing = smoothing
+        self.reset()
+
+    def reset(self):
+        self.last_features = None
+        self.last_time = None
+        self.velocity = None
+        self.frame_interval = None
+
+    def observe(self, points, timestamp):
+        """Update from a (21, 3) array; returns (gesture or None, raw margin)"""
+        features = curl_features(points)
+        if self.last_time is not None and 0 < timestamp - self.last_time < 0.25:
+            dt = timestamp - self.last_time
+            velocity = (features - self.last_features) / dt
+            self.velocity = velocity if self.velocity is None else \
+                self.smoothing * velocity + (1 - self.smoothing) * self.velocity
+            self.frame_interval = dt if self.frame_interval is None else 0.8 * self.frame_interval + 0.2 * dt
+        else:
+            # First frame, or the hand was lost: start the motion estimate over
+            self.velocity = None
+        self.last_features = features
+        self.last_time = timestamp
+
+        predicted = features
+        if self.velocity is not None:
+            predicted = features + self.velocity * self.horizon_frames * self.frame_interval
+        gesture = classify_extension(predicted, self.tolerance)
+        margin = float(np.abs(predicted - self.tolerance).min())
+        return gesture, margin
+
+    def confidence(self, margin):
+        return 1.0 / (1.0 + np.exp(-(self.slope * margin + self.intercept)))
+
+    def update(self, hand_landmarks, timestamp):
+        """Predict from a HandFrame; returns (gesture or None, confidence)"""
+        gesture, margin = self.observe(hand_landmarks.points, timestamp)
+        if gesture is None:
+            return None, 0.0
+        return gesture, float(self.confidence(margin))
+
+    def calibrate(self, recordings, iterations=25):
+        """Fit slope/intercept so confidence matches how often predictions equal the label"""
+        margins = []
+        correct = []
+        for recording in recordings:
+            if recording["label"] not in GESTURE_FINGERS:
+                continue
+            self.reset()
+            for timestamp, points in zip(recording["timestamps"], recording["landmarks"]):
+                if np.isnan(points[0, 0]):
+                    self.reset()
+                    continue
+                gesture, margin = self.observe(points, float(timestamp))
+                if gesture is not None:
+                    margins.append(margin)
+                    correct.append(gesture == recording["label"])
+        self.reset()
+        if not margins or all(correct) or not any(correct):
+            return len(margins)
+
+        # One-feature logistic regression by Newton's method
+        x = np.column_stack([np.array(margins), np.ones(len(margins))])
+        y = np.array(correct, dtype=np.float64)
+        weights = np.array([self.slope, self.intercept])
+        for _ in range(iterations):
+            p = 1.0 / (1.0 + np.exp(-x @ weights))
+            gradient = x.T @ (y - p)
+            hessian = (x * (p * (1 - p))[:, None]).T @ x + 1e-6 * np.eye(2)
+            weights += np.linalg.solve(hessian, gradient)
+        self.slope, self.intercept = (float(w) for w in weights)
+        return len(margins)
+
+    def to_dict(self):
+        return {"horizon_frames": self.horizon_frames, "tolerance": self.tolerance,
+                "slope": self.slope, "intercept": self.intercept, "smoothing": self.smoothing}
+
+    @classmethod
+    def load(cls, path):
+        with open(path) as f:
+            return cls(**json.load(f))
+
+
+def synthetic_recordings(count, seed=0):
+    """Labelled synthetic throws for every gesture"""
+    rng = np.random.default_rng(seed)
+    recordings = []
+    for gesture in GESTURE_FINGERS:
+        for i in range(count):
+            timestamps, landmarks, scores = synthetic_throw(
+                gesture, transition_frames=int(rng.integers(5, 12)), noise=0.004, rng=rng)
+            recordings.append({"timestamps": timestamps, "landmarks": landmarks, "scores": scores,
+                               "label": gesture, "path": f"synthetic-{gesture}-{i}"})
+    return recordings
+
+
+def evaluate(recordings, predictor=None):
+    """Time-to-commit and misprediction rate of the first commit in each recording"""
+    from sweep_runner import replay_recording, default_params
+
+    params = default_params()
+    latencies = []
+    wrong = 0
+    missed = 0
+    for recording in recordings:
+        if predictor:
+            predictor.reset()
+        commits = replay_recording(recording, params, predictor)
+        if not commits:
+            missed += 1
+            continue
+        gesture, latency = commits[0]
+        latencies.append(latency)
+        if recording["label"] and gesture != recording["label"]:
+            wrong += 1
+
+    latencies = sorted(latencies)
+    return {
+        "commits": len(latencies),
+        "missed": missed,
+        "misprediction_rate": wrong / len(latencies) if latencies else 0.0,
+        "mean_latency": float(np.mean(latencies)) if latencies else float("inf"),
+        "p90_latency": latencies[int(0.9 * (len(latencies) - 1))] if latencies else float("inf")
+    }
+
+
+def print_evaluation(name, result):
+    print(f"  {name:<12} {result['commits']:>4} commits, {result['missed']} missed, "
+          f"time-to-commit mean {result['mean_latency'] * 1000:.0f} ms / p90 {result['p90_latency'] * 1000:.0f} ms, "
+          f"mispredicted {result['misprediction_rate']:.1%}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Calibrate and evaluate early gesture commits")
+    parser.add_argument("command", choices=["calibrate", "evaluate"])
+    parser.add_argument("recordings", nargs="*", help="Labelled recordings from sweep_runner.py record")
+    parser.add_argument("--synthetic", type=int, default=0, help="Add N synthetic throws per gesture")
+    parser.add_argument("--calibration", help="Predictor settings JSON (read for evaluate, written by calibrate)")
+    parser.add_argument("--horizon", type=int, default=3, help="Frames to look ahead")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    recordings = [load_recording(path) for path in args.recordings]
+    recordings += synthetic_recordings(args.synthetic, args.seed)
+    if not recordings:
+        parser.error("no recordings given")
+
+    if args.command == "calibrate":
+        predictor = GesturePredictor(horizon_frames=args.horizon)
+        samples = predictor.calibrate(recordings)
+        print(f"📐 Calibrated on {samples} predictions: slope {predictor.slope:.1f}, intercept {predictor.intercept:.2f}")
+        if args.calibration:
+            with open(args.calibration, "w") as f:
+                json.dump(predictor.to_dict(), f, indent=2)
+            print(f"💾 Saved to {args.calibration}")
+    else:
+        predictor = GesturePredictor.load(args.calibration) if args.calibration else GesturePredictor(args.horizon)
+        print(f"⏱️  {len(recordings)} recordings:")
+        print_evaluation("baseline", evaluate(recordings))
+        print_evaluation("early", evaluate(recordings, predictor))
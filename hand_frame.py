@@ -0,0 +1,187 @@
+"""
+Compact hand landmark container for Rock Paper Scissors Game
+One detected hand as a contiguous (21, 3) float32 array, converted from the
+MediaPipe protobufs once per detection, plus a vectorized skeleton drawer
+"""
+
+import cv2
+import numpy as np
+
+NUM_LANDMARKS = 21
+FINGER_TIPS = [8, 12, 16, 20]  # index, middle, ring, pinky
+FINGER_PIPS = [6, 10, 14, 18]
+
+# Same pairs as mediapipe.solutions.hands.HAND_CONNECTIONS
+HAND_CONNECTIONS = np.array([
+    (0, 1), (1, 2), (2, 3), (3, 4),
+    (0, 5), (5, 6), (6, 7), (7, 8),
+    (5, 9), (9, 10), (10, 11), (11, 12),
+    (9, 13), (13, 14), (14, 15), (15, 16),
+    (13, 17), (0, 17), (17, 18), (18, 19), (19, 20)
+], dtype=np.int32)
+
+WHITE = (255, 255, 255)
+
+
+class HandFrame:
+    """One detected hand: normalized (x, y, z) landmarks, handedness and score"""
+    __slots__ = ("points", "handedness", "score")
+
+    def __init__(self, points, handedness=None, score=1.0):
+        self.points = np.ascontiguousarray(points, dtype=np.float32).reshape(NUM_LANDMARKS, 3)
+        self.handedness = handedness
+        self.score = score
+
+    @classmethod
+    def from_landmarks(cls, hand_landmarks, handedness=None, score=1.0):
+        """Convert a NormalizedLandmarkList (or anything with .landmark[i].x/y/z)"""
+        points = np.array([(lm.x, lm.y, lm.z) for lm in hand_landmarks.landmark], dtype=np.float32)
+        return cls(points, handedness, score)
+
+    @classmethod
+    def from_results(cls, results, index=0):
+        """The index-th hand of a legacy Hands.process() result, or None"""
+        if not results.multi_hand_landmarks or len(results.multi_hand_landmarks) <= index:
+            return None
+        handedness = None
+        score = 1.0
+        if results.multi_handedness:
+            classification = results.multi_handedness[index].classification[0]
+            handedness = classification.label
+            score = classification.score
+        return cls.from_landmarks(results.multi_hand_landmarks[index], handedness, score)
+
+    @classmethod
+    def from_task_result(cls, result, index=0):
+        """The index-th hand of a MediaPipe Tasks HandLandmarkerResult, or None"""
+        if len(result.hand_landmarks) <= index:
+            return None
+        points = np.array([(lm.x, lm.y, lm.z) for lm in result.hand_landmarks[index]], dtype=np.float32)
+        handedness = None
+        score = 1.0
+        if len(result.handedness) > index and result.handedness[index]:
+            category = result.handedness[index][0]
+            handedness = category.category_name
+            score = category.score
+        return cls(points, handedness, score)
+
+    def pixel_coordinates(self, width, height):
+        """(21, 2) int32 pixel positions and a mask of landmarks inside the frame"""
+        return pixel_coordinates(self.points, width, height)
+
+    def __repr__(self):
+        return f"HandFrame({self.handedness}, score={self.score:.2f})"
+
+
+def pixel_coordinates(points, width, height):
+    """Int32 pixel positions and an inside-the-frame mask for (..., 3) normalized points"""
+    xy = points[..., :2].astype(np.float64)
+    visible = ((xy >= 0.0) & (xy <= 1.0)).all(axis=-1)
+    pixels = np.minimum(np.floor(xy * (width, height)), (width - 1, height - 1)).astype(np.int32)
+    return pixels, visible
+
+
+# Pixel offsets of cv2.circle rings, keyed by (radius, thickness)
+_ring_offsets = {}
+
+
+def ring_offsets(radius, thickness):
+    """(dy, dx, coverage) of every pixel cv2.circle touches for a ring centered on the origin"""
+    offsets = _ring_offsets.get((radius, thickness))
+    if offsets is None:
+        size = radius + thickness + 1
+        mask = np.zeros((2 * size + 1, 2 * size + 1), dtype=np.uint8)
+        cv2.circle(mask, (size, size), radius, 255, thickness)
+        dy, dx = np.nonzero(mask)
+        coverage = (mask[dy, dx] / 255.0).astype(np.float32)[:, None]
+        offsets = _ring_offsets[(radius, thickness)] = (dy - size, dx - size, coverage)
+    return offsets
+
+
+def stamp_rings(frame, centers, radius, thickness, color):
+    """Blend the ring around every center in one vectorized step"""
+    height, width = frame.shape[:2]
+    dy, dx, coverage = ring_offsets(radius, thickness)
+    ys = (centers[:, 1:2] + dy).ravel()
+    xs = (centers[:, 0:1] + dx).ravel()
+    alpha = np.tile(coverage, (len(centers), 1))
+    inside = (ys >= 0) & (ys < height) & (xs >= 0) & (xs < width)
+    if not inside.all():
+        ys, xs, alpha = ys[inside], xs[inside], alpha[inside]
+
+    if not frame.flags.c_contiguous:
+        # reshape() would copy a crop or ROI view, so index it by row and column instead
+        blended = frame[ys, xs].astype(np.float32)
+        blended += (np.float32(color) - blended) * alpha
+        frame[ys, xs] = blended + 0.5
+        return
+
+    # Gather, blend and scatter through the flattened pixel rows
+    pixels = frame.reshape(-1, frame.shape[2])
+    index = ys * width + xs
+    blended = np.take(pixels, index, axis=0).astype(np.float32)
+    blended += (np.float32(color) - blended) * alpha
+    pixels[index] = blended + 0.5
+
+
+class SkeletonRenderer:
+    """Draws hand skeletons like mp_drawing.draw_landmarks, for any number of hands per call
+
+    The style, ring sprites and per-hand-count connection indices are built
+    once, so a frame costs one pixel conversion, one polylines call and two
+    ring stamps however many hands are on screen.
+    """
+
+    def __init__(self, point_color, line_color, circle_radius=3, point_thickness=2, line_thickness=1):
+        self.point_color = point_color
+        self.line_color = line_color
+        self.circle_radius = circle_radius
+        self.border_radius = max(circle_radius + 1, int(circle_radius * 1.2))
+        self.point_thickness = point_thickness
+        self.line_thickness = line_thickness
+        self.connections = {}  # hand count -> (n * 21, 2) indices into the stacked landmarks
+        if circle_radius:
+            ring_offsets(self.border_radius, point_thickness)
+            ring_offsets(circle_radius, point_thickness)
+
+    def connection_indices(self, count):
+        indices = self.connections.get(count)
+        if indices is None:
+            offsets = np.arange(count, dtype=np.int32)[:, None, None] * NUM_LANDMARKS
+            indices = self.connections[count] = (HAND_CONNECTIONS + offsets).reshape(-1, 2)
+        return indices
+
+    def draw(self, frame, hands):
+        """Draw one HandFrame or an iterable of them (None entries are skipped)"""
+        if isinstance(hands, HandFrame):
+            hands = [hands]
+        points = [hand.points for hand in hands if hand]
+        if not points:
+            return
+        height, width = frame.shape[:2]
+        pixels, visible = pixel_coordinates(np.concatenate(points), width, height)
+
+        # Connections between visible landmarks of every hand in one polyline call
+        connections = self.connection_indices(len(points))
+        segments = pixels[connections[visible[connections].all(axis=1)]]
+        if len(segments):
+            cv2.polylines(frame, segments, False, self.line_color, self.line_thickness)
+
+        # White border rings, then colored rings, stamped for all landmarks at once (none at radius 0)
+        centers = pixels[visible]
+        if len(centers) and self.circle_radius:
+            stamp_rings(frame, centers, self.border_radius, self.point_thickness, WHITE)
+            stamp_rings(frame, centers, self.circle_radius, self.point_thickness, self.point_color)
+
+
+# Renderers for draw_hand, keyed by style
+_renderers = {}
+
+
+def draw_hand(frame, hands, point_color, line_color, circle_radius=3, point_thickness=2, line_thickness=1):
+    """Draw one or more hands with a renderer cached for this style"""
+    style = (tuple(point_color), tuple(line_color), circle_radius, point_thickness, line_thickness)
+    renderer = _renderers.get(style)
+    if renderer is None:
+        renderer = _renderers[style] = SkeletonRenderer(*style)
+    renderer.draw(frame, hands)
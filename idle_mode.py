@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+Power-saving idle mode for Rock Paper Scissors Game
+Watches a tiny grayscale copy of each frame for motion; when nobody has
+moved in front of the kiosk for a while, the game loop skips hand
+inference and UI rendering, shows an attract screen and runs at a few
+frames per second until the next movement
+"""
+
+import argparse
+import threading
+import time
+
+import cv2
+import numpy as np
+
+from text_cache import put_text
+
+
+class MotionDetector:
+    """Frame differencing against a running-average background of a downscaled gray frame"""
+
+    def __init__(self, sample_size=(80, 60), pixel_threshold=18, motion_fraction=0.01, learning_rate=0.05):
+        self.sample_size = sample_size
+        self.pixel_threshold = pixel_threshold
+        self.motion_fraction = motion_fraction  # Share of changed pixels that counts as motion
+        self.learning_rate = learning_rate
+        self.background = None
+        self.level = 0.0
+
+    def update(self, frame):
+        """Feed a BGR frame; returns True when it differs enough from the background"""
+        small = cv2.resize(frame, self.sample_size, interpolation=cv2.INTER_AREA)
+        gray = cv2.GaussianBlur(cv2.cvtColor(small, cv2.COLOR_BGR2GRAY), (5, 5), 0)
+        if self.background is None:
+            self.background = gray.astype(np.float32)
+            return False
+        diff = cv2.absdiff(gray, cv2.convertScaleAbs(self.background))
+        self.level = np.count_nonzero(diff > self.pixel_threshold) / diff.size
+        # Lighting drifts slowly into the background; a person does not
+        cv2.accumulateWeighted(gray, self.background, self.learning_rate)
+        return self.level > self.motion_fraction
+
+
+class IdleController:
+    """Decides per frame whether the game loop runs at full rate or idles
+
+    update() is called on every frame before inference. Motion (or a hand
+    or key reported through activity()) keeps the game awake; after
+    idle_after seconds without any, frames are only sampled idle_fps times
+    a second. The first frame with motion wakes the game and is processed
+    in full, so waking costs no extra frame.
+    """
+
+    def __init__(self, idle_after=20.0, idle_fps=5.0, detector=None, clock=time.monotonic):
+        self.idle_after = idle_after
+        self.idle_interval = 1.0 / idle_fps
+        self.detector = detector or MotionDetector()
+        self.clock = clock
+        self.idle = False
+        self.last_activity = clock()
+        self.last_tick = clock()
+        self.wakeups = 0
+
+        # mode -> [wall seconds, CPU seconds, frames]
+        self.usage = {"active": [0.0, 0.0, 0], "idle": [0.0, 0.0, 0]}
+        self.mark = None
+
+    def account(self):
+        """Charge the time since the last frame to the current mode"""
+        wall, cpu = time.perf_counter(), time.process_time()
+        if self.mark is None:
+            self.mark = (wall, cpu)
+            return
+        usage = self.usage["idle" if self.idle else "active"]
+        usage[0] += wall - self.mark[0]
+        usage[1] += cpu - self.mark[1]
+        usage[2] += 1
+        self.mark = (wall, cpu)
+
+    def update(self, frame):
+        """Check the frame for motion; returns True if it should get full processing"""
+        self.account()
+        now = self.clock()
+        self.last_tick = now
+        if self.detector.update(frame):
+            self.last_activity = now
+            if self.idle:
+                self.idle = False
+                self.wakeups += 1
+                print("👋 Motion detected, back to full rate")
+        elif not self.idle and now - self.last_activity > self.idle_after:
+            self.idle = True
+            print(f"💤 No motion for {self.idle_after:g}s, idling at {1.0 / self.idle_interval:g} FPS")
+        return not self.idle
+
+    def activity(self):
+        """A hand or key press counts as motion even when the player stands still"""
+        self.last_activity = self.clock()
+
+    def throttle(self):
+        """Sleep out the rest of the idle frame interval"""
+        if self.idle:
+            remaining = self.last_tick + self.idle_interval - self.clock()
+            if remaining > 0:
+                time.sleep(remaining)
+
+    def draw_attract(self, frame, colors):
+        """Dimmed camera view with a blinking invitation"""
+        height, width = frame.shape[:2]
+        cv2.convertScaleAbs(frame, frame, 0.35)
+        text = "Step up and show your hand!" if int(self.last_tick) % 2 == 0 else "Rock - Paper - Scissors"
+        (text_width, _), _ = cv2.getTextSize(text, cv2.FONT_HERSHEY_SIMPLEX, 1.0, 2)
+        put_text(frame, text, ((width - text_width) // 2, height // 2),
+                 cv2.FONT_HERSHEY_SIMPLEX, 1.0, colors["gold"], 2)
+
+    def report(self):
+        """Print wall time, CPU load and frame rate per mode"""
+        self.account()
+        print("🔋 Idle mode:")
+        for mode, (wall, cpu, frames) in self.usage.items():
+            if wall > 0:
+                print(f"  {mode:<7} {wall:7.1f}s  CPU {cpu / wall:6.1%}  {frames / wall:5.1f} FPS")
+        active, idle = self.usage["active"], self.usage["idle"]
+        if active[0] > 0 and idle[0] > 0:
+            saved = (active[1] / active[0] - idle[1] / idle[0]) * idle[0]
+            print(f"  {self.wakeups} wakeups, ~{saved:.1f} CPU seconds saved while idle")
+
+
+def write_still_video(path, seconds, fps=30.0, size=(640, 480), seed=0):
+    """An empty, static scene with sensor noise, as a camera sees an unattended kiosk"""
+    rng = np.random.default_rng(seed)
+    width, height = size
+    scene = cv2.GaussianBlur(rng.integers(0, 255, (height, width, 3), dtype=np.uint8), (31, 31), 0)
+    writer = cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*"MJPG"), fps, size)
+    for _ in range(int(seconds * fps)):
+        noise = rng.integers(-3, 4, scene.shape, dtype=np.int16)
+        writer.write(np.clip(scene + noise, 0, 255).astype(np.uint8))
+    writer.release()
+
+
+def benchmark(seconds=10.0, idle_fps=5.0):
+    """CPU load of the real game loop on an empty scene, with and without idle mode"""
+    import os
+    import tempfile
+    from camera_capture import open_camera
+    from display_sinks import NullSink
+    from enhanced_game import EnhancedRockPaperScissorsGame
+
+    path = os.path.join(tempfile.mkdtemp(), "still.avi")
+    # Enough frames for the ungated loop, which reads the file as fast as it can
+    write_still_video(path, seconds * 4)
+    results = {}
+    try:
+        for name, idle in (("full rate", None), ("idle mode", IdleController(idle_after=0.0, idle_fps=idle_fps))):
+            game = EnhancedRockPaperScissorsGame()
+            display = NullSink()
+            threading.Timer(seconds, display.push_key, ["q"]).start()
+            wall, cpu = time.perf_counter(), time.process_time()
+            game.run_game(display, capture=open_camera(path), idle=idle)
+            wall, cpu = time.perf_counter() - wall, time.process_time() - cpu
+            results[name] = (cpu / wall, display.frame_count / wall)
+    finally:
+        os.remove(path)
+
+    print(f"⏱️  {seconds:g}s on an empty scene:")
+    for name, (load, fps) in results.items():
+        print(f"  {name:<10} CPU {load:6.1%}  {fps:5.1f} FPS")
+    full, idle = results["full rate"][0], results["idle mode"][0]
+    print(f"🔋 Idle mode uses {1 - idle / full:.0%} less CPU")
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Measure idle mode CPU savings for Rock Paper Scissors Game")
+    parser.add_argument("command", choices=["benchmark"])
+    parser.add_argument("--seconds", type=float, default=10.0, help="Measurement time per mode")
+    parser.add_argument("--idle-fps", type=float, default=5.0)
+    args = parser.parse_args()
+    benchmark(args.seconds, args.idle_fps)
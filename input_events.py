@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+"""
+Input subsystem for Rock Paper Scissors Game
+Keyboard, local socket and gesture commands run independently of the frame
+loop and feed one queue that the game drains once per frame
+"""
+
+import argparse
+import os
+import select
+import socket
+import sys
+import threading
+from collections import deque
+
+from display_sinks import KeyEvent
+from hand_frame import FINGER_TIPS, FINGER_PIPS
+
+# Socket commands may spell out the key they stand for
+COMMAND_KEYS = {"quit": "q", "reset": "r", "match": "b", "help": "h", "stats": "a"}
+
+
+class InputHub:
+    """Collects key events from input threads
+
+    deque.append and deque.popleft are atomic, so sources on other threads
+    never take a lock that the frame loop could wait on.
+    """
+
+    def __init__(self):
+        self.events = deque()
+        self.sources = []
+        self.gestures = None  # GestureCommands, fed from the frame loop
+
+    def push(self, key, timestamp=None):
+        self.events.append(KeyEvent(key, timestamp))
+
+    def add(self, source):
+        """Start a source that pushes into this hub"""
+        source.start(self)
+        self.sources.append(source)
+        return source
+
+    def poll_events(self):
+        """Drain everything queued since the last poll"""
+        events = []
+        while True:
+            try:
+                events.append(self.events.popleft())
+            except IndexError:
+                return events
+
+    def close(self):
+        for source in self.sources:
+            source.close()
+        self.sources = []
+
+
+class InputSource:
+    """Base class for a thread that turns some input into key events"""
+
+    def start(self, hub):
+        self.hub = hub
+        self.stopped = threading.Event()
+        self.thread = threading.Thread(target=self.run, name=f"input-{type(self).__name__}", daemon=True)
+        self.thread.start()
+
+    def run(self):
+        raise NotImplementedError
+
+    def close(self):
+        self.stopped.set()
+        self.thread.join(timeout=1.0)
+
+
+class TerminalKeyboard(InputSource):
+    """Single key presses from the controlling terminal, without waiting for Enter"""
+
+    def run(self):
+        if os.name == "nt":
+            self.run_windows()
+            return
+        import termios
+        import tty
+        if not sys.stdin.isatty():
+            return
+        fd = sys.stdin.fileno()
+        saved = termios.tcgetattr(fd)
+        try:
+            tty.setcbreak(fd)
+            while not self.stopped.is_set():
+                readable, _, _ = select.select([fd], [], [], 0.1)
+                if readable:
+                    key = os.read(fd, 1).decode(errors="ignore")
+                    if key:
+                        self.hub.push(key.lower())
+        finally:
+            termios.tcsetattr(fd, termios.TCSADRAIN, saved)
+
+    def run_windows(self):
+        import msvcrt
+        while not self.stopped.wait(0.02):
+            while msvcrt.kbhit():
+                self.hub.push(msvcrt.getwch().lower())
+
+
+class SocketCommands(InputSource):
+    """UDP datagrams such as "r" or "reset", e.g. from a kiosk operator's phone"""
+
+    def __init__(self, host="127.0.0.1", port=50506):
+        self.address = (host, port)
+
+    def run(self):
+        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        sock.bind(self.address)
+        sock.settimeout(0.2)
+        try:
+            while not self.stopped.is_set():
+                try:
+                    data, _ = sock.recvfrom(256)
+                except socket.timeout:
+                    continue
+                command = data.decode(errors="ignore").strip().lower()
+                key = COMMAND_KEYS.get(command, command[:1])
+                if key:
+                    self.hub.push(key)
+        finally:
+            sock.close()
+
+
+class GestureCommands:
+    """Hand poses that act as keys, e.g. holding a thumbs up resets the game
+
+    Runs in the frame loop since it needs the landmarks; observe() reports
+    whether the hand was taken as a command so it is not also played.
+    """
+
+    def __init__(self, hub, hold_seconds=1.5, key="r"):
+        self.hub = hub
+        self.hold_seconds = hold_seconds
+        self.key = key
+        self.pose_since = None
+        self.fired = False
+
+    def is_thumbs_up(self, hand_landmarks):
+        """Thumb pointing up above the knuckles with the four fingers curled"""
+        y = hand_landmarks.points[:, 1]
+        thumb_tip = y[4]
+        if thumb_tip > y[2] - 0.08 or thumb_tip > y[5] - 0.05:
+            return False
+        tips = y[FINGER_TIPS]
+        return bool(((tips >= y[FINGER_PIPS]) & (tips >= thumb_tip)).all())
+
+    def observe(self, hand_landmarks, timestamp):
+        """Track the pose; returns True while the hand is showing a command"""
+        if not hand_landmarks or not self.is_thumbs_up(hand_landmarks):
+            self.pose_since = None
+            self.fired = False
+            return False
+        if self.pose_since is None:
+            self.pose_since = timestamp
+        elif not self.fired and timestamp - self.pose_since >= self.hold_seconds:
+            self.hub.push(self.key, timestamp)
+            self.fired = True
+        return True
+
+
+def create_inputs(specs):
+    """Build a hub from specs: keyboard, socket:[host:]<port>, gestures"""
+    hub = InputHub()
+    try:
+        for spec in specs or []:
+            kind, _, argument = spec.partition(":")
+            if kind == "keyboard":
+                hub.add(TerminalKeyboard())
+            elif kind == "socket":
+                host, _, port = argument.rpartition(":")
+                hub.add(SocketCommands(host or "127.0.0.1", int(port or 50506)))
+            elif kind == "gestures":
+                hub.gestures = GestureCommands(hub)
+            else:
+                raise ValueError(f"Unknown input source: {spec}")
+    except Exception:
+        # Sources already started (e.g. the keyboard in cbreak mode) must not outlive the error
+        hub.close()
+        raise
+    return hub
+
+
+def send_command(command, host="127.0.0.1", port=50506):
+    """Send one command to a running game's socket input"""
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    sock.sendto(command.encode(), (host, port))
+    sock.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Send a command to a running Rock Paper Scissors game")
+    parser.add_argument("command", help="quit, reset, match, help, stats, or a single key")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=50506)
+    args = parser.parse_args()
+    send_command(args.command, args.host, args.port)
+    print(f"📨 Sent '{args.command}' to {args.host}:{args.port}")
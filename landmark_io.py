@@ -0,0 +1,172 @@
+"""
+Landmark recording utilities for Rock Paper Scissors Game
+Save, load and replay hand landmark streams without a webcam
+"""
+
+import time
+import numpy as np
+
+from hand_frame import NUM_LANDMARKS, HandFrame
+
+
+# Finger joint indices (mcp, pip, dip, tip) in MediaPipe order
+FINGER_JOINTS = {
+    "thumb": (1, 2, 3, 4),
+    "index": (5, 6, 7, 8),
+    "middle": (9, 10, 11, 12),
+    "ring": (13, 14, 15, 16),
+    "pinky": (17, 18, 19, 20)
+}
+
+# Which fingers are extended for each gesture
+GESTURE_FINGERS = {
+    "rock": {"thumb": False, "index": False, "middle": False, "ring": False, "pinky": False},
+    "paper": {"thumb": True, "index": True, "middle": True, "ring": True, "pinky": True},
+    "scissors": {"thumb": False, "index": True, "middle": True, "ring": False, "pinky": False}
+}
+
+# A loosely held hand that is not yet any gesture
+RELAXED_FINGERS = {"thumb": False, "index": True, "middle": True, "ring": True, "pinky": False}
+
+
+def synthetic_hand(gesture, center=(0.5, 0.6), scale=1.0, noise=0.0, rng=None):
+    """Build a plausible (21, 3) landmark array for a gesture name or a finger dict"""
+    cx, cy = center
+    points = np.zeros((NUM_LANDMARKS, 3), dtype=np.float32)
+    points[0] = (cx, cy + 0.2 * scale, 0.0)
+
+    fingers = GESTURE_FINGERS[gesture] if isinstance(gesture, str) else gesture
+    for i, (finger, joints) in enumerate(FINGER_JOINTS.items()):
+        x = cx + (i - 2) * 0.04 * scale
+        if finger == "thumb":
+            # Thumb opens sideways, away from the wrist
+            reach = 0.06 if fingers[finger] else 0.02
+            offsets = [(-0.03, 0.12), (-0.03 - reach, 0.1), (-0.03 - 2 * reach, 0.08), (-0.03 - 3 * reach, 0.06)]
+        elif fingers[finger]:
+            offsets = [(0.0, 0.05), (0.0, -0.05), (0.0, -0.1), (0.0, -0.15)]
+        else:
+            offsets = [(0.0, 0.05), (0.0, 0.0), (0.0, 0.04), (0.0, 0.06)]
+        for joint, (dx, dy) in zip(joints, offsets):
+            points[joint] = (x + dx * scale, cy + dy * scale, 0.0)
+
+    if noise:
+        rng = rng or np.random.default_rng()
+        points[:, :2] += rng.normal(0.0, noise, size=(NUM_LANDMARKS, 2)).astype(np.float32)
+    return points
+
+
+def synthetic_throw(gesture, fps=30.0, empty_frames=10, relaxed_frames=12, transition_frames=8,
+                    hold_frames=40, noise=0.003, rng=None):
+    """Timestamps, landmarks and scores of a hand that enters relaxed and moves into a gesture"""
+    rng = rng or np.random.default_rng()
+    relaxed = synthetic_hand(RELAXED_FINGERS)
+    final = synthetic_hand(gesture)
+    empty = np.full((NUM_LANDMARKS, 3), np.nan, dtype=np.float32)
+
+    landmarks = [empty] * empty_frames + [relaxed] * relaxed_frames
+    for i in range(1, transition_frames + 1):
+        # Smoothstep easing, like a hand accelerating then settling
+        t = i / transition_frames
+        t = t * t * (3 - 2 * t)
+        landmarks.append(relaxed + (final - relaxed) * t)
+    landmarks += [final] * hold_frames
+
+    landmarks = np.array(landmarks, dtype=np.float32)
+    if noise:
+        landmarks[:, :, :2] += rng.normal(0.0, noise, size=landmarks[:, :, :2].shape).astype(np.float32)
+    timestamps = np.arange(len(landmarks)) / fps
+    scores = np.where(np.isnan(landmarks[:, 0, 0]), 0.0, 0.95)
+    return timestamps, landmarks, scores
+
+
+def save_recording(path, timestamps, landmarks, scores, label="", **extra):
+    """Save a landmark stream; frames without a hand are stored as NaN
+
+    Extra keyword arrays (e.g. session seed and key events) are stored alongside.
+    """
+    np.savez_compressed(
+        path,
+        timestamps=np.asarray(timestamps, dtype=np.float64),
+        landmarks=np.asarray(landmarks, dtype=np.float32).reshape(-1, NUM_LANDMARKS, 3),
+        scores=np.asarray(scores, dtype=np.float32),
+        label=np.array(label or ""),
+        **extra
+    )
+
+
+def load_recording(path):
+    """Load a landmark stream saved with save_recording"""
+    with np.load(path) as data:
+        recording = {name: data[name] for name in data.files}
+    recording["path"] = str(path)
+    recording["label"] = str(recording["label"])
+    return recording
+
+
+def iter_recording(recording):
+    """Yield (timestamp, score, HandFrame or None) for each recorded frame"""
+    for timestamp, points, score in zip(recording["timestamps"], recording["landmarks"], recording["scores"]):
+        if np.isnan(points[0, 0]):
+            yield float(timestamp), 0.0, None
+        else:
+            yield float(timestamp), float(score), HandFrame(points, score=float(score))
+
+
+def record_session(path, label="", seconds=10.0, camera_index=0):
+    """Record a landmark stream from the webcam for later replay"""
+    import cv2
+    import mediapipe as mp
+    from camera_capture import open_camera
+    from display_sinks import HighGuiSink
+
+    # Record with permissive thresholds so replays can gate them upwards
+    hands = mp.solutions.hands.Hands(
+        static_image_mode=False,
+        max_num_hands=1,
+        min_detection_confidence=0.5,
+        min_tracking_confidence=0.5
+    )
+    cap = open_camera(camera_index)
+    if not cap.isOpened():
+        print("Error: Could not open webcam")
+        hands.close()
+        return False
+
+    timestamps = []
+    landmarks = []
+    scores = []
+    empty = np.full((NUM_LANDMARKS, 3), np.nan, dtype=np.float32)
+
+    display = HighGuiSink('Recording Landmarks')
+    print(f"🎥 Recording '{label or 'unlabelled'}' for {seconds:.0f} seconds...")
+    start_time = time.time()
+    while time.time() - start_time < seconds:
+        ret, frame = cap.read()
+        if not ret:
+            print("Error: Could not read frame")
+            break
+
+        frame = cv2.flip(frame, 1)
+        results = hands.process(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB))
+
+        timestamps.append(time.time())
+        # Legacy solutions only expose the handedness score, used here as detection score
+        hand = HandFrame.from_results(results)
+        if hand:
+            landmarks.append(hand.points)
+            scores.append(hand.score)
+        else:
+            landmarks.append(empty)
+            scores.append(0.0)
+
+        display.show(frame)
+        if any(event.key == 'q' for event in display.poll_events()):
+            break
+
+    cap.release()
+    display.close()
+    hands.close()
+
+    save_recording(path, timestamps, landmarks, scores, label)
+    print(f"💾 Saved {len(timestamps)} frames to {path}")
+    return True
@@ -54,9 +54,19 @@ def run_basic_game():
 
 def run_enhanced_game():
     """Run the enhanced version of the game"""
+    from game_config import PROFILES
+    names = list(PROFILES)
+    print("Performance profile:")
+    print("  0. Default")
+    for number, name in enumerate(names, 1):
+        print(f"  {number}. {name}")
+    choice = input("Choose a profile (Enter for default): ").strip()
+    command = [sys.executable, "enhanced_game.py"]
+    if choice.isdigit() and 1 <= int(choice) <= len(names):
+        command += ["--profile", names[int(choice) - 1]]
     print("Starting Enhanced Game...")
     try:
-        subprocess.run([sys.executable, "enhanced_game.py"])
+        subprocess.run(command)
     except FileNotFoundError:
         print("Error: enhanced_game.py not found!")
         input("Press Enter to continue...")
@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Match rules for Rock Paper Scissors Game
+Best-of-N, first-to-K and timed rounds for the live game, plus compact
+array-backed tournament brackets for headless simulation
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+
+class MatchRules:
+    """Free play: rounds are scored but nobody ever wins the match"""
+    name = "Regular"
+    spec = "regular"  # What parse_rules() turns back into these rules
+    target = None  # Wins needed, or None when the match never ends
+    round_time_limit = None  # Seconds to show a gesture before the round is forfeited
+
+    def winner(self, player_score, computer_score):
+        """Return "player", "computer" or None"""
+        if self.target is None:
+            return None
+        if player_score >= self.target:
+            return "player"
+        if computer_score >= self.target:
+            return "computer"
+        return None
+
+    def progress(self, player_score, computer_score):
+        """(leader's wins, wins needed) for progress displays"""
+        return max(player_score, computer_score), self.target
+
+
+class BestOfN(MatchRules):
+    """Win a majority of N rounds (ties do not count)"""
+
+    def __init__(self, rounds=5):
+        self.name = f"Best of {rounds}"
+        self.spec = f"best-of:{rounds}"
+        self.target = rounds // 2 + 1
+
+
+class FirstToK(MatchRules):
+    """First side to K round wins takes the match"""
+
+    def __init__(self, wins=3):
+        self.name = f"First to {wins}"
+        self.spec = f"first-to:{wins}"
+        self.target = wins
+
+
+class TimedRounds(MatchRules):
+    """Wraps other rules; not showing a gesture in time forfeits the round"""
+
+    def __init__(self, seconds=10.0, rules=None):
+        self.rules = rules or MatchRules()
+        self.round_time_limit = seconds
+        self.name = f"{self.rules.name}, {seconds:g}s rounds"
+        self.spec = f"timed:{seconds:g},{self.rules.spec}"
+        self.target = self.rules.target
+
+    def winner(self, player_score, computer_score):
+        return self.rules.winner(player_score, computer_score)
+
+
+def parse_rules(spec):
+    """Parse rules like "best-of:5", "first-to:3" or "timed:10,best-of:5" """
+    if not spec or spec == "regular":
+        return MatchRules()
+    head, _, rest = spec.partition(",")
+    kind, _, value = head.partition(":")
+    if kind == "best-of":
+        return BestOfN(int(value or 5))
+    if kind == "first-to":
+        return FirstToK(int(value or 3))
+    if kind == "timed":
+        return TimedRounds(float(value or 10), parse_rules(rest))
+    raise ValueError(f"Unknown match rules: {spec}")
+
+
+# One fixed-size record per bracket match
+MATCH_DTYPE = np.dtype([
+    ("player_a", np.int32),
+    ("player_b", np.int32),
+    ("score_a", np.int16),
+    ("score_b", np.int16),
+    ("rounds", np.int16),
+    ("winner", np.int32)
+])
+
+
+class Tournament:
+    """Single-elimination bracket stored as one structured array per bracket round"""
+
+    def __init__(self, num_players, rules, seed=None):
+        if rules.target is None:
+            raise ValueError("Tournament matches need rules with a winning target")
+        self.num_players = num_players
+        self.rules = rules
+        self.rng = np.random.default_rng(seed)
+        self.bracket_rounds = []
+
+    def seed_round(self, players):
+        """Pair players; an odd player out gets a bye"""
+        matches = np.zeros(len(players) // 2 + len(players) % 2, dtype=MATCH_DTYPE)
+        matches["player_a"] = players[0::2]
+        matches["player_b"][:len(players) // 2] = players[1::2]
+        matches["winner"] = -1
+        if len(players) % 2:
+            matches["player_b"][-1] = -1
+            matches["winner"][-1] = players[-1]
+        return matches
+
+    def play_matches(self, matches, max_rounds=1000):
+        """Play every undecided match at once, one vectorized round at a time
+
+        Matches still open after max_rounds go to the player ahead on points,
+        and level ones to a coin toss, so every match ends with a winner.
+        """
+        target = self.rules.target
+        for _ in range(max_rounds):
+            live = np.flatnonzero(matches["winner"] < 0)
+            if live.size == 0:
+                break
+            # 0=rock, 1=paper, 2=scissors; a beats b when (a - b) % 3 == 1
+            gesture_a = self.rng.integers(0, 3, live.size)
+            gesture_b = self.rng.integers(0, 3, live.size)
+            outcome = (gesture_a - gesture_b) % 3
+            matches["score_a"][live] += outcome == 1
+            matches["score_b"][live] += outcome == 2
+            matches["rounds"][live] += 1
+
+            decided_a = live[matches["score_a"][live] >= target]
+            decided_b = live[matches["score_b"][live] >= target]
+            matches["winner"][decided_a] = matches["player_a"][decided_a]
+            matches["winner"][decided_b] = matches["player_b"][decided_b]
+
+        live = np.flatnonzero(matches["winner"] < 0)
+        if live.size:
+            score_a, score_b = matches["score_a"][live], matches["score_b"][live]
+            toss = self.rng.integers(0, 2, live.size).astype(bool)
+            a_wins = (score_a > score_b) | ((score_a == score_b) & toss)
+            matches["winner"][live] = np.where(a_wins, matches["player_a"][live], matches["player_b"][live])
+        return matches
+
+    def run(self):
+        """Play the whole bracket and return the champion"""
+        players = self.rng.permutation(self.num_players).astype(np.int32)
+        while len(players) > 1:
+            matches = self.play_matches(self.seed_round(players))
+            self.bracket_rounds.append(matches)
+            players = matches["winner"]
+        return int(players[0])
+
+    def memory_usage(self):
+        """Bytes held by all bracket records"""
+        return sum(matches.nbytes for matches in self.bracket_rounds)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Simulate a Rock Paper Scissors tournament")
+    parser.add_argument("--players", type=int, default=1024)
+    parser.add_argument("--rules", default="best-of:5", help="best-of:N or first-to:K")
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    tournament = Tournament(args.players, parse_rules(args.rules), args.seed)
+    start = time.perf_counter()
+    champion = tournament.run()
+    elapsed = time.perf_counter() - start
+
+    total_matches = sum(len(matches) for matches in tournament.bracket_rounds)
+    total_rounds = sum(int(matches["rounds"].sum()) for matches in tournament.bracket_rounds)
+    print(f"🏆 Player {champion} wins the {args.players}-player {tournament.rules.name} tournament")
+    print(f"📊 {total_matches} matches, {total_rounds} rounds in {elapsed:.2f}s "
+          f"using {tournament.memory_usage() / 1024:.1f} KiB of match records")
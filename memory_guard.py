@@ -0,0 +1,315 @@
+#!/usr/bin/env python3
+"""
+Memory instrumentation for Rock Paper Scissors Game
+Opt-in tracemalloc snapshots and RSS sampling for long kiosk sessions, plus
+a headless soak test that drives the game loop through hours of synthetic
+frames and fails when memory keeps growing
+"""
+
+import argparse
+import contextlib
+import io
+import linecache
+import os
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+from display_sinks import NullSink
+from hand_frame import HandFrame
+from idle_mode import IdleController
+from landmark_io import synthetic_hand
+from pose_backends import PoseBackend, load_frames
+
+# Allocation sites from these files are the profiler's own bookkeeping
+IGNORED_FILES = (tracemalloc.__file__, linecache.__file__, "<frozen importlib._bootstrap>",
+                 "<frozen importlib._bootstrap_external>", "<unknown>")
+
+
+def rss_bytes():
+    """Resident set size of this process, or None where it cannot be read"""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        pass
+    try:
+        import resource
+        # Peak rather than current RSS, but still shows a steady climb
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if os.uname().sysname == "Darwin" else peak * 1024
+    except (ImportError, AttributeError):
+        return None
+
+
+def growth_rate(times, values):
+    """Least-squares slope of values over times (units per second)"""
+    if len(times) < 2:
+        return 0.0
+    return float(np.polyfit(np.asarray(times) - times[0], np.asarray(values, dtype=np.float64), 1)[0])
+
+
+class MemoryMonitor:
+    """Samples RSS and traced Python memory while a game loop runs
+
+    Call sample() once per frame; it only does real work every rss_interval
+    (RSS) and snapshot_interval (tracemalloc) seconds.
+    """
+
+    def __init__(self, rss_interval=5.0, snapshot_interval=300.0, top=10, trace_depth=1,
+                 periodic_reports=False, clock=time.monotonic):
+        self.rss_interval = rss_interval
+        self.snapshot_interval = snapshot_interval
+        self.periodic_reports = periodic_reports  # Print a report with every snapshot
+        self.top = top
+        self.trace_depth = trace_depth
+        self.clock = clock
+        self.rss_times = []
+        self.rss_values = []
+        self.traced_values = []
+        self.baseline = None
+        self.latest = None
+        self.next_rss = 0.0
+        self.next_snapshot = 0.0
+
+    def start(self):
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.trace_depth)
+        now = self.clock()
+        self.next_rss = now
+        self.next_snapshot = now + self.snapshot_interval
+        self.baseline = self.take_snapshot()
+        self.sample()
+
+    def take_snapshot(self):
+        snapshot = tracemalloc.take_snapshot()
+        return snapshot.filter_traces([tracemalloc.Filter(False, name) for name in IGNORED_FILES])
+
+    def sample(self):
+        """Record RSS and traced memory when their intervals have elapsed"""
+        now = self.clock()
+        if now >= self.next_rss:
+            self.next_rss = now + self.rss_interval
+            self.rss_times.append(now)
+            self.rss_values.append(rss_bytes() or 0)
+            self.traced_values.append(tracemalloc.get_traced_memory()[0])
+        if now >= self.next_snapshot:
+            self.next_snapshot = now + self.snapshot_interval
+            self.latest = self.take_snapshot()
+            if self.periodic_reports:
+                self.report()
+
+    def rebase(self):
+        """Use the current state as the baseline, e.g. once caches have warmed up"""
+        self.rss_times, self.rss_values, self.traced_values = [], [], []
+        self.next_rss = self.clock()
+        self.baseline = self.take_snapshot()
+        self.sample()
+
+    def growth(self):
+        """(RSS growth, traced growth) in bytes since the baseline"""
+        if not self.rss_values:
+            return 0, 0
+        return self.rss_values[-1] - self.rss_values[0], self.traced_values[-1] - self.traced_values[0]
+
+    def top_allocations(self):
+        """Allocation sites that grew the most since the baseline"""
+        latest = self.latest or self.take_snapshot()
+        return latest.compare_to(self.baseline, "lineno")[:self.top]
+
+    def report(self):
+        """Print the memory trend and the top allocation sites"""
+        rss_growth, traced_growth = self.growth()
+        elapsed = self.rss_times[-1] - self.rss_times[0] if self.rss_times else 0.0
+        print(f"🧠 Memory over {elapsed / 60:.1f} min: RSS {self.rss_values[-1] / 2**20:.1f} MiB "
+              f"({rss_growth / 2**20:+.2f} MiB, {growth_rate(self.rss_times, self.rss_values) * 3600 / 2**20:+.2f} MiB/h), "
+              f"traced Python {self.traced_values[-1] / 2**20:.1f} MiB ({traced_growth / 2**20:+.2f} MiB)")
+        print(f"🔎 Top {self.top} allocation sites by growth:")
+        for stat in self.top_allocations():
+            frame = stat.traceback[0]
+            print(f"  {stat.size_diff / 1024:+9.1f} KiB {stat.count_diff:+7d} blocks  "
+                  f"{os.path.basename(frame.filename)}:{frame.lineno}")
+
+    def stop(self):
+        tracemalloc.stop()
+
+
+class SimulatedClock:
+    """Clock advanced by the soak capture so hours of play run at full speed"""
+
+    def __init__(self, start=0.0):
+        self.now = start
+
+    def __call__(self):
+        return self.now
+
+
+class SoakCapture:
+    """cv2.VideoCapture look-alike for the soak test
+
+    Every read advances the simulated clock by at least one frame. The scene
+    moves while a player is present and freezes for quiet_seconds out of
+    every cycle_seconds, which lets the idle controller kick in.
+    """
+
+    def __init__(self, clock, count, fps=30.0, cycle_seconds=600.0, quiet_seconds=120.0, seed=0):
+        self.clock = clock
+        self.count = count
+        self.frame_interval = 1.0 / fps
+        self.cycle_seconds = cycle_seconds
+        self.quiet_seconds = quiet_seconds
+        # A bright block sways across the scene while someone plays, which registers as motion
+        self.empty = load_frames(count=1, seed=seed)[0]
+        self.frames = []
+        for i in range(16):
+            frame = self.empty.copy()
+            x = 160 + 20 * abs(i - 8)
+            frame[120:480, x:x + 200] = (170, 190, 220)
+            self.frames.append(frame)
+        self.occupied = True
+        self.reads = 0
+        self.last_read = clock()
+
+    def isOpened(self):
+        return self.reads < self.count
+
+    def read(self):
+        if self.reads >= self.count:
+            return False, None
+        self.reads += 1
+        # A throttled loop has already moved the clock past the next frame
+        self.clock.now = self.last_read = max(self.clock.now, self.last_read + self.frame_interval)
+        self.occupied = self.clock.now % self.cycle_seconds < self.cycle_seconds - self.quiet_seconds
+        return True, self.frames[self.reads % len(self.frames)] if self.occupied else self.empty
+
+    def release(self):
+        self.count = 0
+
+
+class SoakBackend(PoseBackend):
+    """Noisy hands that come and go while the soak capture has a player"""
+    name = "soak"
+
+    def __init__(self, capture, seed=0):
+        rng = np.random.default_rng(seed)
+        self.capture = capture
+        # A small pool of noisy hands stands in for camera-driven landmarks
+        self.hands = [HandFrame(synthetic_hand(gesture, noise=0.004, rng=rng), score=0.95)
+                      for gesture in ("rock", "paper", "scissors") for _ in range(8)]
+
+    def detect(self, frame, timestamp=None):
+        # Hands come and go, holding one gesture for about two seconds
+        n = self.capture.reads
+        if not self.capture.occupied or not (n // 45) % 4:
+            return None
+        return self.hands[(n // 60) % len(self.hands)]
+
+
+class SoakIdle(IdleController):
+    """Idle controller that jumps the simulated clock instead of sleeping"""
+
+    def throttle(self):
+        if self.idle:
+            self.clock.now = max(self.clock.now, self.last_tick + self.idle_interval)
+
+
+class SoakSink(NullSink):
+    """Headless display that presses keys now and then and quits at the frame budget"""
+
+    def __init__(self, clock, seconds, warmup_seconds, monitor, console, seed=0):
+        super().__init__()
+        self.clock = clock
+        self.seconds = seconds
+        self.warmup_seconds = warmup_seconds
+        self.monitor = monitor
+        self.console = console
+        self.rng = np.random.default_rng(seed)
+
+    def show(self, frame):
+        super().show(frame)
+        if self.frame_count % 9000 == 0:
+            self.push_key(self.rng.choice(["r", "b", "a", "h"]))
+        if self.warmup_seconds is not None and self.clock() >= self.warmup_seconds:
+            self.warmup_seconds = None
+            self.monitor.rebase()
+        if self.clock() >= self.seconds:
+            # Let the game's own shutdown reports through
+            self.push_key("q")
+            self.console.quiet = False
+
+
+class SoakConsole(io.TextIOBase):
+    """Swallows the game's console output until the soak loop is done"""
+
+    def __init__(self, stream):
+        self.stream = stream
+        self.quiet = True
+
+    def write(self, text):
+        if not self.quiet:
+            self.stream.write(text)
+        return len(text)
+
+    def flush(self):
+        self.stream.flush()
+
+
+def run_soak(hours=4.0, fps=30.0, warmup_minutes=10.0, max_growth_mb=20.0, render=True,
+             report_minutes=60.0, seed=0):
+    """Drive run_game headlessly and fail if memory keeps growing after warmup"""
+    from enhanced_game import EnhancedRockPaperScissorsGame
+    from game_config import GameConfig
+    from game_events import HistoryWriter
+    from input_events import create_inputs
+    from metrics import GameMetrics
+
+    total_frames = int(hours * 3600 * fps)
+    clock = SimulatedClock()
+    capture = SoakCapture(clock, total_frames + 1, fps, seed=seed)
+    game = EnhancedRockPaperScissorsGame(seed=seed, config=GameConfig({"backend": "stub"}))
+    game.clock = clock
+    game.pose_backend.close()
+    game.pose_backend = SoakBackend(capture, seed)
+    if not render:
+        # Soak only the game logic
+        game.draw_ui = lambda frame, hand_landmarks=None: None
+    game.events.subscribe(HistoryWriter(os.devnull))
+
+    monitor = MemoryMonitor(rss_interval=60.0, snapshot_interval=report_minutes * 60.0, clock=clock)
+    console = SoakConsole(sys.stdout)
+    display = SoakSink(clock, hours * 3600, warmup_minutes * 60, monitor, console, seed)
+    inputs = create_inputs(["gestures"])
+
+    start = time.perf_counter()
+    print(f"🧪 Soak test: {hours:g} simulated hours, up to {total_frames} frames")
+    # Round results and idle notices go through the console; keep them out of the terminal
+    with contextlib.redirect_stdout(console):
+        game.run_game(display, monitor=monitor, inputs=inputs, idle=SoakIdle(clock=clock), capture=capture,
+                      metrics=GameMetrics())
+    elapsed = time.perf_counter() - start
+    print(f"⏱️  {display.frame_count} frames in {elapsed:.0f}s ({display.frame_count / elapsed:.0f} frames/s), "
+          f"{game.round_count} rounds in the last match")
+
+    rss_growth, traced_growth = monitor.growth()
+    growth = max(rss_growth, traced_growth) / 2**20
+    if growth > max_growth_mb:
+        print(f"❌ Memory grew {growth:.1f} MiB after warmup (limit {max_growth_mb:g} MiB)")
+        return False
+    print(f"✅ Memory growth {growth:.2f} MiB after warmup is within {max_growth_mb:g} MiB")
+    return True
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Headless memory soak test for Rock Paper Scissors Game")
+    parser.add_argument("--hours", type=float, default=4.0, help="Simulated hours of play")
+    parser.add_argument("--fps", type=float, default=30.0)
+    parser.add_argument("--warmup-minutes", type=float, default=10.0, help="Simulated minutes before the baseline")
+    parser.add_argument("--max-growth-mb", type=float, default=20.0, help="Allowed growth after warmup")
+    parser.add_argument("--no-render", action="store_true", help="Skip draw_ui to soak only the game logic")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    ok = run_soak(args.hours, args.fps, args.warmup_minutes, args.max_growth_mb, not args.no_render, seed=args.seed)
+    raise SystemExit(0 if ok else 1)
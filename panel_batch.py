@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Batched score panels for Rock Paper Scissors Game
+Lays out one score panel per player in a tiled canvas: backgrounds and
+labels are drawn once, bars are filled for all panels in one NumPy step and
+numbers are stamped from the text cache only for panels whose values changed
+"""
+
+import argparse
+import math
+import time
+
+import cv2
+import numpy as np
+
+from text_cache import put_text
+
+PANEL_WIDTH = 240
+PANEL_HEIGHT = 126
+
+NAVY = (128, 0, 0)
+WHITE = (255, 255, 255)
+GOLD = (0, 215, 255)
+LIME = (0, 255, 127)
+RED = (0, 0, 255)
+GREEN = (0, 255, 0)
+YELLOW = (0, 255, 255)
+
+# Row labels and the baseline of their values
+ROWS = [("PLAYER", 48, LIME), ("CPU", 72, RED), ("ROUND", 96, WHITE)]
+VALUE_X = 110
+VALUE_REGION = (30, 102, VALUE_X - 4, PANEL_WIDTH - 6)  # y0, y1, x0, x1 restored before restamping
+BAR = (106, 114, 10, PANEL_WIDTH - 10)  # y0, y1, x0, x1
+
+
+class BatchedPanelRenderer:
+    """Draws K score panels into one canvas, redrawing only what changed"""
+
+    def __init__(self, titles, columns=None, canvas_width=None):
+        self.titles = list(titles)
+        count = len(self.titles)
+        if columns is None:
+            columns = max(1, (canvas_width or 0) // PANEL_WIDTH) if canvas_width else math.ceil(math.sqrt(count))
+        self.columns = min(columns, count)
+        self.rows = math.ceil(count / self.columns)
+        width = max(canvas_width or 0, self.columns * PANEL_WIDTH)
+        self.canvas = np.zeros((self.rows * PANEL_HEIGHT, width, 3), dtype=np.uint8)
+
+        # Panel (row, column) of every title, and a (rows, columns, h, w, 3) view onto the canvas
+        self.panel_rows, self.panel_columns = np.divmod(np.arange(count), self.columns)
+        grid = self.canvas[:, :self.columns * PANEL_WIDTH]
+        self.panels = grid.reshape(self.rows, PANEL_HEIGHT, self.columns, PANEL_WIDTH, 3).swapaxes(1, 2)
+
+        self.draw_static()
+        self.static_panels = self.panels.copy()
+        self.values = np.full((count, 4), -1.0)
+
+    def draw_static(self):
+        """Backgrounds, borders and labels, drawn once per layout"""
+        rows, columns = self.panel_rows, self.panel_columns
+        self.panels[rows, columns] = NAVY
+        # Two-pixel border on all panels at once
+        self.panels[rows, columns, :2] = WHITE
+        self.panels[rows, columns, -2:] = WHITE
+        self.panels[rows, columns, :, :2] = WHITE
+        self.panels[rows, columns, :, -2:] = WHITE
+
+        for i, title in enumerate(self.titles):
+            x0, y0 = self.panel_origin(i)
+            put_text(self.canvas, title, (x0 + 10, y0 + 22), cv2.FONT_HERSHEY_SIMPLEX, 0.55, GOLD, 2)
+            for label, baseline, color in ROWS:
+                put_text(self.canvas, label, (x0 + 10, y0 + baseline), cv2.FONT_HERSHEY_SIMPLEX, 0.45, color, 1)
+
+    def panel_origin(self, index):
+        return int(self.panel_columns[index]) * PANEL_WIDTH, int(self.panel_rows[index]) * PANEL_HEIGHT
+
+    def render(self, values):
+        """Update panels from a (K, 4) array of player score, computer score, round, confidence"""
+        values = np.asarray(values, dtype=np.float64)
+        changed = np.flatnonzero((values != self.values).any(axis=1))
+        if changed.size == 0:
+            return self.canvas
+        rows, columns = self.panel_rows[changed], self.panel_columns[changed]
+
+        # Restore the value and bar areas of changed panels from the static layer
+        vy0, vy1, vx0, vx1 = VALUE_REGION
+        by0, by1, bx0, bx1 = BAR
+        self.panels[rows, columns, vy0:vy1, vx0:vx1] = self.static_panels[rows, columns, vy0:vy1, vx0:vx1]
+
+        # Confidence bars for every changed panel in one masked fill
+        confidence = values[changed, 3]
+        bar_width = bx1 - bx0
+        filled = np.arange(bar_width) < (confidence * bar_width).astype(int)[:, None]
+        colors = np.where((confidence > 0.8)[:, None], GREEN,
+                          np.where((confidence > 0.6)[:, None], YELLOW, RED)).astype(np.uint8)
+        bars = np.where(filled[:, None, :, None], colors[:, None, None, :], np.uint8(0))
+        self.panels[rows, columns, by0:by1, bx0:bx1] = bars
+
+        for i in changed:
+            x0, y0 = self.panel_origin(i)
+            for column, (_, baseline, color) in enumerate(ROWS):
+                put_text(self.canvas, str(int(values[i, column])), (x0 + VALUE_X, y0 + baseline),
+                         cv2.FONT_HERSHEY_SIMPLEX, 0.7, color, 2)
+        self.values = values.copy()
+        return self.canvas
+
+
+def game_panel_values(games):
+    """(K, 4) panel values for a list of games"""
+    return np.array([(game.player_score, game.computer_score, game.round_count, game.gesture_confidence)
+                     for game in games], dtype=np.float64)
+
+
+def benchmark(counts=(1, 4, 16), frames=300):
+    """Compare per-game draw_clean_score_panel calls with the batched renderer"""
+    from enhanced_game import EnhancedRockPaperScissorsGame
+
+    rng = np.random.default_rng(0)
+    for count in counts:
+        games = [EnhancedRockPaperScissorsGame(use_mediapipe=False, seed=i) for i in range(count)]
+        frame = np.zeros((480, 640, 3), dtype=np.uint8)
+        renderer = BatchedPanelRenderer([f"STATION {i}" for i in range(count)])
+
+        individual = batched = 0.0
+        for n in range(frames):
+            # About one panel in eight changes per frame, as rounds end at different times
+            for game in games:
+                if rng.random() < 0.125:
+                    game.round_count += 1
+                    game.player_score += int(rng.integers(0, 2))
+                    game.gesture_confidence = float(rng.random())
+
+            start = time.perf_counter()
+            for game in games:
+                game.draw_clean_score_panel(frame, 640, 480)
+            individual += time.perf_counter() - start
+
+            start = time.perf_counter()
+            renderer.render(game_panel_values(games))
+            batched += time.perf_counter() - start
+
+        for game in games:
+            game.events.close()
+        print(f"  {count:>2} panels: individual {individual / frames * 1000:.3f} ms, "
+              f"batched {batched / frames * 1000:.3f} ms per frame")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark batched score panel rendering")
+    parser.add_argument("--frames", type=int, default=300)
+    args = parser.parse_args()
+    print("⏱️  Score panel rendering:")
+    benchmark(frames=args.frames)
@@ -0,0 +1,437 @@
+#!/usr/bin/env python3
+"""
+Hand pose backends for Rock Paper Scissors Game
+One interface in front of MediaPipe legacy solutions, MediaPipe Tasks,
+an ONNX Runtime landmark model (optional onnxruntime package) and a
+deterministic stub, plus a common benchmark to pick the fastest CPU
+backend on a machine
+"""
+
+import argparse
+import threading
+import time
+from collections import deque
+
+import cv2
+import numpy as np
+
+from hand_frame import NUM_LANDMARKS, HandFrame
+
+
+class PoseBackend:
+    """Base class: turns a BGR frame into a HandFrame (or None)
+
+    Subclasses set name, build themselves from the text after "name:" in
+    from_spec(), and become available to create_backend() once passed to
+    register_backend().
+    """
+    name = "base"
+    asynchronous = False  # detect() returns before inference on that frame is done
+
+    @classmethod
+    def from_spec(cls, argument, min_detection_confidence, min_tracking_confidence, max_num_hands=1):
+        raise NotImplementedError
+
+    def detect(self, frame, timestamp=None):
+        """Landmarks of the first hand in the frame; timestamp is in seconds"""
+        raise NotImplementedError
+
+    def report(self):
+        """Print backend-specific statistics, if any"""
+
+    def reset_stats(self):
+        """Forget the statistics gathered so far, e.g. during a warmup"""
+
+    def close(self):
+        pass
+
+
+class LegacyHandsBackend(PoseBackend):
+    """mp.solutions.hands, the graph the game has always used"""
+    name = "legacy"
+
+    def __init__(self, min_detection_confidence=0.8, min_tracking_confidence=0.6, model_complexity=1,
+                 max_num_hands=1):
+        import mediapipe as mp
+        self.hands = mp.solutions.hands.Hands(
+            static_image_mode=False,
+            max_num_hands=max_num_hands,
+            model_complexity=model_complexity,
+            min_detection_confidence=min_detection_confidence,
+            min_tracking_confidence=min_tracking_confidence
+        )
+
+    @classmethod
+    def from_spec(cls, argument, min_detection_confidence, min_tracking_confidence, max_num_hands=1):
+        return cls(min_detection_confidence, min_tracking_confidence, model_complexity=0 if argument == "lite" else 1,
+                   max_num_hands=max_num_hands)
+
+    def detect(self, frame, timestamp=None):
+        results = self.hands.process(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB))
+        return HandFrame.from_results(results)
+
+    def close(self):
+        self.hands.close()
+
+
+class TasksBackend(PoseBackend):
+    """MediaPipe Tasks HandLandmarker in VIDEO mode (needs a hand_landmarker.task model)"""
+    name = "tasks"
+
+    def __init__(self, model_path, min_detection_confidence=0.8, min_tracking_confidence=0.6, max_num_hands=1):
+        import mediapipe as mp
+        from mediapipe.tasks.python import vision
+
+        self.mp = mp
+        self.vision = vision
+        self.max_num_hands = max_num_hands
+        self.landmarker = vision.HandLandmarker.create_from_options(self.options(
+            model_path, vision.RunningMode.VIDEO, min_detection_confidence, min_tracking_confidence))
+        self.last_timestamp_ms = -1
+
+    @classmethod
+    def from_spec(cls, argument, min_detection_confidence, min_tracking_confidence, max_num_hands=1):
+        if not argument:
+            raise ValueError(f"The {cls.name} backend needs a model path: {cls.name}:<hand_landmarker.task>")
+        return cls(argument, min_detection_confidence, min_tracking_confidence, max_num_hands=max_num_hands)
+
+    def options(self, model_path, running_mode, min_detection_confidence, min_tracking_confidence, **extra):
+        from mediapipe.tasks import python as mp_tasks
+        return self.vision.HandLandmarkerOptions(
+            base_options=mp_tasks.BaseOptions(model_asset_path=model_path),
+            running_mode=running_mode,
+            num_hands=self.max_num_hands,
+            min_hand_detection_confidence=min_detection_confidence,
+            min_hand_presence_confidence=min_detection_confidence,
+            min_tracking_confidence=min_tracking_confidence,
+            **extra
+        )
+
+    def timestamp_ms(self, timestamp):
+        """Milliseconds that strictly increase, as the Tasks graph requires"""
+        timestamp_ms = int((time.monotonic() if timestamp is None else timestamp) * 1000)
+        self.last_timestamp_ms = max(timestamp_ms, self.last_timestamp_ms + 1)
+        return self.last_timestamp_ms
+
+    def image(self, frame):
+        return self.mp.Image(image_format=self.mp.ImageFormat.SRGB, data=cv2.cvtColor(frame, cv2.COLOR_BGR2RGB))
+
+    def detect(self, frame, timestamp=None):
+        result = self.landmarker.detect_for_video(self.image(frame), self.timestamp_ms(timestamp))
+        return HandFrame.from_task_result(result)
+
+    def close(self):
+        self.landmarker.close()
+
+
+class LiveStreamBackend(TasksBackend):
+    """HandLandmarker in LIVE_STREAM mode: frames are submitted and never waited for
+
+    detect() hands the frame to the graph with detect_async() and returns
+    the newest result that has arrived through the callback, so the game
+    loop renders at capture rate while inference runs at its own pace. The
+    graph queues whatever it is given, so frames arriving while
+    max_in_flight are still being processed are skipped here instead of
+    piling up behind them. A frame whose result has not come back within
+    expire_after frames is given up on, so a result the graph never
+    delivers cannot keep the backend busy forever. Every result's end-to-end latency
+    (submit to callback) and every frame's staleness (age of the result it
+    was rendered with) are recorded.
+    """
+    name = "tasks-live"
+    asynchronous = True
+
+    def __init__(self, model_path, min_detection_confidence=0.8, min_tracking_confidence=0.6, max_num_hands=1,
+                 max_in_flight=1, expire_after=4, history=10000):
+        import mediapipe as mp
+        from mediapipe.tasks.python import vision
+
+        self.mp = mp
+        self.vision = vision
+        self.max_num_hands = max_num_hands
+        self.last_timestamp_ms = -1
+        self.lock = threading.Lock()
+        self.submitted = {}  # timestamp_ms -> (perf_counter() at submit, frame number), until its result arrives
+        self.latest = None  # (HandFrame or None, timestamp_ms of its frame)
+        self.max_in_flight = max_in_flight
+        self.expire_after = expire_after
+        self.frames = 0
+        self.skipped = 0
+        self.expired = 0
+        self.results = 0
+        self.latencies = deque(maxlen=history)
+        self.staleness = deque(maxlen=history)
+        self.landmarker = vision.HandLandmarker.create_from_options(self.options(
+            model_path, vision.RunningMode.LIVE_STREAM, min_detection_confidence, min_tracking_confidence,
+            result_callback=self.on_result))
+
+    def on_result(self, result, image, timestamp_ms):
+        """Called on MediaPipe's thread"""
+        arrived = time.perf_counter()
+        hand = HandFrame.from_task_result(result)
+        with self.lock:
+            submitted = self.submitted.pop(timestamp_ms, None)
+            # Frames the graph dropped itself never get a result
+            for stale in [ts for ts in self.submitted if ts < timestamp_ms]:
+                del self.submitted[stale]
+            self.latest = (hand, timestamp_ms)
+            self.results += 1
+        if submitted is not None:
+            self.latencies.append(arrived - submitted[0])
+
+    def detect(self, frame, timestamp=None):
+        timestamp_ms = self.timestamp_ms(timestamp)
+        self.frames += 1
+        with self.lock:
+            for lost in [ts for ts, (_, submitted_at) in self.submitted.items()
+                         if self.frames - submitted_at > self.expire_after]:
+                del self.submitted[lost]
+                self.expired += 1
+            busy = len(self.submitted) >= self.max_in_flight
+            if not busy:
+                self.submitted[timestamp_ms] = (time.perf_counter(), self.frames)
+            latest = self.latest
+        if busy:
+            self.skipped += 1
+        else:
+            self.landmarker.detect_async(self.image(frame), timestamp_ms)
+        if latest is None:
+            return None
+        self.staleness.append((timestamp_ms - latest[1]) / 1000.0)
+        return latest[0]
+
+    def reset_stats(self):
+        with self.lock:
+            self.frames = self.skipped = self.expired = self.results = 0
+            self.latencies.clear()
+            self.staleness.clear()
+
+    def report(self):
+        if not self.frames:
+            return
+        print(f"🧵 Live-stream inference: {self.results} results for {self.frames} frames "
+              f"({self.skipped} skipped while busy, {self.expired} given up on)")
+        if self.latencies:
+            print(f"  end-to-end latency mean {np.mean(self.latencies) * 1000:.1f} ms, "
+                  f"p90 {np.percentile(self.latencies, 90) * 1000:.1f} ms")
+        if self.staleness:
+            print(f"  result staleness mean {np.mean(self.staleness) * 1000:.1f} ms, "
+                  f"p90 {np.percentile(self.staleness, 90) * 1000:.1f} ms")
+
+
+class OnnxBackend(PoseBackend):
+    """ONNX Runtime on CPU with a MediaPipe-layout hand landmark model
+
+    The model takes one square RGB crop (NHWC or NCHW, values 0..1) and
+    returns 21 x (x, y, z) in crop pixels plus a hand presence score, like
+    hand_landmark_full converted with tflite2onnx. There is no palm
+    detector: the crop follows the previous hand and falls back to the
+    centered square of the frame, so a hand has to enter near the middle.
+    """
+    name = "onnx"
+
+    def __init__(self, model_path, min_detection_confidence=0.8, threads=None):
+        import onnxruntime
+
+        options = onnxruntime.SessionOptions()
+        if threads:
+            options.intra_op_num_threads = threads
+        self.session = onnxruntime.InferenceSession(model_path, options, providers=["CPUExecutionProvider"])
+        model_input = self.session.get_inputs()[0]
+        self.input_name = model_input.name
+        self.channels_first = model_input.shape[1] == 3
+        self.size = int(model_input.shape[2] if self.channels_first else model_input.shape[1])
+        outputs = self.session.get_outputs()
+        self.output_names = [outputs[0].name, outputs[1].name]
+        self.min_presence = min_detection_confidence
+        self.roi = None  # (x, y, side) of the last crop that held a hand
+
+    @classmethod
+    def from_spec(cls, argument, min_detection_confidence, min_tracking_confidence, max_num_hands=1):
+        if not argument:
+            raise ValueError("The onnx backend needs a model path: onnx:<model.onnx>")
+        return cls(argument, min_detection_confidence)
+
+    def crop_for(self, width, height):
+        if self.roi:
+            return self.roi
+        side = min(width, height)
+        return (width - side) // 2, (height - side) // 2, side
+
+    def detect(self, frame, timestamp=None):
+        height, width = frame.shape[:2]
+        x, y, side = self.crop_for(width, height)
+        # Pad so crops that reach past the frame edge keep their scale
+        padded = cv2.copyMakeBorder(frame, side, side, side, side, cv2.BORDER_CONSTANT)
+        crop = padded[y + side:y + 2 * side, x + side:x + 2 * side]
+        tensor = cv2.cvtColor(cv2.resize(crop, (self.size, self.size)), cv2.COLOR_BGR2RGB).astype(np.float32)
+        tensor *= 1.0 / 255.0
+        tensor = tensor.transpose(2, 0, 1)[None] if self.channels_first else tensor[None]
+        landmarks, presence = self.session.run(self.output_names, {self.input_name: tensor})
+
+        presence = float(np.ravel(presence)[0])
+        if not 0.0 <= presence <= 1.0:
+            presence = 1.0 / (1.0 + np.exp(-presence))
+        if presence < self.min_presence:
+            self.roi = None
+            return None
+
+        # Crop pixels back to normalized frame coordinates
+        points = landmarks.reshape(NUM_LANDMARKS, 3).astype(np.float32)
+        scale = side / self.size
+        points[:, 0] = (points[:, 0] * scale + x) / width
+        points[:, 1] = (points[:, 1] * scale + y) / height
+        points[:, 2] *= scale / width
+
+        # Next crop: the hand's bounding box, doubled and squared
+        low = points[:, :2].min(axis=0) * (width, height)
+        high = points[:, :2].max(axis=0) * (width, height)
+        center = (low + high) / 2
+        roi_side = max(int(max(high - low) * 2.0), 32)
+        self.roi = int(center[0]) - roi_side // 2, int(center[1]) - roi_side // 2, roi_side
+        return HandFrame(points, score=presence)
+
+
+class StubBackend(PoseBackend):
+    """Deterministic synthetic hands for tests: nothing, rock, paper, scissors in turn"""
+    name = "stub"
+
+    def __init__(self, seed=0, hold_seconds=2.0, latency=0.0):
+        from landmark_io import synthetic_hand
+
+        rng = np.random.default_rng(seed)
+        self.schedule = [None] + [HandFrame(synthetic_hand(gesture, noise=0.004, rng=rng), score=0.95)
+                                  for gesture in ("rock", "paper", "scissors")]
+        self.hold_seconds = hold_seconds
+        self.latency = latency  # Simulated inference time
+        self.frames = 0
+
+    @classmethod
+    def from_spec(cls, argument, min_detection_confidence, min_tracking_confidence, max_num_hands=1):
+        return cls(int(argument or 0))
+
+    def detect(self, frame, timestamp=None):
+        if self.latency:
+            time.sleep(self.latency)
+        # Frame count stands in for time when no timestamp is given (30 FPS)
+        timestamp = self.frames / 30.0 if timestamp is None else timestamp
+        self.frames += 1
+        return self.schedule[int(timestamp / self.hold_seconds) % len(self.schedule)]
+
+
+BACKENDS = {}
+
+
+def register_backend(backend_class):
+    """Make a PoseBackend subclass available by its name (usable as a decorator)"""
+    BACKENDS[backend_class.name] = backend_class
+    return backend_class
+
+
+for backend_class in (LegacyHandsBackend, TasksBackend, LiveStreamBackend, OnnxBackend, StubBackend):
+    register_backend(backend_class)
+
+
+def create_backend(spec, min_detection_confidence=0.8, min_tracking_confidence=0.6, max_num_hands=1):
+    """Build a backend from a spec: legacy[:lite], tasks[-live]:<model.task>, onnx:<model.onnx>, stub[:seed]"""
+    kind, _, argument = spec.partition(":")
+    backend_class = BACKENDS.get(kind)
+    if backend_class is None:
+        raise ValueError(f"Unknown pose backend: {spec}")
+    return backend_class.from_spec(argument, min_detection_confidence, min_tracking_confidence, max_num_hands)
+
+
+def load_frames(source=None, count=120, size=(640, 480), seed=0):
+    """Benchmark frames from a video file, or a noisy still scene"""
+    frames = []
+    if source:
+        capture = cv2.VideoCapture(source)
+        while len(frames) < count:
+            ret, frame = capture.read()
+            if not ret:
+                break
+            frames.append(frame)
+        capture.release()
+    if not frames:
+        rng = np.random.default_rng(seed)
+        width, height = size
+        scene = cv2.GaussianBlur(rng.integers(0, 255, (height, width, 3), dtype=np.uint8), (31, 31), 0)
+        frames = [np.clip(scene + rng.integers(-3, 4, scene.shape, dtype=np.int16), 0, 255).astype(np.uint8)
+                  for _ in range(count)]
+    return frames
+
+
+def benchmark_backend(spec, frames, fps=30.0, warmup=10, realtime=False):
+    """Startup time, per-frame latency and throughput of one backend on the same frames
+
+    With realtime, frames are fed at fps like a camera would, which is how
+    asynchronous backends are always judged.
+    """
+    start = time.perf_counter()
+    backend = create_backend(spec)
+    startup = time.perf_counter() - start
+    realtime = realtime or backend.asynchronous
+    try:
+        for i, frame in enumerate(frames[:warmup]):
+            backend.detect(frame, i / fps)
+        # Warmup results must not count towards the throughput or the report
+        backend.reset_stats()
+        latencies = []
+        detected = 0
+        start = time.perf_counter()
+        for i, frame in enumerate(frames):
+            if realtime:
+                time.sleep(max(0.0, start + i / fps - time.perf_counter()))
+            frame_start = time.perf_counter()
+            hand = backend.detect(frame, (warmup + i) / fps)
+            latencies.append(time.perf_counter() - frame_start)
+            detected += hand is not None
+        elapsed = time.perf_counter() - start
+    finally:
+        backend.close()
+    backend.report()
+    # Asynchronous backends return before inference is done; count what they finished
+    inferred = getattr(backend, "results", len(frames))
+    return {
+        "backend": spec,
+        "startup_ms": startup * 1000,
+        "mean_ms": float(np.mean(latencies)) * 1000,
+        "p90_ms": float(np.percentile(latencies, 90)) * 1000,
+        "fps": inferred / elapsed,
+        "loop_fps": len(frames) / elapsed,
+        "detected": detected / len(frames)
+    }
+
+
+def benchmark(specs, frames, realtime=False):
+    """Run every backend and name the fastest by throughput"""
+    results = []
+    print(f"⏱️  {len(frames)} frames of {frames[0].shape[1]}x{frames[0].shape[0]}"
+          f"{' fed at 30 FPS' if realtime else ''}:")
+    for spec in specs:
+        try:
+            result = benchmark_backend(spec, frames, realtime=realtime)
+        except (ImportError, ValueError, RuntimeError) as e:
+            print(f"  {spec:<28} ❌ {e}")
+            continue
+        results.append(result)
+        print(f"  {spec:<28} startup {result['startup_ms']:7.1f} ms, latency {result['mean_ms']:6.2f} ms "
+              f"(p90 {result['p90_ms']:6.2f}), {result['fps']:7.1f} inferences/s, loop {result['loop_fps']:7.1f} FPS, "
+              f"hand in {result['detected']:.0%}")
+    real = [result for result in results if not result["backend"].startswith("stub")]
+    if real:
+        best = max(real, key=lambda result: result["fps"])
+        print(f"🏆 Fastest backend here: {best['backend']}")
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark hand pose backends for Rock Paper Scissors Game")
+    parser.add_argument("command", choices=["benchmark"])
+    parser.add_argument("backends", nargs="*", default=["legacy", "legacy:lite", "stub"],
+                        help="Backend specs: legacy[:lite], tasks[-live]:<model.task>, onnx:<model.onnx>, stub[:seed]")
+    parser.add_argument("--source", help="Video file to take frames from (default: a still synthetic scene)")
+    parser.add_argument("--frames", type=int, default=120)
+    parser.add_argument("--realtime", action="store_true", help="Feed frames at 30 FPS instead of back to back")
+    args = parser.parse_args()
+    benchmark(args.backends, load_frames(args.source, args.frames), args.realtime)
@@ -1,20 +1,25 @@
+import argparse
 import cv2
-import mediapipe as mp
 import numpy as np
 import random
 import time
 
+from text_cache import put_text
+from camera_capture import open_camera
+from display_sinks import create_display
+from hand_frame import FINGER_TIPS, FINGER_PIPS, draw_hand
+from pose_backends import create_backend
+from game_config import (GameConfig, FIELDS, GRAPH, CAMERA, ConfigWatcher, add_config_arguments,
+                         load_config, parse_overrides)
+
 class RockPaperScissorsGame:
-    def __init__(self):
-        # Initialize MediaPipe
-        self.mp_hands = mp.solutions.hands
-        self.hands = self.mp_hands.Hands(
-            static_image_mode=False,
-            max_num_hands=1,
-            min_detection_confidence=0.7,
-            min_tracking_confidence=0.5
-        )
-        self.mp_drawing = mp.solutions.drawing_utils
+    def __init__(self, config=None):
+        # Camera, backend and timing settings shared with the enhanced game (see game_config.py)
+        self.config = config or GameConfig()
+        
+        # Hand pose backend (MediaPipe by default, stub for headless runs)
+        self.pose_backend = self.create_pose_backend()
+        self.clock = time.time
         
         # Game variables
         self.player_score = 0
@@ -26,7 +31,7 @@ class RockPaperScissorsGame:
         self.round_winner = None
         self.countdown_timer = 0
         self.last_gesture_time = 0
-        self.gesture_cooldown = 2.0  # seconds
+        self.gesture_cooldown = self.config.gesture_cooldown  # seconds
         
         # Gesture definitions
         self.gestures = ["rock", "paper", "scissors"]
@@ -51,13 +56,12 @@ class RockPaperScissorsGame:
         # MediaPipe hand landmarks: 6=index pip, 10=middle pip, 14=ring pip, 18=pinky pip
         
         # Check if fingers are extended (tip y < pip y)
-        index_extended = hand_landmarks.landmark[8].y < hand_landmarks.landmark[6].y
-        middle_extended = hand_landmarks.landmark[12].y < hand_landmarks.landmark[10].y
-        ring_extended = hand_landmarks.landmark[16].y < hand_landmarks.landmark[14].y
-        pinky_extended = hand_landmarks.landmark[20].y < hand_landmarks.landmark[18].y
+        points = hand_landmarks.points
+        index_extended, middle_extended, ring_extended, pinky_extended = \
+            (points[FINGER_TIPS, 1] < points[FINGER_PIPS, 1]).tolist()
         
         # Thumb extended (4=tip, 3=pip)
-        thumb_extended = hand_landmarks.landmark[4].x < hand_landmarks.landmark[3].x
+        thumb_extended = points[4, 0] < points[3, 0]
         
         # Gesture classification
         if not index_extended and not middle_extended and not ring_extended and not pinky_extended:
@@ -98,35 +102,30 @@ class RockPaperScissorsGame:
         
         # Draw hand landmarks
         if hand_landmarks:
-            self.mp_drawing.draw_landmarks(
-                frame, 
-                hand_landmarks, 
-                self.mp_hands.HAND_CONNECTIONS,
-                self.mp_drawing.DrawingSpec(color=self.colors["blue"], thickness=2, circle_radius=2),
-                self.mp_drawing.DrawingSpec(color=self.colors["yellow"], thickness=2)
-            )
+            draw_hand(frame, hand_landmarks, self.colors["blue"], self.colors["yellow"],
+                      circle_radius=2, point_thickness=2, line_thickness=2)
         
         # Draw scores
-        cv2.putText(frame, f"Player: {self.player_score}", (10, 30), 
-                   cv2.FONT_HERSHEY_SIMPLEX, 1, self.colors["green"], 2)
-        cv2.putText(frame, f"Computer: {self.computer_score}", (10, 70), 
-                   cv2.FONT_HERSHEY_SIMPLEX, 1, self.colors["red"], 2)
-        cv2.putText(frame, f"Round: {self.round_count}", (10, 110), 
-                   cv2.FONT_HERSHEY_SIMPLEX, 1, self.colors["white"], 2)
+        put_text(frame, f"Player: {self.player_score}", (10, 30), 
+               cv2.FONT_HERSHEY_SIMPLEX, 1, self.colors["green"], 2)
+        put_text(frame, f"Computer: {self.computer_score}", (10, 70), 
+               cv2.FONT_HERSHEY_SIMPLEX, 1, self.colors["red"], 2)
+        put_text(frame, f"Round: {self.round_count}", (10, 110), 
+               cv2.FONT_HERSHEY_SIMPLEX, 1, self.colors["white"], 2)
         
         # Draw game state
         if self.game_state == "waiting":
-            cv2.putText(frame, "Show your gesture!", (width//2 - 150, height//2), 
-                       cv2.FONT_HERSHEY_SIMPLEX, 1.5, self.colors["yellow"], 3)
+            put_text(frame, "Show your gesture!", (width//2 - 150, height//2), 
+                   cv2.FONT_HERSHEY_SIMPLEX, 1.5, self.colors["yellow"], 3)
             
         elif self.game_state == "playing":
             if self.player_gesture:
-                cv2.putText(frame, f"Your move: {self.player_gesture.upper()}", 
-                           (width//2 - 150, height//2 - 50), 
-                           cv2.FONT_HERSHEY_SIMPLEX, 1, self.colors["green"], 2)
-                cv2.putText(frame, f"Computer: {self.computer_gesture.upper()}", 
-                           (width//2 - 150, height//2), 
-                           cv2.FONT_HERSHEY_SIMPLEX, 1, self.colors["red"], 2)
+                put_text(frame, f"Your move: {self.player_gesture.upper()}", 
+                       (width//2 - 150, height//2 - 50), 
+                       cv2.FONT_HERSHEY_SIMPLEX, 1, self.colors["green"], 2)
+                put_text(frame, f"Computer: {self.computer_gesture.upper()}", 
+                       (width//2 - 150, height//2), 
+                       cv2.FONT_HERSHEY_SIMPLEX, 1, self.colors["red"], 2)
                 
         elif self.game_state == "result":
             # Draw result
@@ -140,91 +139,117 @@ class RockPaperScissorsGame:
                 result_text = "IT'S A TIE!"
                 color = self.colors["yellow"]
             
-            cv2.putText(frame, result_text, (width//2 - 150, height//2), 
-                       cv2.FONT_HERSHEY_SIMPLEX, 2, color, 3)
+            put_text(frame, result_text, (width//2 - 150, height//2), 
+                   cv2.FONT_HERSHEY_SIMPLEX, 2, color, 3)
             
         elif self.game_state == "countdown":
-            cv2.putText(frame, f"Next round in: {int(self.countdown_timer)}", 
-                       (width//2 - 150, height//2), 
-                       cv2.FONT_HERSHEY_SIMPLEX, 1.5, self.colors["white"], 3)
+            put_text(frame, f"Next round in: {int(self.countdown_timer)}", 
+                   (width//2 - 150, height//2), 
+                   cv2.FONT_HERSHEY_SIMPLEX, 1.5, self.colors["white"], 3)
         
         # Draw instructions
-        cv2.putText(frame, "Press 'q' to quit, 'r' to reset", (10, height - 20), 
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.7, self.colors["white"], 2)
+        put_text(frame, "Press 'q' to quit, 'r' to reset", (10, height - 20), 
+               cv2.FONT_HERSHEY_SIMPLEX, 0.7, self.colors["white"], 2)
     
-    def run_game(self):
+    def create_pose_backend(self):
+        return create_backend(self.config.backend, self.config.min_detection_confidence,
+                              self.config.min_tracking_confidence, self.config.max_num_hands)
+    
+    def apply_config(self, config):
+        """Switch to a new configuration; returns the scopes (live/graph/camera) that changed"""
+        changed = config.diff(self.config)
+        self.config = config
+        scopes = {FIELDS[name].scope for name in changed}
+        if GRAPH in scopes:
+            self.pose_backend.close()
+            self.pose_backend = self.create_pose_backend()
+        self.gesture_cooldown = config.gesture_cooldown
+        if changed:
+            print(f"Applied {', '.join(changed)}")
+        return scopes
+    
+    def run_game(self, display=None, capture=None, watcher=None):
         """Main game loop"""
-        cap = cv2.VideoCapture(0)
-        
-        if not cap.isOpened():
-            print("Error: Could not open webcam")
-            return
+        cap = capture or open_camera(self.config.camera_index, self.config.capture_settings)
         
-        print("Rock Paper Scissors Game Started!")
-        print("Show your hand gesture to play!")
-        print("Press 'q' to quit, 'r' to reset scores")
-        
-        while True:
-            ret, frame = cap.read()
-            if not ret:
-                print("Error: Could not read frame")
-                break
-            
-            # Flip frame horizontally for mirror effect
-            frame = cv2.flip(frame, 1)
-            
-            # Convert to RGB for MediaPipe
-            rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-            results = self.hands.process(rgb_frame)
+        try:
+            if not cap.isOpened():
+                print("Error: Could not open webcam")
+                return
             
-            current_time = time.time()
+            print("Rock Paper Scissors Game Started!")
+            print("Show your hand gesture to play!")
+            print("Press 'q' to quit, 'r' to reset scores")
             
-            # Game state machine
-            if self.game_state == "waiting":
-                if results.multi_hand_landmarks:
-                    hand_landmarks = results.multi_hand_landmarks[0]
-                    gesture = self.get_gesture(hand_landmarks)
-                    
-                    if gesture and (current_time - self.last_gesture_time) > self.gesture_cooldown:
-                        self.player_gesture = gesture
-                        self.computer_gesture = random.choice(self.gestures)
-                        self.round_winner = self.determine_winner(self.player_gesture, self.computer_gesture)
-                        self.update_scores(self.round_winner)
-                        self.round_count += 1
-                        self.game_state = "result"
-                        self.last_gesture_time = current_time
+            display = display or create_display(None, 'Rock Paper Scissors Game')
+            running = True
+            while running:
+                ret, frame = cap.read()
+                if not ret:
+                    print("Error: Could not read frame")
+                    break
+                
+                # Flip frame horizontally for mirror effect
+                frame = cv2.flip(frame, 1)
+                
+                # Landmarks of the first hand, as a HandFrame (or None)
+                hand_landmarks = self.pose_backend.detect(frame)
+                
+                current_time = self.clock()
+                
+                # Game state machine
+                if self.game_state == "waiting":
+                    if hand_landmarks:
+                        gesture = self.get_gesture(hand_landmarks)
                         
-            elif self.game_state == "result":
-                # Show result for 2 seconds
-                if current_time - self.last_gesture_time > 2.0:
-                    self.game_state = "countdown"
-                    self.countdown_timer = 3.0
-                    
-            elif self.game_state == "countdown":
-                self.countdown_timer -= 0.05  # Adjust for frame rate
-                if self.countdown_timer <= 0:
-                    self.game_state = "waiting"
-                    self.player_gesture = None
-                    self.computer_gesture = None
-            
-            # Draw UI
-            hand_landmarks = results.multi_hand_landmarks[0] if results.multi_hand_landmarks else None
-            self.draw_ui(frame, hand_landmarks)
-            
-            # Display frame
-            cv2.imshow('Rock Paper Scissors Game', frame)
-            
-            # Handle key presses
-            key = cv2.waitKey(1) & 0xFF
-            if key == ord('q'):
-                break
-            elif key == ord('r'):
-                self.reset_game()
+                        if gesture and (current_time - self.last_gesture_time) > self.gesture_cooldown:
+                            self.player_gesture = gesture
+                            self.computer_gesture = random.choice(self.gestures)
+                            self.round_winner = self.determine_winner(self.player_gesture, self.computer_gesture)
+                            self.update_scores(self.round_winner)
+                            self.round_count += 1
+                            self.game_state = "result"
+                            self.last_gesture_time = current_time
+                            
+                elif self.game_state == "result":
+                    # Show result for 2 seconds
+                    if current_time - self.last_gesture_time > 2.0:
+                        self.game_state = "countdown"
+                        self.countdown_timer = 3.0
+                        
+                elif self.game_state == "countdown":
+                    self.countdown_timer -= 0.05  # Adjust for frame rate
+                    if self.countdown_timer <= 0:
+                        self.game_state = "waiting"
+                        self.player_gesture = None
+                        self.computer_gesture = None
+                
+                # Draw UI
+                self.draw_ui(frame, hand_landmarks)
+                
+                # Display frame
+                display.show(frame)
+                
+                # Handle key presses
+                for event in display.poll_events():
+                    if event.key == 'q':
+                        running = False
+                    elif event.key == 'r':
+                        self.reset_game()
+                
+                # Hot reload of --config; the camera is only reopened if we opened it
+                new_config = watcher.poll(time.monotonic()) if watcher else None
+                if new_config and CAMERA in self.apply_config(new_config) and capture is None:
+                    cap.release()
+                    cap = open_camera(self.config.camera_index, self.config.capture_settings)
+        finally:
+            # Release the camera and the display even after an early return or an error
+            cap.release()
+            if display:
+                display.close()
         
         # Cleanup
-        cap.release()
-        cv2.destroyAllWindows()
-        self.hands.close()
+        self.pose_backend.close()
     
     def reset_game(self):
         """Reset the game scores and state"""
@@ -238,9 +263,28 @@ class RockPaperScissorsGame:
         print("Game reset!")
 
 if __name__ == "__main__":
-    game = RockPaperScissorsGame()
+    parser = argparse.ArgumentParser(description="Rock Paper Scissors Game")
+    parser.add_argument("--display", action="append",
+                        help="Display sink: window, null, video:<path>, shm:<name>, mjpeg:<port> (repeatable)")
+    parser.add_argument("--backend",
+                        help="Hand pose backend: legacy[:lite], tasks[-live]:<model.task>, onnx:<model.onnx>, stub")
+    add_config_arguments(parser)
+    args = parser.parse_args()
+    
+    # --backend is a shorthand for --set backend=...
+    try:
+        overrides = parse_overrides(args.set)
+        if args.backend is not None:
+            overrides["backend"] = args.backend
+        config = load_config(args.profile, args.config, overrides)
+    except ValueError as e:
+        parser.error(str(e))
+    
+    watcher = ConfigWatcher(config, args.profile, args.config, overrides) if args.config else None
+    
+    game = RockPaperScissorsGame(config)
     try:
-        game.run_game()
+        game.run_game(create_display(args.display, 'Rock Paper Scissors Game'), watcher=watcher)
     except KeyboardInterrupt:
         print("\nGame interrupted by user")
     except Exception as e:
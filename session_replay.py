@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Deterministic session recording and replay for Rock Paper Scissors Game
+Captures the RNG seed, clock ticks, landmark stream and key events of a
+match, then re-executes the game logic headlessly to verify the outcome
+"""
+
+import argparse
+import json
+import time
+
+import numpy as np
+
+from enhanced_game import EnhancedRockPaperScissorsGame
+from game_config import GameConfig
+from gesture_predictor import GesturePredictor
+from match_rules import parse_rules
+from landmark_io import NUM_LANDMARKS, save_recording, load_recording, iter_recording
+
+
+class SessionRecorder:
+    """Collects everything needed to re-execute a match frame by frame"""
+
+    def __init__(self, path, game):
+        self.path = path
+        self.seed = game.seed
+        # The rules 'b' toggles to and whether they are in play, before any key is handled
+        self.match = {"target": game.target_rules.spec, "active": game.match_rules is game.target_rules}
+        # Early commits change round timing, so the predictor's settings are part of the session
+        self.predictor = game.predictor.to_dict() if game.predictor else None
+        self.timestamps = []
+        self.landmarks = []
+        self.scores = []
+        self.key_frames = []
+        self.keys = []
+        self.rounds = []
+        self.config = None
+        self.config_changes = []  # [frame index, config values]: the starting settings, then every hot reload
+        self.last_commit_time = None
+        self.empty = np.full((NUM_LANDMARKS, 3), np.nan, dtype=np.float32)
+
+    def capture(self, game, timestamp, hand_landmarks, score, keys):
+        """Record one frame after the game has processed it"""
+        frame_index = len(self.timestamps)
+        # A hot reload replaces game.config; it applies from the frame after the one it was polled on
+        if game.config is not self.config:
+            self.config = game.config
+            self.config_changes.append([frame_index, dict(game.config.values)])
+        self.timestamps.append(timestamp)
+        if hand_landmarks:
+            self.landmarks.append(hand_landmarks.points)
+            self.scores.append(score)
+        else:
+            self.landmarks.append(self.empty)
+            self.scores.append(0.0)
+        for key in keys:
+            self.key_frames.append(frame_index)
+            self.keys.append(key)
+        # Every commit stamps last_gesture_time, even across resets
+        if game.round_count and game.last_gesture_time != self.last_commit_time:
+            self.last_commit_time = game.last_gesture_time
+            self.rounds.append(round_outcome(game, frame_index))
+
+    def save(self):
+        """Write the session in the landmark recording format plus replay fields"""
+        save_recording(
+            self.path, self.timestamps, self.landmarks, self.scores,
+            seed=np.array(self.seed, dtype=np.int64),
+            key_frames=np.array(self.key_frames, dtype=np.int64),
+            keys=np.array(self.keys, dtype="U1"),
+            rounds=np.array(json.dumps(self.rounds)),
+            config_changes=np.array(json.dumps(self.config_changes)),
+            match=np.array(json.dumps(self.match)),
+            predictor=np.array(json.dumps(self.predictor))
+        )
+        print(f"💾 Session with {len(self.timestamps)} frames and {len(self.rounds)} rounds saved to {self.path}")
+
+
+def round_outcome(game, frame_index):
+    """The comparable result of the round the game just played, and the frame it was committed on"""
+    return [game.round_count, game.player_gesture, game.computer_gesture, game.round_winner, frame_index]
+
+
+def replay_session(recording, render=False):
+    """Re-execute a recorded session and return (rounds, frames, seconds)"""
+    # Sessions from before settings were recorded replay with the defaults
+    config_changes = {}
+    if "config_changes" in recording:
+        config_changes = {frame_index: GameConfig(values)
+                          for frame_index, values in json.loads(str(recording["config_changes"]))}
+    game = EnhancedRockPaperScissorsGame(use_mediapipe=False, seed=int(recording["seed"]),
+                                         config=config_changes.get(0))
+    if "match" in recording:
+        match = json.loads(str(recording["match"]))
+        game.target_rules = parse_rules(match["target"])
+        if match["active"]:
+            game.match_rules = game.target_rules
+    if "predictor" in recording:
+        settings = json.loads(str(recording["predictor"]))
+        game.predictor = GesturePredictor(**settings) if settings else None
+    frame = np.zeros((480, 640, 3), dtype=np.uint8) if render else None
+
+    # Group key presses by the frame they were handled on
+    keys_by_frame = {}
+    for frame_index, key in zip(recording["key_frames"], recording["keys"]):
+        keys_by_frame.setdefault(int(frame_index), []).append(str(key))
+
+    rounds = []
+    last_commit_time = None
+    frames = 0
+    start = time.perf_counter()
+    for frame_index, (timestamp, _, hand_landmarks) in enumerate(iter_recording(recording)):
+        if frame_index in config_changes:
+            game.apply_config(config_changes[frame_index])
+        game.update_game_state(hand_landmarks, timestamp)
+        if render:
+            frame[:] = 0
+            game.draw_ui(frame, hand_landmarks)
+
+        running = True
+        for key in keys_by_frame.get(frame_index, []):
+            running = running and game.handle_key(key, timestamp)
+
+        if game.round_count and game.last_gesture_time != last_commit_time:
+            last_commit_time = game.last_gesture_time
+            rounds.append(round_outcome(game, frame_index))
+        frames += 1
+        if not running:
+            break
+
+    elapsed = time.perf_counter() - start
+    game.events.close()
+    return rounds, frames, elapsed
+
+
+def verify_session(path, render=False, repeat=1):
+    """Replay a session, check it reproduces the recorded rounds, and time it"""
+    recording = load_recording(path)
+    expected = json.loads(str(recording["rounds"]))
+
+    best = None
+    for _ in range(repeat):
+        rounds, frames, elapsed = replay_session(recording, render)
+        # Sessions recorded before commit frames were kept only compare the outcomes
+        rounds = [outcome[:len(recorded)] for outcome, recorded in zip(rounds, expected)] + rounds[len(expected):]
+        if rounds != expected:
+            print(f"❌ {path}: replay diverged after {len(rounds)} rounds")
+            for recorded, replayed in zip(expected, rounds):
+                if recorded != replayed:
+                    print(f"   recorded {recorded} vs replayed {replayed}")
+                    break
+            return False
+        best = elapsed if best is None else min(best, elapsed)
+
+    print(f"✅ {path}: {len(expected)} rounds reproduced, {frames} frames in {best * 1000:.1f} ms "
+          f"({frames / best:.0f} frames/s)")
+    return True
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Replay and verify recorded Rock Paper Scissors sessions")
+    parser.add_argument("sessions", nargs="+", help="Session files recorded with enhanced_game.py --record-session")
+    parser.add_argument("--render", action="store_true", help="Include UI rendering in the replay workload")
+    parser.add_argument("--repeat", type=int, default=1, help="Replay each session N times and keep the best time")
+    args = parser.parse_args()
+
+    results = [verify_session(path, args.render, args.repeat) for path in args.sessions]
+    raise SystemExit(0 if all(results) else 1)
@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""
+Parameter sweep runner for Rock Paper Scissors Game
+Replays recorded landmark streams through the enhanced game logic and
+reports the accuracy vs latency-to-commit Pareto front
+"""
+
+import argparse
+import itertools
+import json
+import multiprocessing
+import os
+import random
+
+from enhanced_game import EnhancedRockPaperScissorsGame
+from landmark_io import load_recording, iter_recording, record_session
+
+# Default search space around the hand-picked constants in the enhanced game
+DEFAULT_GRID = {
+    "extension_tolerance": [0.0, 0.01, 0.02, 0.03, 0.04],
+    "min_detection_confidence": [0.5, 0.6, 0.7, 0.8, 0.9],
+    "min_tracking_confidence": [0.5, 0.6, 0.7],
+    "commit_confidence": [0.6, 0.7, 0.8, 0.9],
+    "gesture_cooldown": [1.0, 1.5, 2.0, 2.5]
+}
+
+# Recordings are loaded once per worker process
+_worker_recordings = []
+
+
+def grid_combinations(grid):
+    """Yield every parameter combination in the grid"""
+    names = list(grid)
+    for values in itertools.product(*(grid[name] for name in names)):
+        yield dict(zip(names, values))
+
+
+def random_combinations(grid, samples, seed=None):
+    """Yield random parameter combinations within the grid's ranges"""
+    rng = random.Random(seed)
+    for _ in range(samples):
+        params = {}
+        for name, values in grid.items():
+            low, high = min(values), max(values)
+            params[name] = round(rng.uniform(low, high), 4)
+        yield params
+
+
+def default_params():
+    """The game's current tuning for every swept parameter"""
+    game = EnhancedRockPaperScissorsGame(use_mediapipe=False)
+    return {name: getattr(game, name) for name in DEFAULT_GRID}
+
+
+def replay_recording(recording, params, predictor=None):
+    """Replay one recording and return the list of (gesture, latency) commits"""
+    game = EnhancedRockPaperScissorsGame(use_mediapipe=False)
+    for name, value in params.items():
+        setattr(game, name, value)
+    game.predictor = predictor
+    # The real game starts with a cooldown that has long expired
+    game.last_gesture_time = float("-inf")
+
+    commits = []
+    tracking = False
+    ready_since = None
+
+    for timestamp, score, hand_landmarks in iter_recording(recording):
+        # Latency is measured from the first frame the hand is in view while waiting
+        if game.game_state == "waiting" and hand_landmarks and ready_since is None:
+            ready_since = timestamp
+
+        # Emulate MediaPipe gating: detection threshold to acquire, tracking threshold to keep
+        threshold = params["min_tracking_confidence"] if tracking else params["min_detection_confidence"]
+        if hand_landmarks is None or score < threshold:
+            hand_landmarks = None
+        tracking = hand_landmarks is not None
+
+        previous_rounds = game.round_count
+        game.update_game_state(hand_landmarks, timestamp)
+
+        if game.round_count != previous_rounds:
+            commits.append((game.player_gesture, timestamp - ready_since))
+            ready_since = None
+
+    return commits
+
+
+def evaluate_params(params):
+    """Score one parameter combination across all loaded recordings"""
+    correct = 0
+    attempts = 0
+    latencies = []
+
+    for recording in _worker_recordings:
+        commits = replay_recording(recording, params)
+        # Unlabelled clips have no ground truth, so they only contribute latency
+        labelled = bool(recording["label"])
+        if not commits:
+            # A labelled clip that never commits counts as a miss
+            attempts += labelled
+            continue
+        for gesture, latency in commits:
+            latencies.append(latency)
+            if labelled:
+                attempts += 1
+                correct += gesture == recording["label"]
+
+    latencies.sort()
+    return {
+        "params": params,
+        "accuracy": correct / attempts if attempts else 0.0,
+        "mean_latency": sum(latencies) / len(latencies) if latencies else float("inf"),
+        "p90_latency": latencies[int(0.9 * (len(latencies) - 1))] if latencies else float("inf"),
+        "commits": len(latencies),
+        "attempts": attempts
+    }
+
+
+def pareto_front(results):
+    """Keep results not dominated on (higher accuracy, lower mean latency)"""
+    ordered = sorted(results, key=lambda r: (r["mean_latency"], -r["accuracy"]))
+    front = []
+    best_accuracy = -1.0
+    for result in ordered:
+        if result["accuracy"] > best_accuracy:
+            front.append(result)
+            best_accuracy = result["accuracy"]
+    return front
+
+
+def _init_worker(paths):
+    """Load recordings once in each worker process"""
+    global _worker_recordings
+    _worker_recordings = [load_recording(path) for path in paths]
+
+
+def run_sweep(paths, mode="grid", samples=100, workers=None, seed=None, grid=None):
+    """Evaluate the parameter space in parallel and return (results, front)"""
+    grid = grid or DEFAULT_GRID
+    if mode == "grid":
+        combinations = list(grid_combinations(grid))
+    else:
+        combinations = list(random_combinations(grid, samples, seed))
+
+    workers = workers or os.cpu_count() or 1
+    print(f"🔍 Evaluating {len(combinations)} combinations on {len(paths)} recordings with {workers} workers")
+
+    with multiprocessing.Pool(workers, initializer=_init_worker, initargs=(paths,)) as pool:
+        chunksize = max(1, len(combinations) // (workers * 8))
+        results = list(pool.imap_unordered(evaluate_params, combinations, chunksize=chunksize))
+
+    if not any(result["attempts"] for result in results):
+        print("⚠️ No labelled recordings - accuracy is 0% everywhere, the front ranks on latency only")
+    return results, pareto_front(results)
+
+
+def print_front(front):
+    """Print the Pareto front as a table"""
+    print("\n📈 Pareto front (accuracy vs latency-to-commit)")
+    print(f"{'accuracy':>9} {'mean s':>8} {'p90 s':>8}  params")
+    for result in front:
+        params = ", ".join(f"{name}={value}" for name, value in result["params"].items())
+        print(f"{result['accuracy']:>9.1%} {result['mean_latency']:>8.3f} {result['p90_latency']:>8.3f}  {params}")
+
+
+def main():
+    """Command line entry point"""
+    parser = argparse.ArgumentParser(description="Tune gesture detection parameters on recorded sessions")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    record_parser = subparsers.add_parser("record", help="Record a labelled landmark stream from the webcam")
+    record_parser.add_argument("output", help="Output .npz file")
+    record_parser.add_argument("--label", choices=["rock", "paper", "scissors"], default="")
+    record_parser.add_argument("--seconds", type=float, default=10.0)
+    record_parser.add_argument("--camera", type=int, default=0)
+
+    sweep_parser = subparsers.add_parser("sweep", help="Sweep parameters over recordings")
+    sweep_parser.add_argument("recordings", nargs="+", help="Recorded .npz files")
+    sweep_parser.add_argument("--mode", choices=["grid", "random"], default="grid")
+    sweep_parser.add_argument("--samples", type=int, default=200, help="Combinations for random search")
+    sweep_parser.add_argument("--workers", type=int, default=None)
+    sweep_parser.add_argument("--seed", type=int, default=None)
+    sweep_parser.add_argument("--output", help="Write all results and the front to a JSON file")
+
+    args = parser.parse_args()
+
+    if args.command == "record":
+        record_session(args.output, args.label, args.seconds, args.camera)
+        return
+
+    results, front = run_sweep(args.recordings, args.mode, args.samples, args.workers, args.seed)
+    print_front(front)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({"results": results, "pareto_front": front}, f, indent=2)
+        print(f"\n💾 Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
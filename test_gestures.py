@@ -1,19 +1,25 @@
+import argparse
 import cv2
-import mediapipe as mp
 import numpy as np
 import math
+import time
+
+from text_cache import put_text
+from camera_capture import open_camera
+from display_sinks import create_display
+from hand_frame import FINGER_TIPS, FINGER_PIPS, draw_hand
+from metrics import GameMetrics, add_metrics_arguments, create_exporters
+from pose_backends import create_backend
+from game_config import (GameConfig, FIELDS, GRAPH, CAMERA, ConfigWatcher, add_config_arguments,
+                         load_config, parse_overrides)
 
 class GestureTester:
-    def __init__(self):
-        # Initialize MediaPipe
-        self.mp_hands = mp.solutions.hands
-        self.hands = self.mp_hands.Hands(
-            static_image_mode=False,
-            max_num_hands=1,
-            min_detection_confidence=0.7,
-            min_tracking_confidence=0.5
-        )
-        self.mp_drawing = mp.solutions.drawing_utils
+    def __init__(self, config=None):
+        # Camera and backend settings shared with the games (see game_config.py)
+        self.config = config or GameConfig()
+        
+        # Hand pose backend (MediaPipe by default, stub for headless runs)
+        self.pose_backend = self.create_pose_backend()
         
         # Colors for visualization
         self.colors = {
@@ -25,39 +31,40 @@ class GestureTester:
         }
     
     def calculate_distance(self, point1, point2):
-        """Calculate Euclidean distance between two points"""
-        return math.sqrt((point1.x - point2.x)**2 + (point1.y - point2.y)**2)
+        """Calculate Euclidean distance between two landmark rows"""
+        return math.hypot(point1[0] - point2[0], point1[1] - point2[1])
+    
+    def create_pose_backend(self):
+        return create_backend(self.config.backend, self.config.min_detection_confidence,
+                              self.config.min_tracking_confidence, self.config.max_num_hands)
+    
+    def apply_config(self, config):
+        """Switch to a new configuration; returns the scopes (live/graph/camera) that changed"""
+        changed = config.diff(self.config)
+        self.config = config
+        scopes = {FIELDS[name].scope for name in changed}
+        if GRAPH in scopes:
+            self.pose_backend.close()
+            self.pose_backend = self.create_pose_backend()
+        if changed:
+            print(f"Applied {', '.join(changed)}")
+        return scopes
     
     def get_gesture(self, hand_landmarks):
         """Test gesture detection function"""
         if not hand_landmarks:
-            return None, 0
+            return None, 0, {}
             
-        # Get key landmarks
-        wrist = hand_landmarks.landmark[0]
-        thumb_tip = hand_landmarks.landmark[4]
-        index_tip = hand_landmarks.landmark[8]
-        middle_tip = hand_landmarks.landmark[12]
-        ring_tip = hand_landmarks.landmark[16]
-        pinky_tip = hand_landmarks.landmark[20]
-        
-        # Get finger pip (middle joint) landmarks
-        thumb_pip = hand_landmarks.landmark[3]
-        index_pip = hand_landmarks.landmark[6]
-        middle_pip = hand_landmarks.landmark[10]
-        ring_pip = hand_landmarks.landmark[14]
-        pinky_pip = hand_landmarks.landmark[18]
+        points = hand_landmarks.points
         
         # Calculate finger extension with tolerance
-        tolerance = 0.02
+        tolerance = self.config.extension_tolerance
         
-        index_extended = index_tip.y < (index_pip.y - tolerance)
-        middle_extended = middle_tip.y < (middle_pip.y - tolerance)
-        ring_extended = ring_tip.y < (ring_pip.y - tolerance)
-        pinky_extended = pinky_tip.y < (pinky_pip.y - tolerance)
+        index_extended, middle_extended, ring_extended, pinky_extended = \
+            (points[FINGER_PIPS, 1] - points[FINGER_TIPS, 1] > tolerance).tolist()
         
         # Thumb detection
-        thumb_extended = self.calculate_distance(thumb_tip, wrist) > self.calculate_distance(thumb_pip, wrist)
+        thumb_extended = self.calculate_distance(points[4], points[0]) > self.calculate_distance(points[3], points[0])
         
         # Debug information
         debug_info = {
@@ -93,103 +100,141 @@ class GestureTester:
         
         # Draw hand landmarks
         if hand_landmarks:
-            self.mp_drawing.draw_landmarks(
-                frame, 
-                hand_landmarks, 
-                self.mp_hands.HAND_CONNECTIONS,
-                self.mp_drawing.DrawingSpec(color=self.colors["blue"], thickness=2, circle_radius=3),
-                self.mp_drawing.DrawingSpec(color=self.colors["yellow"], thickness=2)
-            )
+            draw_hand(frame, hand_landmarks, self.colors["blue"], self.colors["yellow"],
+                      circle_radius=3, point_thickness=2, line_thickness=2)
         
         # Draw gesture information
         if gesture:
-            cv2.putText(frame, f"Detected: {gesture.upper()}", (10, 30), 
-                       cv2.FONT_HERSHEY_SIMPLEX, 1, self.colors["green"], 2)
-            cv2.putText(frame, f"Confidence: {confidence:.1%}", (10, 70), 
-                       cv2.FONT_HERSHEY_SIMPLEX, 1, self.colors["yellow"], 2)
+            put_text(frame, f"Detected: {gesture.upper()}", (10, 30), 
+                   cv2.FONT_HERSHEY_SIMPLEX, 1, self.colors["green"], 2)
+            put_text(frame, f"Confidence: {confidence:.1%}", (10, 70), 
+                   cv2.FONT_HERSHEY_SIMPLEX, 1, self.colors["yellow"], 2)
         else:
-            cv2.putText(frame, "No gesture detected", (10, 30), 
-                       cv2.FONT_HERSHEY_SIMPLEX, 1, self.colors["red"], 2)
+            put_text(frame, "No gesture detected", (10, 30), 
+                   cv2.FONT_HERSHEY_SIMPLEX, 1, self.colors["red"], 2)
         
         # Draw finger status
         y_offset = 110
         for finger, status in debug_info.items():
             color = self.colors["green"] if status else self.colors["red"]
             status_text = "EXTENDED" if status else "CLOSED"
-            cv2.putText(frame, f"{finger.capitalize()}: {status_text}", (10, y_offset), 
-                       cv2.FONT_HERSHEY_SIMPLEX, 0.7, color, 2)
+            put_text(frame, f"{finger.capitalize()}: {status_text}", (10, y_offset), 
+                   cv2.FONT_HERSHEY_SIMPLEX, 0.7, color, 2)
             y_offset += 30
         
         # Draw instructions
-        cv2.putText(frame, "Show hand gestures to test detection", (10, height - 60), 
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.8, self.colors["white"], 2)
-        cv2.putText(frame, "Press 'q' to quit", (10, height - 30), 
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.8, self.colors["white"], 2)
+        put_text(frame, "Show hand gestures to test detection", (10, height - 60), 
+               cv2.FONT_HERSHEY_SIMPLEX, 0.8, self.colors["white"], 2)
+        put_text(frame, "Press 'q' to quit", (10, height - 30), 
+               cv2.FONT_HERSHEY_SIMPLEX, 0.8, self.colors["white"], 2)
         
         # Draw gesture examples
-        cv2.putText(frame, "Rock: Fist | Paper: Open Palm | Scissors: Peace Sign", 
-                   (width//2 - 200, height - 30), 
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.6, self.colors["white"], 1)
+        put_text(frame, "Rock: Fist | Paper: Open Palm | Scissors: Peace Sign", 
+               (width//2 - 200, height - 30), 
+               cv2.FONT_HERSHEY_SIMPLEX, 0.6, self.colors["white"], 1)
     
-    def run_test(self):
+    def run_test(self, display=None, metrics=None, capture=None, watcher=None):
         """Run the gesture testing application"""
-        cap = cv2.VideoCapture(0)
+        cap = capture or open_camera(self.config.camera_index, self.config.capture_settings)
         
-        if not cap.isOpened():
-            print("Error: Could not open webcam")
-            return
-        
-        print("Gesture Testing Started!")
-        print("Show different hand gestures to test detection")
-        print("Press 'q' to quit")
-        
-        while True:
-            ret, frame = cap.read()
-            if not ret:
-                print("Error: Could not read frame")
-                break
-            
-            # Flip frame horizontally for mirror effect
-            frame = cv2.flip(frame, 1)
-            
-            # Convert to RGB for MediaPipe
-            rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-            results = self.hands.process(rgb_frame)
+        try:
+            if not cap.isOpened():
+                print("Error: Could not open webcam")
+                return
             
-            gesture = None
-            confidence = 0.0
-            debug_info = {}
+            print("Gesture Testing Started!")
+            print("Show different hand gestures to test detection")
+            print("Press 'q' to quit")
             
-            # Process hand landmarks
-            if results.multi_hand_landmarks:
-                hand_landmarks = results.multi_hand_landmarks[0]
-                gesture, confidence, debug_info = self.get_gesture(hand_landmarks)
-            
-            # Draw debug information
-            self.draw_debug_info(frame, 
-                               results.multi_hand_landmarks[0] if results.multi_hand_landmarks else None,
-                               gesture, confidence, debug_info)
-            
-            # Display frame
-            cv2.imshow('Gesture Testing', frame)
-            
-            # Handle key presses
-            key = cv2.waitKey(1) & 0xFF
-            if key == ord('q'):
-                break
+            display = display or create_display(None, 'Gesture Testing')
+            if metrics:
+                metrics.watch_capture(cap)
+            running = True
+            while running:
+                frame_start = time.perf_counter()
+                ret, frame = cap.read()
+                if not ret:
+                    print("Error: Could not read frame")
+                    break
+                
+                # Flip frame horizontally for mirror effect
+                frame = cv2.flip(frame, 1)
+                captured = time.perf_counter()
+                
+                gesture = None
+                confidence = 0.0
+                debug_info = {}
+                
+                # Process hand landmarks
+                hand_landmarks = self.pose_backend.detect(frame)
+                inferred = time.perf_counter()
+                if hand_landmarks:
+                    gesture, confidence, debug_info = self.get_gesture(hand_landmarks)
+                
+                # Draw debug information
+                self.draw_debug_info(frame, hand_landmarks, gesture, confidence, debug_info)
+                rendered = time.perf_counter()
+                
+                # Display frame
+                display.show(frame)
+                if metrics:
+                    metrics.record_frame(frame_start, captured, inferred, rendered, time.perf_counter(), hand_landmarks)
+                
+                # Handle key presses
+                for event in display.poll_events():
+                    if event.key == 'q':
+                        running = False
+                
+                # Hot reload of --config; the camera is only reopened if we opened it
+                new_config = watcher.poll(time.monotonic()) if watcher else None
+                if new_config and CAMERA in self.apply_config(new_config) and capture is None:
+                    cap.release()
+                    cap = open_camera(self.config.camera_index, self.config.capture_settings)
+                    if metrics:
+                        metrics.watch_capture(cap)
+        finally:
+            # Release the camera and the display even after an early return or an error
+            cap.release()
+            if display:
+                display.close()
         
         # Cleanup
-        cap.release()
-        cv2.destroyAllWindows()
-        self.hands.close()
+        self.pose_backend.close()
 
 if __name__ == "__main__":
-    tester = GestureTester()
+    parser = argparse.ArgumentParser(description="Gesture detection tester")
+    parser.add_argument("--display", action="append",
+                        help="Display sink: window, null, video:<path>, shm:<name>, mjpeg:<port> (repeatable)")
+    parser.add_argument("--backend",
+                        help="Hand pose backend: legacy[:lite], tasks[-live]:<model.task>, onnx:<model.onnx>, stub")
+    add_config_arguments(parser)
+    add_metrics_arguments(parser)
+    args = parser.parse_args()
+    
+    # --backend is a shorthand for --set backend=...
+    try:
+        overrides = parse_overrides(args.set)
+        if args.backend is not None:
+            overrides["backend"] = args.backend
+        config = load_config(args.profile, args.config, overrides)
+    except ValueError as e:
+        parser.error(str(e))
+    
+    metrics = None
+    exporters = []
+    if args.metrics or args.metrics_log:
+        metrics = GameMetrics()
+        exporters = create_exporters(metrics.registry, args.metrics, args.metrics_log, args.metrics_interval)
+    watcher = ConfigWatcher(config, args.profile, args.config, overrides) if args.config else None
+    
+    tester = GestureTester(config)
     try:
-        tester.run_test()
+        tester.run_test(create_display(args.display, 'Gesture Testing'), metrics, watcher=watcher)
     except KeyboardInterrupt:
         print("\nTesting interrupted by user")
     except Exception as e:
         print(f"Error: {e}")
     finally:
+        for exporter in exporters:
+            exporter.close()
         print("Testing ended!")
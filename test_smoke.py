@@ -0,0 +1,458 @@
+#!/usr/bin/env python3
+"""
+Headless smoke and performance tests for Rock Paper Scissors Game
+Drives every entry point without a camera or display: synthetic frames,
+the stub pose backend, scripted keys and a frame-stepped clock. Checks the
+game logic and fails when a frame loop gets slower than its budget.
+
+Run with: python -m unittest test_smoke -v
+Slow CI machines can loosen the budgets with RPS_BUDGET_SCALE=2 (or more)
+"""
+
+import contextlib
+import io
+import os
+import random
+import tempfile
+import threading
+import time
+import unittest
+
+import numpy as np
+
+from demo import DemoGame
+from display_sinks import NullSink
+from enhanced_game import EnhancedRockPaperScissorsGame
+from game_config import GameConfig
+from game_events import RoundCommitted, Reset
+from landmark_io import synthetic_hand, synthetic_throw
+from hand_frame import HandFrame
+from match_rules import Tournament, parse_rules
+from gesture_predictor import GesturePredictor
+from metrics import GameMetrics
+from pose_backends import PoseBackend, load_frames
+from rock_paper_scissors_game import RockPaperScissorsGame
+from session_replay import SessionRecorder, verify_session
+from test_gestures import GestureTester
+
+GESTURES = ["rock", "paper", "scissors"]
+BEATS = {"rock": "scissors", "paper": "rock", "scissors": "paper"}
+
+# Frame loop budgets with the stub backend at 640x480; every loop runs in
+# about 1 ms per frame on a laptop, so these leave room for shared CI runners
+BUDGET_SCALE = float(os.environ.get("RPS_BUDGET_SCALE", "1"))
+FRAME_P95_BUDGET = 0.008 * BUDGET_SCALE  # seconds per frame loop iteration
+MIN_FPS = 100.0 / BUDGET_SCALE
+WARMUP_FRAMES = 10  # First frames fill the text and sprite caches
+
+FRAMES = 600  # 20 s of play at 30 FPS, enough for several rounds
+FPS = 30.0
+
+
+class FrameClock:
+    """Game clock that only moves when the synthetic camera delivers a frame"""
+
+    def __init__(self, start=1000.0):
+        self.now = start
+
+    def __call__(self):
+        return self.now
+
+
+class SyntheticCapture:
+    """cv2.VideoCapture look-alike cycling through generated frames at a fixed FPS"""
+
+    def __init__(self, frames, count, clock=None, fps=FPS, opened=True):
+        self.frames = frames
+        self.count = count
+        self.clock = clock or FrameClock()
+        self.fps = fps
+        self.opened = opened
+        self.reads = 0
+
+    def isOpened(self):
+        return self.opened
+
+    def read(self):
+        if self.reads >= self.count:
+            return False, None
+        self.clock.now += 1.0 / self.fps
+        frame = self.frames[self.reads % len(self.frames)]
+        self.reads += 1
+        return True, frame
+
+    def release(self):
+        self.opened = False
+
+
+class BrokenCapture(SyntheticCapture):
+    """A camera that fails in the middle of the frame loop"""
+
+    def read(self):
+        raise RuntimeError("camera unplugged")
+
+
+class ScriptedSink(NullSink):
+    """NullSink that presses keys after given frames and timestamps every shown frame"""
+
+    def __init__(self, keys):
+        super().__init__()
+        self.keys = keys  # frame number -> keys pressed after it, in order
+        self.shown = []
+        self.closed = False
+
+    def show(self, frame):
+        super().show(frame)
+        self.shown.append(time.perf_counter())
+        for key in self.keys.get(self.frame_count, ""):
+            self.push_key(key)
+
+    def close(self):
+        self.closed = True
+
+    def frame_times(self):
+        """Seconds between consecutive frames after the warm-up"""
+        return np.diff(self.shown[WARMUP_FRAMES:])
+
+
+class ThrowBackend(PoseBackend):
+    """Hands moving from relaxed into each gesture in turn, so predictions can commit early"""
+    name = "throws"
+
+    def __init__(self, seed=0):
+        rng = np.random.default_rng(seed)
+        self.hands = []
+        for gesture in GESTURES * 4:
+            _, landmarks, scores = synthetic_throw(gesture, transition_frames=10, noise=0.004, rng=rng)
+            self.hands += [None if np.isnan(points[0, 0]) else HandFrame(points, score=float(score))
+                           for points, score in zip(landmarks, scores)]
+        self.frames = 0
+
+    def detect(self, frame, timestamp=None):
+        hand = self.hands[self.frames % len(self.hands)]
+        self.frames += 1
+        return hand
+
+
+class EventLog:
+    """Collects game events in publish order"""
+
+    def __init__(self):
+        self.events = []
+
+    def __call__(self, event):
+        self.events.append(event)
+
+
+def expected_winner(player, computer):
+    if player == computer:
+        return "tie"
+    return "player" if BEATS[player] == computer else "computer"
+
+
+def stub_config():
+    """Default settings with the scripted pose backend, so no camera model is needed"""
+    return GameConfig({"backend": "stub"})
+
+
+def quietly(run, *args, **kwargs):
+    """Call an entry point with its console output swallowed"""
+    with contextlib.redirect_stdout(io.StringIO()):
+        return run(*args, **kwargs)
+
+
+def scripted_keys(frames=FRAMES, **presses):
+    """Quit after the last frame, plus a key=frame press for each keyword"""
+    keys = {frame: key for key, frame in presses.items()}
+    keys[frames] = keys.get(frames, "") + "q"
+    return keys
+
+
+_frames = []
+
+
+def synthetic_frames():
+    """A short loop of noisy 640x480 scenes, generated once"""
+    if not _frames:
+        _frames.extend(load_frames(count=16, seed=7))
+    return _frames
+
+
+def run_basic_game(keys=None, seed=0, frames=FRAMES):
+    game = RockPaperScissorsGame(stub_config())
+    clock = game.clock = FrameClock()
+    sink = ScriptedSink(keys or scripted_keys(frames))
+    random.seed(seed)
+    quietly(game.run_game, sink, SyntheticCapture(synthetic_frames(), frames + 30, clock))
+    return game, sink
+
+
+def run_enhanced_game(keys=None, seed=0, frames=FRAMES):
+    game = EnhancedRockPaperScissorsGame(seed=seed, config=stub_config())
+    clock = game.clock = FrameClock()
+    sink = ScriptedSink(keys or scripted_keys(frames))
+    log = EventLog()
+    game.events.subscribe(log, (RoundCommitted, Reset))
+    metrics = GameMetrics()
+    quietly(game.run_game, sink, capture=SyntheticCapture(synthetic_frames(), frames + 30, clock), metrics=metrics)
+    return game, sink, log.events, metrics
+
+
+class ScriptedReload:
+    """ConfigWatcher stand-in that hands over new settings on one poll"""
+
+    def __init__(self, frame, values):
+        self.frame = frame
+        self.values = values
+        self.polls = 0
+
+    def poll(self, now):
+        self.polls += 1
+        return GameConfig(self.values) if self.polls == self.frame else None
+
+
+def record_session(path, game, keys=None, frames=FRAMES * 3, watcher=None):
+    """Play a game with a session recorder attached; returns the rounds it recorded"""
+    clock = game.clock = FrameClock()
+    recorder = SessionRecorder(path, game)
+    quietly(game.run_game, ScriptedSink(keys or scripted_keys(frames)), recorder,
+            capture=SyntheticCapture(synthetic_frames(), frames + 30, clock), watcher=watcher)
+    return recorder.rounds
+
+
+def run_gesture_tester(frames=FRAMES):
+    tester = GestureTester(stub_config())
+    sink = ScriptedSink(scripted_keys(frames))
+    metrics = GameMetrics()
+    quietly(tester.run_test, sink, metrics, capture=SyntheticCapture(synthetic_frames(), frames + 30))
+    return tester, sink, metrics
+
+
+class GameLogicTest(unittest.TestCase):
+    """Rules and gesture classification agree across every game"""
+
+    def test_winner_rules_agree(self):
+        games = [DemoGame(), RockPaperScissorsGame(stub_config()), EnhancedRockPaperScissorsGame(use_mediapipe=False)]
+        for player in GESTURES:
+            for computer in GESTURES:
+                expected = expected_winner(player, computer)
+                for game in games:
+                    self.assertEqual(game.determine_winner(player, computer), expected,
+                                     f"{type(game).__name__}: {player} vs {computer}")
+
+    def test_synthetic_hands_are_classified(self):
+        basic = RockPaperScissorsGame(stub_config())
+        enhanced = EnhancedRockPaperScissorsGame(use_mediapipe=False)
+        tester = GestureTester(stub_config())
+        rng = np.random.default_rng(3)
+        for gesture in GESTURES:
+            for _ in range(5):
+                hand = HandFrame(synthetic_hand(gesture, noise=0.004, rng=rng))
+                self.assertEqual(basic.get_gesture(hand), gesture)
+                self.assertEqual(enhanced.get_gesture(hand)[0], gesture)
+                self.assertEqual(tester.get_gesture(hand)[0], gesture)
+
+    def test_no_hand_is_no_gesture(self):
+        self.assertIsNone(RockPaperScissorsGame(stub_config()).get_gesture(None))
+        self.assertIsNone(EnhancedRockPaperScissorsGame(use_mediapipe=False).get_gesture(None)[0])
+        self.assertEqual(GestureTester(stub_config()).get_gesture(None), (None, 0, {}))
+
+
+class TournamentTest(unittest.TestCase):
+    """Vectorized brackets always produce a champion"""
+
+    def test_round_cap_decides_by_score(self):
+        tournament = Tournament(64, parse_rules("first-to:1000"), seed=5)
+        matches = tournament.play_matches(tournament.seed_round(np.arange(64, dtype=np.int32)), max_rounds=7)
+        self.assertTrue((matches["rounds"] == 7).all())
+        leader = np.where(matches["score_a"] >= matches["score_b"], matches["player_a"], matches["player_b"])
+        trailer = np.where(matches["score_a"] >= matches["score_b"], matches["player_b"], matches["player_a"])
+        level = matches["score_a"] == matches["score_b"]
+        self.assertTrue((matches["winner"][~level] == leader[~level]).all())
+        self.assertTrue(((matches["winner"] == leader) | (matches["winner"] == trailer)).all())
+
+    def test_capped_bracket_has_a_champion(self):
+        tournament = Tournament(37, parse_rules("first-to:1000"), seed=5)
+        tournament.play_matches = lambda matches, play=tournament.play_matches: play(matches, max_rounds=3)
+        self.assertIn(tournament.run(), range(37))
+
+
+class DemoTest(unittest.TestCase):
+    """demo.py driven by scripted input instead of a terminal"""
+
+    def test_scripted_session(self):
+        answers = iter(["1", "2", "3", "x", "2", "4"])
+        sleeps = []
+        demo = DemoGame()
+        random.seed(5)
+        quietly(demo.run_demo, lambda prompt: next(answers), sleeps.append)
+        self.assertEqual(demo.round_count, 4)
+        self.assertLessEqual(demo.player_score + demo.computer_score, 4)
+        self.assertEqual(sleeps, [1] * 12)  # A three second countdown per round, never actually slept
+
+    def test_closed_stdin_ends_the_demo(self):
+        prompts = []
+
+        def closed(prompt):
+            prompts.append(prompt)
+            # Fail instead of hanging if EOF were swallowed and the prompt repeated
+            raise EOFError if len(prompts) == 1 else KeyboardInterrupt
+
+        demo = DemoGame()
+        quietly(demo.run_demo, closed, lambda seconds: None)
+        self.assertEqual(len(prompts), 1)
+        self.assertEqual(demo.round_count, 0)
+
+
+class EntryPointTest(unittest.TestCase):
+    """Each frame loop runs headlessly, plays rounds and honours its keys"""
+
+    def assert_scores_match(self, game, rounds):
+        winners = [event.winner for event in rounds]
+        self.assertEqual(game.round_count, len(rounds))
+        self.assertEqual(game.player_score, winners.count("player"))
+        self.assertEqual(game.computer_score, winners.count("computer"))
+
+    def test_basic_game(self):
+        game, sink = run_basic_game()
+        self.assertEqual(sink.frame_count, FRAMES)
+        self.assertGreaterEqual(game.round_count, 3)
+        self.assertLessEqual(game.player_score + game.computer_score, game.round_count)
+
+    def test_basic_game_reset_key(self):
+        game, sink = run_basic_game({FRAMES // 2: "r", FRAMES: "rq"})
+        self.assertEqual(sink.frame_count, FRAMES)
+        self.assertEqual((game.round_count, game.player_score, game.computer_score), (0, 0, 0))
+
+    def test_enhanced_game_scores_follow_rounds(self):
+        game, sink, events, metrics = run_enhanced_game()
+        self.assertEqual(sink.frame_count, FRAMES)
+        self.assertGreaterEqual(game.round_count, 3)
+        self.assert_scores_match(game, events)
+        for event in events:
+            self.assertEqual(event.winner, expected_winner(event.player_gesture, event.computer_gesture))
+        self.assertEqual(metrics.rounds.count, game.round_count)
+        self.assertEqual(metrics.frames.count, FRAMES)
+
+    def test_enhanced_game_reset_key(self):
+        game, sink, events, metrics = run_enhanced_game(scripted_keys(r=FRAMES // 2))
+        resets = [i for i, event in enumerate(events) if isinstance(event, Reset)]
+        self.assertEqual(len(resets), 1)
+        self.assertGreater(resets[0], 0, "no round was played before the reset")
+        self.assert_scores_match(game, events[resets[0] + 1:])
+
+    def test_enhanced_game_is_reproducible(self):
+        first = run_enhanced_game(seed=42)[2]
+        second = run_enhanced_game(seed=42)[2]
+        self.assertEqual([event.to_dict() for event in first], [event.to_dict() for event in second])
+
+    def test_gesture_tester(self):
+        tester, sink, metrics = run_gesture_tester()
+        self.assertEqual(sink.frame_count, FRAMES)
+        self.assertEqual(metrics.inferences.count, FRAMES)
+        # The stub holds each pose for 60 of its frames and shows no hand in the first of every four holds
+        self.assertEqual(metrics.hands.count, sum(1 for frame in range(FRAMES) if frame // 60 % 4))
+
+    def test_config_hot_reload(self):
+        reloaded = {"backend": "stub:1", "gesture_cooldown": 4.0, "extension_tolerance": 0.05}
+        game = RockPaperScissorsGame(stub_config())
+        game.clock = clock = FrameClock()
+        quietly(game.run_game, ScriptedSink(scripted_keys()), SyntheticCapture(synthetic_frames(), FRAMES + 30, clock),
+                ScriptedReload(FRAMES // 2, reloaded))
+        self.assertEqual(game.gesture_cooldown, 4.0)
+        tester = GestureTester(stub_config())
+        quietly(tester.run_test, ScriptedSink(scripted_keys()),
+                capture=SyntheticCapture(synthetic_frames(), FRAMES + 30), watcher=ScriptedReload(FRAMES // 2, reloaded))
+        self.assertEqual(tester.config.extension_tolerance, 0.05)
+        self.assertEqual(tester.pose_backend.frames, FRAMES - FRAMES // 2, "the backend was not rebuilt")
+
+    def test_camera_and_sink_released_on_failure(self):
+        entry_points = {
+            "basic": lambda sink, capture: RockPaperScissorsGame(stub_config()).run_game(sink, capture),
+            "enhanced": lambda sink, capture: EnhancedRockPaperScissorsGame(
+                config=stub_config()).run_game(sink, capture=capture),
+            "tester": lambda sink, capture: GestureTester(stub_config()).run_test(sink, capture=capture)
+        }
+        for name, run in entry_points.items():
+            with self.subTest(name, failure="camera not opened"):
+                sink = ScriptedSink({})
+                quietly(run, sink, SyntheticCapture(synthetic_frames(), 0, opened=False))
+                self.assertTrue(sink.closed)
+            with self.subTest(name, failure="camera error"):
+                sink = ScriptedSink({})
+                capture = BrokenCapture(synthetic_frames(), FRAMES)
+                with self.assertRaises(RuntimeError):
+                    quietly(run, sink, capture)
+                self.assertTrue(sink.closed)
+                self.assertFalse(capture.opened)
+
+    def test_enhanced_game_cleanup_on_failure(self):
+        for failure, capture in (("camera not opened", SyntheticCapture(synthetic_frames(), 0, opened=False)),
+                                 ("camera error", BrokenCapture(synthetic_frames(), FRAMES))):
+            with self.subTest(failure):
+                game = EnhancedRockPaperScissorsGame(config=stub_config())
+                game.events.subscribe(EventLog())
+                with contextlib.suppress(RuntimeError):
+                    quietly(game.run_game, ScriptedSink({}), capture=capture)
+                self.assertEqual(game.events.subscriptions, [])
+                self.assertFalse([thread for thread in threading.enumerate() if thread.name.startswith("events-")])
+                self.assertIsNone(game.pose_backend)
+
+
+class SessionReplayTest(unittest.TestCase):
+    """Recorded sessions replay to the same rounds with everything that shaped them"""
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "session.npz")
+
+    def assert_replays(self, game, keys=None, watcher=None):
+        rounds = record_session(self.path, game, keys, watcher=watcher)
+        self.assertGreaterEqual(len(rounds), 3)
+        self.assertTrue(quietly(verify_session, self.path))
+
+    def test_settings_and_hot_reload(self):
+        values = {"backend": "stub", "gesture_cooldown": 6.0}
+        self.assert_replays(EnhancedRockPaperScissorsGame(seed=3, config=GameConfig(values)),
+                            watcher=ScriptedReload(FRAMES, dict(values, gesture_cooldown=1.0)))
+
+    def test_match_rules(self):
+        for spec in ("first-to:1", "timed:3,best-of:3"):
+            with self.subTest(spec):
+                game = EnhancedRockPaperScissorsGame(seed=5, config=stub_config())
+                game.target_rules = game.match_rules = parse_rules(spec)
+                # A won match waits for 'r', so start new ones along the way
+                self.assert_replays(game, {FRAMES: "r", FRAMES * 2: "r", FRAMES * 3: "q"})
+
+    def test_early_commit_predictor(self):
+        game = EnhancedRockPaperScissorsGame(seed=7, config=stub_config())
+        game.pose_backend = ThrowBackend()
+        game.predictor = GesturePredictor()
+        self.assert_replays(game)
+
+
+class FrameBudgetTest(unittest.TestCase):
+    """Per-frame latency and throughput of each frame loop stay within budget"""
+
+    def assert_within_budget(self, name, sink):
+        times = sink.frame_times()
+        p95 = float(np.percentile(times, 95))
+        fps = len(times) / times.sum()
+        print(f"\n⏱️  {name}: p50 {np.median(times) * 1000:.2f} ms, p95 {p95 * 1000:.2f} ms, {fps:.0f} frames/s")
+        self.assertLessEqual(p95, FRAME_P95_BUDGET,
+                             f"{name} p95 frame time {p95 * 1000:.2f} ms over {FRAME_P95_BUDGET * 1000:.1f} ms")
+        self.assertGreaterEqual(fps, MIN_FPS, f"{name} ran at {fps:.0f} frames/s, below {MIN_FPS:.0f}")
+
+    def test_basic_game_budget(self):
+        self.assert_within_budget("rock_paper_scissors_game", run_basic_game()[1])
+
+    def test_enhanced_game_budget(self):
+        self.assert_within_budget("enhanced_game", run_enhanced_game()[1])
+
+    def test_gesture_tester_budget(self):
+        self.assert_within_budget("test_gestures", run_gesture_tester()[1])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,122 @@
+"""
+Text rendering cache for Rock Paper Scissors Game
+Rasterizes each label once into an anti-aliased alpha mask and stamps it
+with a vectorized alpha-blend instead of calling cv2.putText every frame
+"""
+
+from collections import OrderedDict
+
+import cv2
+import numpy as np
+
+
+class TextStamp:
+    """Pre-blended text sprite: premultiplied color plus remaining background weight (None when opaque)"""
+    __slots__ = ("color", "keep", "offset_x", "offset_y", "nbytes")
+
+    def __init__(self, color, keep, offset_x, offset_y):
+        self.color = color
+        self.keep = keep
+        self.offset_x = offset_x
+        self.offset_y = offset_y
+        self.nbytes = color.nbytes + (keep.nbytes if keep is not None else 0)
+
+
+class TextRenderer:
+    """LRU cache of rasterized text, drop-in replacement for cv2.putText"""
+
+    def __init__(self, max_entries=512, max_bytes=16 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.stamps = OrderedDict()
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def rasterize(self, text, font, scale, color, thickness):
+        """Render text once into a tight anti-aliased sprite"""
+        (text_width, text_height), baseline = cv2.getTextSize(text, font, scale, thickness)
+        pad = thickness + 1
+        alpha = np.zeros((text_height + baseline + 2 * pad, text_width + 2 * pad), dtype=np.uint8)
+        cv2.putText(alpha, text, (pad, pad + text_height), font, scale, 255, thickness, cv2.LINE_AA)
+
+        # Crop to the painted pixels so stamping touches as little as possible
+        rows = np.flatnonzero(alpha.any(axis=1))
+        cols = np.flatnonzero(alpha.any(axis=0))
+        if rows.size == 0:
+            return None
+        alpha = cv2.merge([alpha[rows[0]:rows[-1] + 1, cols[0]:cols[-1] + 1]] * 3)
+
+        # Premultiply the color so stamping is one multiply and one add
+        solid = np.empty_like(alpha)
+        solid[:] = color[:3]
+        premultiplied = cv2.multiply(alpha, solid, scale=1 / 255)
+        return TextStamp(premultiplied, 255 - alpha, cols[0] - pad, rows[0] - pad - text_height)
+
+    def get_stamp(self, text, font, scale, color, thickness):
+        """Fetch a sprite from the cache, rasterizing it on a miss"""
+        key = (text, font, scale, color if type(color) is tuple else tuple(color), thickness)
+        try:
+            stamp = self.stamps[key]
+        except KeyError:
+            pass
+        else:
+            self.stamps.move_to_end(key)
+            self.hits += 1
+            return stamp
+
+        self.misses += 1
+        stamp = self.rasterize(text, font, scale, color, thickness)
+        self.stamps[key] = stamp
+        self.total_bytes += stamp.nbytes if stamp else 0
+
+        # Evict least recently used sprites past either bound
+        while len(self.stamps) > self.max_entries or self.total_bytes > self.max_bytes:
+            _, evicted = self.stamps.popitem(last=False)
+            self.total_bytes -= evicted.nbytes if evicted else 0
+        return stamp
+
+    def put_text(self, frame, text, org, font, scale, color, thickness=1):
+        """Same arguments as cv2.putText, blended from the cache"""
+        stamp = self.get_stamp(text, font, scale, color, thickness)
+        if stamp is not None:
+            blit_stamp(frame, stamp, org[0], org[1])
+        return frame
+
+    def clear(self):
+        """Drop all cached sprites"""
+        self.stamps.clear()
+        self.total_bytes = 0
+
+
+def blit_stamp(frame, stamp, x, y):
+    """Blend a sprite onto the frame with its offset taken from (x, y), clipped to the frame"""
+    height, width = frame.shape[:2]
+    stamp_height, stamp_width = stamp.color.shape[:2]
+    x = int(x) + stamp.offset_x
+    y = int(y) + stamp.offset_y
+
+    # Clip the sprite against the frame
+    x0, y0 = max(x, 0), max(y, 0)
+    x1, y1 = min(x + stamp_width, width), min(y + stamp_height, height)
+    if x0 >= x1 or y0 >= y1:
+        return
+    sx, sy = x0 - x, y0 - y
+    sprite = (slice(sy, sy + y1 - y0), slice(sx, sx + x1 - x0))
+
+    # roi = roi * (1 - alpha) + color * alpha, in place
+    roi = frame[y0:y1, x0:x1]
+    if stamp.keep is None:
+        roi[:] = stamp.color[sprite]
+        return
+    cv2.multiply(roi, stamp.keep[sprite], roi, scale=1 / 255)
+    cv2.add(roi, stamp.color[sprite], roi)
+
+
+# One cache shared by every UI in the project
+shared_text_renderer = TextRenderer()
+
+
+def put_text(frame, text, org, font, scale, color, thickness=1):
+    """Draw text through the shared cache"""
+    return shared_text_renderer.put_text(frame, text, org, font, scale, color, thickness)